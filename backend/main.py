@@ -1 +0,0 @@
-from server import app
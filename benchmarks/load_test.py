@@ -0,0 +1,414 @@
+"""
+Project P Innovations - Load Test
+Drive the API hot paths at a fixed concurrency and report throughput and
+latency percentiles, optionally compared against a stored baseline
+
+By default the app runs in-process (httpx ASGITransport) against a
+mongomock-motor stand-in with email delivery stubbed out, so no MongoDB or
+network access is needed. Pass --url to load an already running server
+instead (start it with APP_ENV=load_test, or /api/apply returns 429s).
+
+Usage:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --concurrency 50 --requests 2000
+    python benchmarks/load_test.py --mongo-url mongodb://localhost:27017
+    python benchmarks/load_test.py --url http://localhost:8000
+    python benchmarks/load_test.py --baseline benchmarks/baseline/load_test.json
+    python benchmarks/load_test.py --save-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline" / "load_test.json"
+
+DEFAULT_SCENARIOS = [
+    "jobs_list", "job_detail", "apply_10kb", "apply_500kb", "apply_4mb",
+    "admin_login", "admin_applications", "admin_summary", "admin_jobs"
+]
+
+# Resume sizes for the apply_* scenarios (the server accepts up to 5MB)
+APPLY_SIZES = {"apply_10kb": 10 * 1024, "apply_500kb": 500 * 1024, "apply_4mb": 4 * 1024 * 1024}
+
+# Login is bcrypt-bound, so it gets fewer requests than the other scenarios
+LOGIN_REQUEST_SHARE = 0.1
+
+
+# ============================================================================
+# TARGET SETUP
+# ============================================================================
+
+def use_mongo_stand_in(database):
+    """Point the database module at an in-memory mongomock-motor client"""
+    import mongomock.collection
+    import mongomock_motor
+
+    # mongomock returns a synchronous database from with_options; the
+    # catalog read profile only matters against a replica set anyway
+    mongomock_motor.AsyncMongoMockDatabase.with_options = lambda self, **kwargs: self
+
+    # pymongo 4.9+ passes sort= to bulk updates, which mongomock predates
+    for name in ("add_update", "add_replace"):
+        original = getattr(mongomock.collection.BulkOperationBuilder, name)
+
+        def without_sort(self, *args, _original=original, **kwargs):
+            kwargs.pop("sort", None)
+            return _original(self, *args, **kwargs)
+
+        setattr(mongomock.collection.BulkOperationBuilder, name, without_sort)
+
+    mongo_client = mongomock_motor.AsyncMongoMockClient()
+    database.create_mongo_client = lambda: mongo_client
+
+    async def no_warm_up():
+        pass
+
+    database.warm_up_pool = no_warm_up
+
+
+def stub_email_delivery(latency_ms: float):
+    """Replace the Resend call with a fixed-latency stand-in"""
+
+    def send(params):
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        return {"id": "load-test"}
+
+    from projectp.services.email import resend_client
+
+    resend_client().Emails.send = send
+
+
+async def prepare_dataset(jobs: int, applications: int, random_seed: int):
+    """Load a synthetic dataset and refresh the caches that depend on it"""
+    from projectp import database
+    from projectp.seeding import seed_synthetic
+    from projectp.services.catalog import load_job_catalog
+    from projectp.services.counters import rebuild_counters
+
+    await seed_synthetic(database.db, jobs, applications, random_seed)
+    await rebuild_counters(force=True)
+    await load_job_catalog()
+
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+
+def make_resume(size: int, sequence: int) -> bytes:
+    """Minimal PDF of about ``size`` bytes, unique per sequence number"""
+    header = f"%PDF-1.4\n% load test resume {sequence}\n".encode("ascii")
+    text = b"BT (Python FastAPI MongoDB engineer) Tj ET\n"
+    body = text * max(1, (size - len(header)) // len(text))
+    return header + body + b"%%EOF\n"
+
+
+class Scenarios:
+    """Request builders for each scenario, sharing IDs and an admin token"""
+
+    def __init__(self, client: httpx.AsyncClient, admin_email: str, admin_password: str):
+        self.client = client
+        self.admin_email = admin_email
+        self.admin_password = admin_password
+        self.job_ids: List[str] = []
+        self.job_slugs: List[str] = []
+        self.headers: Dict[str, str] = {}
+        self.sequence = 0
+        self.run_id = f"{int(time.time())}{random.randint(0, 9999):04d}"
+
+    async def setup(self):
+        jobs = (await self.client.get("/api/jobs", params={"limit": 1000})).json()
+        self.job_ids = [job["id"] for job in jobs]
+        self.job_slugs = [job["slug"] for job in jobs]
+        response = await self.login()
+        response.raise_for_status()
+        self.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    def login(self) -> Awaitable[httpx.Response]:
+        return self.client.post(
+            "/api/admin/login",
+            json={"email": self.admin_email, "password": self.admin_password}
+        )
+
+    def get(self, name: str) -> Callable[[], Awaitable[httpx.Response]]:
+        if name in APPLY_SIZES:
+            return lambda: self.apply(APPLY_SIZES[name])
+        return {
+            "jobs_list": lambda: self.client.get("/api/jobs"),
+            "job_detail": self.job_detail,
+            "admin_login": self.login,
+            "admin_applications": lambda: self.client.get("/api/admin/applications", headers=self.headers),
+            "admin_summary": lambda: self.client.get("/api/admin/summary", headers=self.headers),
+            "admin_jobs": lambda: self.client.get("/api/admin/jobs", headers=self.headers)
+        }[name]
+
+    def job_detail(self) -> Awaitable[httpx.Response]:
+        # Alternate between ID and slug lookups
+        key = random.choice(self.job_ids if random.random() < 0.5 else self.job_slugs)
+        return self.client.get(f"/api/jobs/{key}")
+
+    def apply(self, size: int) -> Awaitable[httpx.Response]:
+        self.sequence += 1
+        sequence = self.sequence
+        return self.client.post(
+            "/api/apply",
+            data={
+                "name": "Load Test",
+                "email": f"load-{self.run_id}-{sequence}@example.com",
+                "message": "Submitted by the load test",
+                "job_id": random.choice(self.job_ids)
+            },
+            files={"resume": ("resume.pdf", make_resume(size, sequence), "application/pdf")}
+        )
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(
+    request: Callable[[], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int,
+    warmup: int
+) -> dict:
+    """
+    Send ``total`` requests from ``concurrency`` concurrent workers
+
+    Args:
+        request: Callable issuing one request
+        total: Number of measured requests
+        concurrency: Number of in-flight requests
+        warmup: Unmeasured requests sent first
+
+    Returns:
+        Throughput, latency percentiles (ms) and status code counts
+    """
+    for _ in range(warmup):
+        await request()
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await request()
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if not status.startswith(("2", "3")))
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": dict(statuses),
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Compare scenario results against a baseline report
+
+    Args:
+        report: Current report
+        baseline: Baseline report
+        threshold: Allowed relative regression, e.g. 0.2 for 20%
+
+    Returns:
+        Descriptions of regressions beyond the threshold
+    """
+    regressions = []
+    print(f"\n{'scenario':<20}{'p95 ms':>12}{'base':>10}{'Δ':>9}{'rps':>12}{'base':>10}{'Δ':>9}")
+    for name, current in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        p95_change = current["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        rps_change = current["throughput_rps"] / base["throughput_rps"] - 1 if base["throughput_rps"] else 0.0
+        print(
+            f"{name:<20}{current['p95_ms']:>12.2f}{base['p95_ms']:>10.2f}{p95_change:>+9.1%}"
+            f"{current['throughput_rps']:>12.1f}{base['throughput_rps']:>10.1f}{rps_change:>+9.1%}"
+        )
+        if p95_change > threshold:
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {current['p95_ms']}ms ({p95_change:+.1%})")
+        if rps_change < -threshold:
+            regressions.append(
+                f"{name}: throughput {base['throughput_rps']} -> {current['throughput_rps']} rps ({rps_change:+.1%})"
+            )
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the Project P Innovations API")
+    parser.add_argument("--url", help="Load a running server instead of the in-process app")
+    parser.add_argument("--mongo-url", help="In-process app against this MongoDB instead of the stand-in")
+    parser.add_argument("--scenarios", default=",".join(DEFAULT_SCENARIOS), help="Comma-separated scenario names")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent requests per scenario")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per scenario")
+    parser.add_argument("--jobs", type=int, default=50, help="Synthetic jobs to load (in-process only)")
+    parser.add_argument("--applications", type=int, default=1000, help="Synthetic applications (in-process only)")
+    parser.add_argument("--random-seed", type=int, default=42, help="Seed for the synthetic dataset")
+    parser.add_argument("--email-latency-ms", type=float, default=0.0, help="Stubbed email provider latency")
+    parser.add_argument("--admin-email", default="admin@projectpinnovations.com")
+    parser.add_argument("--admin-password", default=os.environ.get("SEED_ADMIN_PASSWORD", "ChangeMe123!"))
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "load_test.json", help="Report file")
+    parser.add_argument("--baseline", type=Path, help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Also write the report to {BASELINE_FILE}")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed regression vs baseline (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+async def run_load_test(args: argparse.Namespace) -> dict:
+    """Set up the target, run every scenario and build the report"""
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(DEFAULT_SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": args.url or ("in-process+mongodb" if args.mongo_url else "in-process+mongomock"),
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "scenarios": {}
+    }
+
+    async def run_all(client: httpx.AsyncClient):
+        scenarios = Scenarios(client, args.admin_email, args.admin_password)
+        await scenarios.setup()
+        for name in names:
+            total = args.requests
+            if name == "admin_login":
+                total = max(1, int(total * LOGIN_REQUEST_SHARE))
+            result = await run_scenario(scenarios.get(name), total, args.concurrency, args.warmup)
+            report["scenarios"][name] = result
+            print(
+                f"{name:<20} {result['throughput_rps']:>9.1f} rps  p50 {result['p50_ms']:>8.2f}ms  "
+                f"p95 {result['p95_ms']:>8.2f}ms  p99 {result['p99_ms']:>8.2f}ms  errors {result['errors']}",
+                flush=True
+            )
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+            await run_all(client)
+        return report
+
+    # The in-process app is configured through the environment before import
+    sys.path.insert(0, str(ROOT_DIR))
+    os.environ.setdefault("APP_ENV", "load_test")
+    if args.mongo_url:
+        os.environ["MONGO_URL"] = args.mongo_url
+
+    from projectp import database, settings
+    from projectp.main import create_app
+    from projectp.services import background
+
+    settings.UPLOAD_DIR = Path(tempfile.mkdtemp(prefix="projectp-load-"))
+    settings.QUARANTINE_DIR = Path(tempfile.mkdtemp(prefix="projectp-load-quarantine-"))
+    settings.PREVIEW_CACHE_DIR = Path(tempfile.mkdtemp(prefix="projectp-load-previews-"))
+    if not args.mongo_url:
+        use_mongo_stand_in(database)
+    stub_email_delivery(args.email_latency_ms)
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        # Wait for background seeding so it doesn't skew the first scenario
+        await background.drain()
+        await prepare_dataset(args.jobs, args.applications, args.random_seed)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=60) as client:
+            await run_all(client)
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run_load_test(args))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n📄 Report written to {args.output}")
+
+    if args.save_baseline:
+        BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"📌 Baseline saved to {BASELINE_FILE}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print("\n❌ Regressions beyond threshold:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\n✅ No regressions beyond threshold")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Project P Innovations - Microbenchmarks
+Pinned-iteration timings for hot-path helper functions, compared against a
+stored baseline with per-benchmark regression thresholds
+
+Register new helpers with the @benchmark decorator: the decorated function
+does any setup and returns the zero-argument callable to time.
+
+Usage:
+    python benchmarks/microbench.py
+    python benchmarks/microbench.py --filter jwt
+    python benchmarks/microbench.py --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_FILE = Path(__file__).resolve().parent / "results" / "microbench.json"
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline" / "microbench.json"
+
+# Timed runs per benchmark; the fastest run is compared against the baseline
+REPEAT = 7
+
+# Allowed slowdown vs baseline unless a benchmark sets its own
+DEFAULT_THRESHOLD = 0.25
+
+# name -> {"factory": ..., "iterations": ..., "threshold": ...}
+BENCHMARKS: Dict[str, dict] = {}
+
+
+def benchmark(name: str, iterations: int, threshold: float = DEFAULT_THRESHOLD):
+    """
+    Register a benchmark
+
+    Args:
+        name: Unique benchmark name
+        iterations: Calls per timed run (pinned so results stay comparable)
+        threshold: Allowed relative slowdown vs baseline, e.g. 0.25 for 25%
+    """
+    def register(factory: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = {"factory": factory, "iterations": iterations, "threshold": threshold}
+        return factory
+    return register
+
+
+# The helpers need no database connection
+sys.path.insert(0, str(ROOT_DIR))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+@benchmark("slugify", iterations=20_000)
+def bench_slugify():
+    from projectp.services.catalog import slugify
+    return lambda: slugify("Senior AI / ML Engineer (Remote, London) — 2025")
+
+
+def use_signing_key():
+    """Put one in-memory key in the ring for the configured JWT_ALGORITHM"""
+    from projectp import settings
+    from projectp.services import signing_keys
+    if signing_keys.asymmetric() and not signing_keys.key_ring:
+        signing_keys.key_ring[:] = [
+            signing_keys.generate_key(settings.JWT_ALGORITHM, datetime.now(timezone.utc))
+        ]
+
+
+@benchmark("create_access_token", iterations=5_000)
+def bench_create_access_token():
+    from projectp.services.auth import create_access_token
+    use_signing_key()
+    return lambda: create_access_token("admin@projectpinnovations.com", "benchmark-session")
+
+
+@benchmark("verify_jwt_token", iterations=5_000)
+def bench_verify_jwt_token():
+    from projectp.services.auth import create_access_token, verify_jwt_token
+    use_signing_key()
+    token = create_access_token("admin@projectpinnovations.com", "benchmark-session")
+    return lambda: verify_jwt_token(token)
+
+
+@benchmark("check_rate_limit", iterations=10_000)
+def bench_check_rate_limit():
+    # 2000 client IPs with five requests each, all under the limit
+    from projectp.services import rate_limit
+    ips = [f"10.0.{i // 256}.{i % 256}" for i in range(2000)]
+    state = {"n": 0}
+
+    def call():
+        n = state["n"]
+        if n % (len(ips) * 5) == 0:
+            rate_limit.rate_limit_store.clear()
+        state["n"] = n + 1
+        rate_limit.check_rate_limit(ips[n % len(ips)], limit=10, window=3600)
+
+    return call
+
+
+@benchmark("check_rate_limit_rejected", iterations=10_000)
+def bench_check_rate_limit_rejected():
+    # One client already at the limit
+    from fastapi import HTTPException
+    from projectp.services import rate_limit
+    rate_limit.rate_limit_store.clear()
+    for _ in range(10):
+        rate_limit.check_rate_limit("10.1.0.1", limit=10, window=3600)
+
+    def call():
+        try:
+            rate_limit.check_rate_limit("10.1.0.1", limit=10, window=3600)
+        except HTTPException:
+            pass
+
+    return call
+
+
+@benchmark("application_email_html", iterations=20_000)
+def bench_application_email_html():
+    from projectp.services.email import application_email_html
+    message = "I have five years of experience building ML platforms. " * 10
+    return lambda: application_email_html(
+        "Jane Candidate", "jane@example.com", "Senior AI Engineer", message, "jane-resume.pdf"
+    )
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run_benchmark(name: str) -> dict:
+    """
+    Time one benchmark over REPEAT runs of its pinned iteration count
+
+    Returns:
+        Fastest and median time per call in nanoseconds
+    """
+    spec = BENCHMARKS[name]
+    call = spec["factory"]()
+    iterations = spec["iterations"]
+
+    # Warm caches and lazy imports outside the timed runs
+    for _ in range(min(iterations, 100)):
+        call()
+
+    per_call = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(REPEAT):
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                call()
+            per_call.append((time.perf_counter_ns() - start) / iterations)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "iterations": iterations,
+        "repeat": REPEAT,
+        "best_ns": round(min(per_call), 1),
+        "median_ns": round(statistics.median(per_call), 1),
+        "threshold": spec["threshold"]
+    }
+
+
+def compare(results: Dict[str, dict], baseline: dict) -> List[str]:
+    """
+    Compare results against a baseline using each benchmark's threshold
+
+    Returns:
+        Descriptions of regressions beyond their threshold
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if not base:
+            continue
+        if base["iterations"] != result["iterations"]:
+            print(f"⚠️ {name}: iteration count changed ({base['iterations']} -> {result['iterations']}), skipped")
+            continue
+        change = result["best_ns"] / base["best_ns"] - 1
+        print(f"{name:<30}{result['best_ns']:>12.1f}{base['best_ns']:>12.1f}{change:>+9.1%}")
+        if change > result["threshold"]:
+            regressions.append(
+                f"{name}: {base['best_ns']}ns -> {result['best_ns']}ns "
+                f"({change:+.1%}, threshold {result['threshold']:.0%})"
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Project P Innovations microbenchmarks")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE, help="Results file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    names = [name for name in BENCHMARKS if args.filter in name]
+
+    results = {}
+    for name in names:
+        results[name] = run_benchmark(name)
+        print(f"{name:<30}{results[name]['best_ns']:>12.1f} ns/call  (median {results[name]['median_ns']:.1f})")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n📄 Results written to {args.output}")
+
+    if args.save_baseline:
+        BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"📌 Baseline saved to {BASELINE_FILE}")
+        return 0
+
+    if not args.baseline.exists():
+        print("ℹ️ No baseline found; run with --save-baseline to create one")
+        return 0
+
+    print(f"\n{'benchmark':<30}{'best ns':>12}{'base':>12}{'Δ':>9}")
+    regressions = compare(results, json.loads(args.baseline.read_text()))
+    if regressions:
+        print("\n❌ Regressions beyond threshold:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("\n✅ No regressions beyond threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import { Navigate } from "react-router-dom";
+import { clearSession } from "@/lib/auth";
 
 export default function ProtectedRoute({ children }) {
   const token = localStorage.getItem("admin_token");
@@ -7,17 +8,16 @@ export default function ProtectedRoute({ children }) {
     return <Navigate to="/admin/login" replace />;
   }
 
-  // Check token expiration
+  // Check token expiration (an expired access token is refreshed on the
+  // first API call while the refresh token is still valid)
   try {
     const payload = JSON.parse(atob(token.split(".")[1]));
-    if (payload.exp * 1000 < Date.now()) {
-      localStorage.removeItem("admin_token");
-      localStorage.removeItem("admin_email");
+    if (payload.exp * 1000 < Date.now() && !localStorage.getItem("admin_refresh_token")) {
+      clearSession();
       return <Navigate to="/admin/login" replace />;
     }
   } catch {
-    localStorage.removeItem("admin_token");
-    localStorage.removeItem("admin_email");
+    clearSession();
     return <Navigate to="/admin/login" replace />;
   }
 
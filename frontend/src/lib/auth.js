@@ -0,0 +1,97 @@
+import axios from "axios";
+
+export const API = `${process.env.REACT_APP_BACKEND_URL || process.env.REACT_APP_API_URL || ''}/api`;
+
+
+export function getAuthHeaders() {
+  const token = localStorage.getItem("admin_token");
+  return { Authorization: `Bearer ${token}` };
+}
+
+
+export function saveSession(data, fallbackEmail) {
+  localStorage.setItem("admin_token", data.token);
+  localStorage.setItem("admin_refresh_token", data.refresh_token);
+  localStorage.setItem("admin_email", data.admin?.email || fallbackEmail || "");
+}
+
+
+export function clearSession() {
+  localStorage.removeItem("admin_token");
+  localStorage.removeItem("admin_refresh_token");
+  localStorage.removeItem("admin_email");
+}
+
+
+// Refresh tokens work once and every tab shares one through localStorage,
+// so refreshes take a cross-tab lock (Web Locks, where available) and
+// concurrent 401s in a tab share a single refresh. A tab that waited on
+// the lock finds a new access token already stored and uses it.
+let refreshing = null;
+
+export function refreshSession(failedToken) {
+  if (!refreshing) {
+    const refresh = async () => {
+      const stored = localStorage.getItem("admin_token");
+      if (failedToken && stored && stored !== failedToken) return stored;
+      const res = await axios.post(`${API}/admin/refresh`, {
+        refresh_token: localStorage.getItem("admin_refresh_token"),
+      });
+      saveSession(res.data);
+      return res.data.token;
+    };
+    const locked = navigator.locks
+      ? navigator.locks.request("admin-session-refresh", refresh)
+      : refresh();
+    refreshing = locked
+      .catch((err) => {
+        clearSession();
+        throw err;
+      })
+      .finally(() => {
+        refreshing = null;
+      });
+  }
+  return refreshing;
+}
+
+
+export async function logout() {
+  const refreshToken = localStorage.getItem("admin_refresh_token");
+  clearSession();
+  if (refreshToken) {
+    try {
+      await axios.post(`${API}/admin/logout`, { refresh_token: refreshToken });
+    } catch {
+      // The session expires on its own
+    }
+  }
+}
+
+
+// Access tokens are short-lived: on a 401 from an admin route, refresh
+// once and replay the request before giving up
+axios.interceptors.response.use(null, async (error) => {
+  const { config, response } = error;
+  const url = config?.url || "";
+  const retryable =
+    response?.status === 401 &&
+    !config._retried &&
+    url.includes("/admin/") &&
+    !url.includes("/admin/login") &&
+    !url.includes("/admin/refresh") &&
+    !url.includes("/admin/logout") &&
+    localStorage.getItem("admin_refresh_token");
+
+  if (!retryable) return Promise.reject(error);
+
+  config._retried = true;
+  try {
+    const failedToken = (config.headers.Authorization || "").replace("Bearer ", "");
+    const token = await refreshSession(failedToken);
+    config.headers.Authorization = `Bearer ${token}`;
+    return axios(config);
+  } catch {
+    return Promise.reject(error);
+  }
+});
@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useRef } from "react";
 import { useNavigate, useLocation, Link } from "react-router-dom";
 import { motion, AnimatePresence } from "framer-motion";
 import axios from "axios";
@@ -17,16 +17,11 @@ import {
   LayoutDashboard,
   FileText,
   ChevronRight,
+  Eye,
 } from "lucide-react";
 
 
-const API = `${process.env.REACT_APP_BACKEND_URL || process.env.REACT_APP_API_URL || ''}/api`;
-
-
-function getAuthHeaders() {
-  const token = localStorage.getItem("admin_token");
-  return { Authorization: `Bearer ${token}` };
-}
+import { API, clearSession, getAuthHeaders, logout, refreshSession } from "@/lib/auth";
 
 
 // ============ JOB FORM MODAL ============
@@ -216,9 +211,8 @@ function AdminSidebar({ activeSection, onNavigate }) {
   const adminEmail = localStorage.getItem("admin_email") || "Admin";
 
 
-  const handleLogout = () => {
-    localStorage.removeItem("admin_token");
-    localStorage.removeItem("admin_email");
+  const handleLogout = async () => {
+    await logout();
     navigate("/admin/login");
   };
 
@@ -288,11 +282,12 @@ function AdminSidebar({ activeSection, onNavigate }) {
 
 
 // ============ DASHBOARD OVERVIEW ============
-function DashboardOverview({ jobs, applications, emailLogs }) {
+function DashboardOverview({ summary }) {
+  const applications = summary?.recent_applications || [];
   const stats = [
-    { label: "Total Jobs", value: jobs.length, icon: Briefcase, color: "#FF7A2A" },
-    { label: "Applications", value: applications.length, icon: Users, color: "#3B82F6" },
-    { label: "Emails Sent", value: emailLogs.length, icon: Mail, color: "#10B981" },
+    { label: "Total Jobs", value: summary?.total_jobs ?? 0, icon: Briefcase, color: "#FF7A2A" },
+    { label: "Applications", value: summary?.total_applications ?? 0, icon: Users, color: "#3B82F6" },
+    { label: "Emails Sent", value: summary?.emails.sent ?? 0, icon: Mail, color: "#10B981" },
   ];
 
 
@@ -445,37 +440,100 @@ function JobsTable({ jobs, onEdit, onDelete, onAdd }) {
 }
 
 
+// ============ RESUME PREVIEW ============
+function ResumePreview({ app }) {
+  const [preview, setPreview] = useState(null);
+  const [imageUrl, setImageUrl] = useState(null);
+  const [error, setError] = useState(null);
+
+  useEffect(() => {
+    let objectUrl = null;
+    let cancelled = false;
+
+    const load = async () => {
+      try {
+        const res = await axios.get(`${API}/admin/applications/${app.id}/preview`, { headers: getAuthHeaders() });
+        if (cancelled) return;
+        setPreview(res.data);
+        if (res.data.has_image) {
+          // Fetched with the admin token, so it can't be a plain <img src>
+          const image = await axios.get(`${API}/admin/applications/${app.id}/preview.png`, {
+            headers: getAuthHeaders(),
+            responseType: "blob",
+          });
+          if (cancelled) return;
+          objectUrl = URL.createObjectURL(image.data);
+          setImageUrl(objectUrl);
+        }
+      } catch (err) {
+        if (cancelled) return;
+        setError(err.response?.status === 401
+          ? "Session expired. Please log in again."
+          : err.response?.data?.detail || "Failed to load preview.");
+      }
+    };
+    load();
+
+    return () => {
+      cancelled = true;
+      if (objectUrl) URL.revokeObjectURL(objectUrl);
+    };
+  }, [app.id]);
+
+  if (error) {
+    return <p className="text-xs text-[#9FB0C8]/60 mt-4">{error}</p>;
+  }
+  if (!preview) {
+    return (
+      <div className="flex items-center gap-2 text-xs text-[#9FB0C8]/60 mt-4">
+        <Loader2 size={12} className="animate-spin" />
+        Loading preview…
+      </div>
+    );
+  }
+  return (
+    <div data-testid={`resume-preview-${app.id}`} className="flex gap-4 mt-4">
+      {imageUrl && (
+        <img
+          src={imageUrl}
+          alt={`First page of ${app.name}'s resume`}
+          className="w-40 shrink-0 rounded-lg border border-white/10 bg-white"
+        />
+      )}
+      <p className="text-xs text-[#B9C7D6]/70 leading-relaxed">
+        {preview.snippet || "No text could be read from this resume."}
+      </p>
+    </div>
+  );
+}
+
+
 // ============ APPLICATIONS LIST ============
 function ApplicationsList({ applications }) {
-  const handleDownloadResume = (app) => {
-    // Validate token
-    const token = localStorage.getItem("admin_token");
-    if (!token) {
-      toast.error("Authentication token missing. Please log in again.");
-      return;
-    }
-    
+  const [previewing, setPreviewing] = useState(null);
+
+  const handleDownloadResume = async (app) => {
     // Validate resume path
     if (!app.resume_path) {
       toast.error("Resume file not available.");
       return;
     }
-    
-    // Encode resume path to handle special characters and spaces
-    const encodedPath = encodeURIComponent(app.resume_path);
-    const url = `${API}/admin/download-resume/${encodedPath}?token=${token}`;
-    
-    // Debug logging
-    console.log('🔍 Download Debug Info:');
-    console.log('  → API constant:', API);
-    console.log('  → Token exists:', !!token);
-    console.log('  → Token length:', token ? token.length : 0);
-    console.log('  → Resume path:', app.resume_path);
-    console.log('  → Encoded path:', encodedPath);
-    console.log('  → Full URL:', url);
-    
-    // Open download in new tab
-    window.open(url, "_blank");
+
+    try {
+      // Short-lived signed URL: the browser downloads it directly, without the admin token
+      const res = await axios.post(
+        `${API}/admin/applications/${app.id}/resume-link`,
+        null,
+        { headers: getAuthHeaders() }
+      );
+      window.location.assign(res.data.url);
+    } catch (err) {
+      if (err.response?.status === 401) {
+        toast.error("Session expired. Please log in again.");
+      } else {
+        toast.error(err.response?.data?.detail || "Failed to download resume.");
+      }
+    }
   };
 
   return (
@@ -500,16 +558,37 @@ function ApplicationsList({ applications }) {
                 )}
               </div>
               <div className="flex items-center gap-2 shrink-0 ml-4">
-                <button
-                  onClick={() => handleDownloadResume(app)}
-                  data-testid={`download-resume-${app.id}`}
-                  className="flex items-center gap-1.5 px-3 py-1.5 text-xs text-[#FF7A2A] bg-[#FF7A2A]/10 rounded-lg hover:bg-[#FF7A2A]/20 transition-colors duration-200"
-                >
-                  <Download size={12} />
-                  Resume
-                </button>
+                {app.scan_status && app.scan_status !== "clean" ? (
+                  <span
+                    data-testid={`resume-scan-${app.id}`}
+                    title={app.scan_status === "pending" ? "The resume is being scanned" : `Quarantined: ${app.scan_status}`}
+                    className="px-3 py-1.5 text-xs text-[#9FB0C8] bg-white/5 rounded-lg"
+                  >
+                    {app.scan_status === "pending" ? "Scanning…" : "Quarantined"}
+                  </span>
+                ) : (
+                  <>
+                    <button
+                      onClick={() => setPreviewing(previewing === app.id ? null : app.id)}
+                      data-testid={`preview-resume-${app.id}`}
+                      className="flex items-center gap-1.5 px-3 py-1.5 text-xs text-[#9FB0C8] bg-white/5 rounded-lg hover:bg-white/10 transition-colors duration-200"
+                    >
+                      <Eye size={12} />
+                      Preview
+                    </button>
+                    <button
+                      onClick={() => handleDownloadResume(app)}
+                      data-testid={`download-resume-${app.id}`}
+                      className="flex items-center gap-1.5 px-3 py-1.5 text-xs text-[#FF7A2A] bg-[#FF7A2A]/10 rounded-lg hover:bg-[#FF7A2A]/20 transition-colors duration-200"
+                    >
+                      <Download size={12} />
+                      Resume
+                    </button>
+                  </>
+                )}
               </div>
             </div>
+            {previewing === app.id && <ResumePreview app={app} />}
             <p className="text-[10px] text-[#9FB0C8]/40 mt-3">
               {new Date(app.created_at).toLocaleString()}
             </p>
@@ -563,36 +642,60 @@ function EmailLogsList({ emailLogs }) {
 export default function AdminDashboard() {
   const navigate = useNavigate();
   const [section, setSection] = useState("dashboard");
+  const sectionRef = useRef(section);
+  sectionRef.current = section;
   const [jobs, setJobs] = useState([]);
   const [applications, setApplications] = useState([]);
   const [emailLogs, setEmailLogs] = useState([]);
+  const [summary, setSummary] = useState(null);
   const [loading, setLoading] = useState(true);
   const [showJobModal, setShowJobModal] = useState(false);
   const [editingJob, setEditingJob] = useState(null);
 
 
+  const handleAuthError = useCallback((err) => {
+    if (err.response?.status === 401) {
+      toast.error("Session expired. Please log in again.");
+      clearSession();
+      navigate("/admin/login");
+    }
+  }, [navigate]);
+
+
+  // Overview counts come from the small summary endpoint; the full
+  // application and email log lists are only loaded for their sections.
   const fetchData = useCallback(async () => {
     try {
       const headers = getAuthHeaders();
-      const [jobsRes, appsRes, emailsRes] = await Promise.all([
-        axios.get(`${API}/jobs`),
-        axios.get(`${API}/admin/applications`, { headers }),
-        axios.get(`${API}/admin/email-logs`, { headers }),
+      const [jobsRes, summaryRes] = await Promise.all([
+        // Admin route reads the primary, so the admin's own edits show at once
+        axios.get(`${API}/admin/jobs`, { headers }),
+        axios.get(`${API}/admin/summary`, { headers }),
       ]);
       setJobs(jobsRes.data);
-      setApplications(appsRes.data);
-      setEmailLogs(emailsRes.data);
+      setSummary(summaryRes.data);
     } catch (err) {
-      if (err.response?.status === 401) {
-        toast.error("Session expired. Please log in again.");
-        localStorage.removeItem("admin_token");
-        localStorage.removeItem("admin_email");
-        navigate("/admin/login");
-      }
+      handleAuthError(err);
     } finally {
       setLoading(false);
     }
-  }, [navigate]);
+  }, [handleAuthError]);
+
+
+  const fetchSectionData = useCallback(async (name) => {
+    try {
+      const headers = getAuthHeaders();
+      if (name === "applications") {
+        const res = await axios.get(`${API}/admin/applications`, { headers });
+        setApplications(res.data);
+      } else if (name === "emails") {
+        const res = await axios.get(`${API}/admin/email-logs`, { headers });
+        setEmailLogs(res.data);
+      }
+    } catch (err) {
+      handleAuthError(err);
+    }
+  }, [handleAuthError]);
 
 
   useEffect(() => {
@@ -605,6 +708,89 @@ export default function AdminDashboard() {
   }, [navigate, fetchData]);
 
 
+  useEffect(() => {
+    fetchSectionData(section);
+  }, [section, fetchSectionData]);
+
+
+  // Live updates over server-sent events. fetch() is used instead of
+  // EventSource so the token can be sent in the Authorization header.
+  const handleEvent = useCallback((type, data) => {
+    if (type === "stream.reset") {
+      // Missed events can't be replayed (server restarted): reload instead
+      fetchData();
+      fetchSectionData(sectionRef.current);
+    } else if (type === "application.created") {
+      setApplications((prev) => [data, ...prev]);
+      setSummary((prev) => prev && {
+        ...prev,
+        total_applications: prev.total_applications + 1,
+        recent_applications: [data, ...prev.recent_applications].slice(0, 5),
+      });
+    } else if (type === "application.updated") {
+      // A duplicate resubmission merged into an existing application
+      setApplications((prev) => prev.map((app) => (app.id === data.id ? { ...app, ...data } : app)));
+    } else if (type.startsWith("job.")) {
+      fetchData();
+    } else if (type.startsWith("email.")) {
+      setEmailLogs((prev) => [data, ...prev]);
+      setSummary((prev) => prev && {
+        ...prev,
+        emails: { ...prev.emails, [data.status]: (prev.emails[data.status] || 0) + 1 },
+      });
+    }
+  }, [fetchData, fetchSectionData]);
+
+
+  useEffect(() => {
+    const controller = new AbortController();
+    let lastEventId = null;
+    let retryTimer = null;
+
+    const connect = async () => {
+      try {
+        const headers = getAuthHeaders();
+        if (lastEventId) headers["Last-Event-ID"] = lastEventId;
+        const res = await fetch(`${API}/admin/events`, { headers, signal: controller.signal });
+        if (res.status === 401 && localStorage.getItem("admin_refresh_token")) {
+          // Access token expired: refresh, then reconnect on the next attempt
+          await refreshSession(headers.Authorization.replace("Bearer ", ""));
+        }
+        if (!res.ok || !res.body) throw new Error(`Event stream failed: ${res.status}`);
+
+        const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buffer += value;
+          const frames = buffer.split("\n\n");
+          buffer = frames.pop();
+          for (const frame of frames) {
+            const fields = {};
+            for (const line of frame.split("\n")) {
+              const idx = line.indexOf(": ");
+              if (idx > 0) fields[line.slice(0, idx)] = line.slice(idx + 2);
+            }
+            if (!fields.event) continue;
+            if (fields.id) lastEventId = fields.id;
+            handleEvent(fields.event, JSON.parse(fields.data));
+          }
+        }
+      } catch (err) {
+        if (controller.signal.aborted) return;
+      }
+      retryTimer = setTimeout(connect, 3000);
+    };
+
+    connect();
+    return () => {
+      controller.abort();
+      clearTimeout(retryTimer);
+    };
+  }, [handleEvent]);
+
+
   const deleteJob = async (id) => {
     if (!window.confirm("Are you sure you want to delete this job posting?")) return;
     try {
@@ -651,7 +837,7 @@ export default function AdminDashboard() {
           ) : (
             <>
               {section === "dashboard" && (
-                <DashboardOverview jobs={jobs} applications={applications} emailLogs={emailLogs} />
+                <DashboardOverview summary={summary} />
               )}
               {section === "jobs" && (
                 <JobsTable
@@ -4,8 +4,7 @@ import { motion } from "framer-motion";
 import axios from "axios";
 import { toast } from "sonner";
 import { Shield, Loader2, Eye, EyeOff } from "lucide-react";
-
-const API = `${process.env.REACT_APP_BACKEND_URL || process.env.REACT_APP_API_URL || ''}/api`;
+import { API, saveSession } from "@/lib/auth";
 
 export default function AdminLogin() {
   const navigate = useNavigate();
@@ -25,8 +24,7 @@ export default function AdminLogin() {
     setLoading(true);
     try {
       const res = await axios.post(`${API}/admin/login`, { email, password });
-      localStorage.setItem("admin_token", res.data.token);
-      localStorage.setItem("admin_email", res.data.admin?.email || email);
+      saveSession(res.data, email);
       toast.success("Login successful!");
       navigate("/admin/dashboard");
     } catch (err) {
@@ -0,0 +1,4 @@
+"""
+Project P Innovations - Backend API
+Build the app with projectp.main:create_app (uvicorn --factory)
+"""
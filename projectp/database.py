@@ -0,0 +1,205 @@
+"""
+Project P Innovations - Database
+MongoDB client lifecycle, read routing profiles, indexes and shared locks
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Optional
+
+from pymongo import read_preferences
+from pymongo.errors import DuplicateKeyError
+from pymongo.read_concern import ReadConcern
+
+from projectp import settings
+from projectp.metrics import MONGO_LATENCY
+from projectp.mongo_profiler import CommandProfiler, PoolMonitor
+
+logger = logging.getLogger(__name__)
+
+mongo_profiler = CommandProfiler(slow_ms=settings.MONGO_SLOW_MS)
+pool_monitor = PoolMonitor()
+
+# Set by connect() in the app lifespan (or by a command line tool)
+client = None
+db = None
+catalog_db = None
+
+# Identifies this worker process as a lock owner
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+READ_PREFERENCE_MODES = {
+    "primary": read_preferences.Primary,
+    "primaryPreferred": read_preferences.PrimaryPreferred,
+    "secondary": read_preferences.Secondary,
+    "secondaryPreferred": read_preferences.SecondaryPreferred,
+    "nearest": read_preferences.Nearest
+}
+
+
+async def timed(operation: str, awaitable):
+    """
+    Await a MongoDB call, recording its latency
+
+    Args:
+        operation: Metric label, e.g. "jobs.find_one"
+        awaitable: Pending Motor call
+
+    Returns:
+        The call's result
+    """
+    with MONGO_LATENCY.time(operation):
+        return await awaitable
+
+
+def create_mongo_client():
+    """Create the Motor client with the configured pool, timeouts and listeners"""
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    options = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGO_SOCKET_TIMEOUT_MS,
+        "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "readPreference": settings.MONGO_READ_PREFERENCE,
+        "event_listeners": [mongo_profiler, pool_monitor]
+    }
+    if settings.MONGO_COMPRESSORS:
+        options["compressors"] = settings.MONGO_COMPRESSORS
+    return AsyncIOMotorClient(settings.MONGO_URL, **options)
+
+
+def read_options(mode: str, max_staleness: int = -1, read_concern: Optional[str] = None) -> dict:
+    """
+    Build with_options() arguments for a read routing profile
+
+    Args:
+        mode: Read preference mode name, e.g. "secondaryPreferred"
+        max_staleness: Maximum replication lag in seconds (-1 for no bound)
+        read_concern: Read concern level, e.g. "local" or "majority"
+
+    Returns:
+        Keyword arguments for Database.with_options
+    """
+    if mode not in READ_PREFERENCE_MODES:
+        raise RuntimeError(f"Invalid read preference: {mode}")
+    if mode == "primary":
+        preference = read_preferences.Primary()
+    else:
+        preference = READ_PREFERENCE_MODES[mode](max_staleness=max_staleness)
+    return {"read_preference": preference, "read_concern": ReadConcern(read_concern)}
+
+
+def connect():
+    """Create the client and the default and catalog database handles"""
+    global client, db, catalog_db
+    client = create_mongo_client()
+    db = client[settings.DB_NAME]
+    catalog_db = db.with_options(**read_options(
+        settings.CATALOG_READ_PREFERENCE,
+        settings.CATALOG_MAX_STALENESS_SECONDS,
+        settings.CATALOG_READ_CONCERN
+    ))
+
+
+def close():
+    """Close the client"""
+    if client is not None:
+        client.close()
+
+
+async def warm_up_pool():
+    """Open MONGO_MIN_POOL_SIZE connections up front with concurrent pings"""
+    connections = max(settings.MONGO_MIN_POOL_SIZE, 1)
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(connections)))
+    logger.info("✅ MongoDB pool warmed up: %s connections", connections)
+
+
+async def check_mongo() -> dict:
+    """
+    Ping MongoDB and report connectivity
+
+    Returns:
+        Dictionary with connected flag, ping latency and any error
+    """
+    start = time.perf_counter()
+    try:
+        await client.admin.command("ping")
+        return {"connected": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+    except Exception as e:
+        return {"connected": False, "error": str(e)}
+
+
+async def ensure_indexes():
+    """Create indexes used by hot-path queries (idempotent)"""
+    await db.applications.create_index([("email", 1), ("job_id", 1)])
+    # One original application per applicant, and per resume, for each job;
+    # flagged duplicates (duplicate_of set) are exempt
+    for field in ("email", "resume_sha256"):
+        try:
+            await db.applications.create_index(
+                [("job_id", 1), (field, 1)],
+                unique=True,
+                partialFilterExpression={"duplicate_of": None},
+                name=f"job_id_1_{field}_1_original"
+            )
+        except DuplicateKeyError:
+            logger.error("❌ Duplicate original applications by job and %s: unique index not created", field)
+    await db.applications.create_index("resume_sha256")
+    await db.applications.create_index("resume_path")
+    await db.applications.create_index("job_id")
+    await db.applications.create_index("text_updated_at", sparse=True)
+    await db.jobs.create_index("id")
+    await db.jobs.create_index("slug")
+    await db.admins.create_index("email")
+    await db.applications.create_index([("created_at", -1)])
+    await db.counters.create_index([("kind", 1), ("date", 1)])
+    await db.rate_limits.create_index("expires_at", expireAfterSeconds=0)
+    await db.login_attempts.create_index("expires_at", expireAfterSeconds=0)
+    await db.tasks.create_index([("status", 1), ("run_at", 1)])
+    await db.tasks.create_index([("status", 1), ("locked_until", 1)])
+    await db.dead_letters.create_index("failed_at")
+    await db.refresh_tokens.create_index("session_id")
+    await db.refresh_tokens.create_index("expires_at", expireAfterSeconds=0)
+    await db.revoked_sessions.create_index("expires_at", expireAfterSeconds=0)
+    await db.signing_keys.create_index([("algorithm", 1), ("active_from", 1)])
+    logger.info("✅ Database indexes ensured")
+
+
+async def acquire_lock(name: str, ttl_seconds: int) -> bool:
+    """
+    Take a named lock in db.locks shared by all workers
+
+    An expired lock (its holder crashed) can be taken over.
+
+    Args:
+        name: Lock name
+        ttl_seconds: How long the lock is held without being released
+
+    Returns:
+        True if this worker now holds the lock
+    """
+    now = datetime.now(timezone.utc)
+    lock = {"owner": INSTANCE_ID, "expires_at": now + timedelta(seconds=ttl_seconds)}
+    try:
+        await db.locks.insert_one({"_id": name, **lock})
+        return True
+    except DuplicateKeyError:
+        result = await db.locks.update_one(
+            {"_id": name, "expires_at": {"$lt": now}},
+            {"$set": lock}
+        )
+        return result.modified_count == 1
+
+
+async def release_lock(name: str):
+    """Release a lock held by this worker"""
+    await db.locks.delete_one({"_id": name, "owner": INSTANCE_ID})
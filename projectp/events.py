@@ -0,0 +1,251 @@
+"""
+Project P Innovations - Live Event Stream
+In-process pub/sub for admin dashboard events, delivered as server-sent events
+
+Event IDs are "<seconds>-<increment>" positions. With change streams they are
+the change's cluster time, the same in every worker, so a client can
+reconnect to any worker with Last-Event-ID. Locally published events (one
+worker) count up from the wall clock in milliseconds, so IDs keep
+increasing across restarts. A worker replays only what it can prove it has:
+if the client's last event is older than the oldest buffered one (the
+worker started later, restarted, or the buffer wrapped), newer than the
+newest, or unrecognised, the client gets a stream.reset event and should
+reload the dashboard summary instead.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Recent events kept for Last-Event-ID replay after a reconnect
+REPLAY_BUFFER_SIZE = 1000
+
+# Per-subscriber queue bound; a subscriber that falls this far behind is
+# disconnected and catches up from the replay buffer when it reconnects
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Keep-alive interval for idle streams (proxies close silent connections)
+HEARTBEAT_SECONDS = 15
+
+# Stream position: (seconds, increment) like a MongoDB Timestamp for change
+# streams, (milliseconds, increment) for local events
+Position = Tuple[int, int]
+
+
+def format_event_id(position: Position) -> str:
+    return f"{position[0]}-{position[1]}"
+
+
+def parse_event_id(event_id: str) -> Optional[Position]:
+    """Position of a Last-Event-ID, or None if it isn't one of ours"""
+    seconds, _, increment = event_id.partition("-")
+    if not (seconds.isdigit() and increment.isdigit()):
+        return None
+    return int(seconds), int(increment)
+
+
+class EventBroker:
+    """Fan out published events to every connected subscriber"""
+
+    def __init__(self):
+        self.last_position: Position = (0, 0)
+        self.buffer = deque(maxlen=REPLAY_BUFFER_SIZE)
+        self.subscribers = set()
+
+    def next_position(self) -> Position:
+        """Position for a locally published event, never behind the last one"""
+        seconds, increment = self.last_position
+        now = time.time_ns() // 1_000_000
+        return (now, 1) if now > seconds else (seconds, increment + 1)
+
+    def publish(self, event_type: str, data: dict, position: Optional[Position] = None) -> dict:
+        """
+        Publish an event to all subscribers (never blocks)
+
+        Args:
+            event_type: Event name, e.g. "application.created"
+            data: JSON-serialisable payload
+            position: Stream position (a change's cluster time); assigned
+                from the clock if None
+
+        Returns:
+            The stored event
+        """
+        if position is None:
+            position = self.next_position()
+        self.last_position = max(self.last_position, position)
+        event = {
+            "id": format_event_id(position),
+            "position": position,
+            "type": event_type,
+            "data": data,
+            "at": datetime.now(timezone.utc).isoformat()
+        }
+        self.buffer.append(event)
+
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: end its stream once drained, the client
+                # reconnects with Last-Event-ID and replays from the buffer
+                self.subscribers.discard(queue)
+                logger.warning("⚠️ Event subscriber dropped (too slow)")
+
+        return event
+
+    def replay_after(self, last_event_id: str) -> Optional[list]:
+        """
+        Buffered events newer than the given ID
+
+        Returns:
+            The missed events, or None if this broker can't tell what was
+            missed (unknown ID, or outside what is buffered)
+        """
+        position = parse_event_id(last_event_id)
+        if position is None or not self.buffer:
+            return None
+        if not self.buffer[0]["position"] <= position <= self.last_position:
+            return None
+        return [event for event in self.buffer if event["position"] > position]
+
+    def reset_event(self) -> dict:
+        """Tell a client its missed events can't be replayed"""
+        event = {
+            "id": None,
+            "type": "stream.reset",
+            "data": {"reason": "missed events unavailable, reload the summary"},
+            "at": datetime.now(timezone.utc).isoformat()
+        }
+        if self.buffer:
+            # Resume from here once the client has reloaded
+            event["id"] = self.buffer[-1]["id"]
+        return event
+
+    async def subscribe(self, last_event_id: Optional[str] = None) -> AsyncIterator[Optional[dict]]:
+        """
+        Yield events as they are published
+
+        Missed events after ``last_event_id`` are replayed first, or a
+        stream.reset event sent if they can't be. ``None`` is yielded when
+        no event arrives within the heartbeat interval so the caller can
+        send a keep-alive.
+
+        Args:
+            last_event_id: ID of the last event the client received
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        try:
+            if last_event_id is not None:
+                missed = self.replay_after(last_event_id)
+                if missed is None:
+                    yield self.reset_event()
+                    missed = []
+                for event in missed:
+                    yield event
+
+            while queue in self.subscribers or not queue.empty():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield event
+        finally:
+            self.subscribers.discard(queue)
+
+
+def format_sse(event: Optional[dict]) -> str:
+    """Encode an event (or a heartbeat for None) in text/event-stream format"""
+    if event is None:
+        return ": keep-alive\n\n"
+    payload = json.dumps({**event["data"], "at": event["at"]}, default=str)
+    event_id = f"id: {event['id']}\n" if event["id"] is not None else ""
+    return f"{event_id}event: {event['type']}\ndata: {payload}\n\n"
+
+
+async def watch_change_streams(db, broker: EventBroker):
+    """
+    Feed the broker from MongoDB change streams (replica sets only)
+
+    The last resume token is kept so the watcher picks up where it left off
+    after a transient error instead of missing changes.
+
+    Args:
+        db: Motor database
+        broker: Broker to publish into
+    """
+    pipeline = [{"$match": {
+        "ns.coll": {"$in": ["applications", "jobs", "email_logs"]},
+        "operationType": {"$in": ["insert", "update", "replace"]}
+    }}]
+    resume_token = None
+
+    while True:
+        try:
+            async with db.watch(
+                pipeline,
+                full_document="updateLookup",
+                resume_after=resume_token
+            ) as stream:
+                logger.info("✅ Change stream event feed started")
+                async for change in stream:
+                    resume_token = stream.resume_token
+                    event = change_to_event(change)
+                    if event:
+                        cluster_time = change["clusterTime"]
+                        broker.publish(*event, position=(cluster_time.time, cluster_time.inc))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("❌ Change stream interrupted: %s", e)
+            await asyncio.sleep(5)
+
+
+def change_to_event(change: dict) -> Optional[tuple]:
+    """Map a change stream document to an (event_type, data) pair"""
+    collection = change["ns"]["coll"]
+    operation = change["operationType"]
+    doc = change.get("fullDocument") or {}
+
+    if collection == "applications":
+        if operation == "insert":
+            return "application.created", application_event(doc)
+        # A duplicate merge, like publish_event on the merge path; scan and
+        # text extraction updates don't produce events
+        updated_fields = (change.get("updateDescription") or {}).get("updatedFields") or {}
+        if operation == "update" and "submission_count" in updated_fields:
+            return "application.updated", application_event(doc)
+        return None
+    if collection == "jobs":
+        if doc.get("archived"):
+            return "job.archived", job_event(doc)
+        return ("job.created" if operation == "insert" else "job.updated"), job_event(doc)
+    if collection == "email_logs" and operation == "insert":
+        return f"email.{doc.get('status', 'sent')}", email_event(doc)
+    return None
+
+
+def application_event(application: dict) -> dict:
+    """Compact application payload (no resume text)"""
+    return {
+        key: application.get(key)
+        for key in ("id", "name", "email", "job_id", "job_title", "duplicate_of", "created_at")
+    }
+
+
+def job_event(job: dict) -> dict:
+    """Compact job payload"""
+    return {key: job.get(key) for key in ("id", "slug", "title", "updated_at")}
+
+
+def email_event(email_log: dict) -> dict:
+    """Compact email log payload (no body)"""
+    return {key: email_log.get(key) for key in ("id", "to", "subject", "status", "sent_at")}
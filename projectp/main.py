@@ -0,0 +1,138 @@
+"""
+Project P Innovations - FastAPI Backend Server
+Complete API for job applications, admin management, and email notifications
+
+Run with the app factory:
+    uvicorn projectp.main:create_app --factory
+"""
+
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from projectp import database, settings
+from projectp.logging_config import RequestIdMiddleware, configure_logging, stop_logging
+from projectp.metrics import STARTUP_PHASE_SECONDS, MetricsMiddleware
+from projectp.mongo_profiler import ServerTimingMiddleware
+from projectp.routers import admin, applications, files, health, jobs, system
+from projectp.services import background, coordination, live_events, resumes, revocation, scoring, signing_keys, tasks
+from projectp.services.catalog import load_job_catalog, refresh_job_caches
+from projectp.services.startup import run_startup_maintenance, startup_phase, startup_phases
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the MongoDB client and load caches on startup; drain and close on shutdown
+
+    Only the steps needed to serve requests run before the app accepts traffic.
+    Indexes, seeding and counter backfill run in the background (see
+    run_startup_maintenance) so cold starts stay fast when scaling out.
+    """
+    start = time.perf_counter()
+    with startup_phase("mongo_client"):
+        database.connect()
+    with startup_phase("pool_warmup"):
+        await database.warm_up_pool()
+    # Record cache versions before loading, so changes made by other workers
+    # while this one starts are picked up by the first sync
+    coordination.register_cache("job_catalog", refresh_job_caches)
+    coordination.register_cache("revoked_sessions", revocation.load_revocations)
+    coordination.register_cache("signing_keys", signing_keys.load_signing_keys)
+    coordination.register_cache("application_vectors", scoring.reload_application_vectors)
+    with startup_phase("job_catalog"):
+        await coordination.sync_caches(reload=False)
+        await load_job_catalog()
+    with startup_phase("revoked_sessions"):
+        await revocation.load_revocations()
+    with startup_phase("signing_keys"):
+        await signing_keys.prepare_signing_keys()
+    signing_keys.start_key_rotation()
+    coordination.start_cache_sync()
+    tasks.start_task_workers()
+
+    if settings.SEED_ON_STARTUP == "background":
+        background.run_in_background(run_startup_maintenance())
+
+    if settings.EVENTS_SOURCE == "change_streams":
+        live_events.start_change_stream()
+
+    startup_phases["total"] = round(time.perf_counter() - start, 4)
+    STARTUP_PHASE_SECONDS.set("total", value=startup_phases["total"])
+    logger.info(
+        "🚀 Project P Innovations API started successfully in %.1fms",
+        startup_phases["total"] * 1000,
+        extra={"sample": False, "startup_phases": dict(startup_phases)}
+    )
+    logger.info("⚙️ Settings profile: %s", settings.APP_ENV)
+    logger.info("📧 Email FROM: %s", settings.EMAIL_FROM)
+    logger.info("📧 Email TO: %s", settings.EMAIL_TO)
+    logger.info(
+        "🔐 Access tokens: %s minutes, refresh tokens: %s days",
+        settings.ACCESS_TOKEN_TTL_MINUTES, settings.REFRESH_TOKEN_TTL_DAYS
+    )
+
+    yield
+
+    live_events.stop_change_stream()
+    coordination.stop_cache_sync()
+    signing_keys.stop_key_rotation()
+    await tasks.stop_task_workers()
+    resumes.shutdown_worker_pool()
+    await background.drain()
+    database.close()
+    logger.info("👋 MongoDB connection closed")
+    stop_logging()
+
+
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application
+
+    Returns:
+        App with all routers and middleware installed
+    """
+    configure_logging(
+        level=settings.LOG_LEVEL,
+        fmt=settings.LOG_FORMAT,
+        info_sample_rate=settings.LOG_INFO_SAMPLE_RATE
+    )
+    settings.UPLOAD_DIR.mkdir(exist_ok=True)
+    settings.QUARANTINE_DIR.mkdir(exist_ok=True)
+    settings.PREVIEW_CACHE_DIR.mkdir(exist_ok=True)
+
+    app = FastAPI(
+        title="Project P Innovations API",
+        description="Backend API for job applications and admin management",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+
+    for module in (health, jobs, applications, admin, files, system):
+        app.include_router(module.router)
+
+    # CORS Middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["Content-Disposition", "X-Request-ID", "Server-Timing"]
+    )
+
+    # Per-request MongoDB time in the Server-Timing header
+    app.add_middleware(ServerTimingMiddleware)
+
+    # Request correlation IDs for logs (X-Request-ID)
+    app.add_middleware(RequestIdMiddleware)
+
+    # Request metrics (outermost, so it sees the full request time)
+    app.add_middleware(MetricsMiddleware)
+
+    return app
@@ -0,0 +1,180 @@
+"""
+Project P Innovations - Candidate Match Scoring
+Hashed-feature TF-IDF vectors for jobs and resumes, scored in batches with NumPy
+"""
+
+import re
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Number of hashed feature buckets (collisions are rare at this size)
+N_FEATURES = 2 ** 18
+
+# Job tags are short and deliberate, so they count more than description words
+TAG_WEIGHT = 3.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Sparse vector: (feature indices, term frequencies)
+SparseVector = Tuple[np.ndarray, np.ndarray]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case word tokens (keeps terms like c++ and c#)"""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def hash_features(tokens: List[str], weight: float = 1.0) -> Dict[int, float]:
+    """
+    Count tokens into hashed feature buckets
+
+    Args:
+        tokens: Word tokens
+        weight: Weight added per occurrence
+
+    Returns:
+        Mapping of feature index to raw term count
+    """
+    counts: Dict[int, float] = {}
+    for token in tokens:
+        index = zlib.crc32(token.encode("utf-8")) % N_FEATURES
+        counts[index] = counts.get(index, 0.0) + weight
+    return counts
+
+
+def to_sparse(counts: Dict[int, float]) -> SparseVector:
+    """Convert raw counts to a sorted sparse vector with sublinear term frequency"""
+    if not counts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    order = np.argsort(indices)
+    return indices[order], (1.0 + np.log(values[order])).astype(np.float32)
+
+
+def job_vector(job: dict) -> SparseVector:
+    """Build the sparse vector for a job from its title, description and tags"""
+    counts = hash_features(tokenize(job.get("title", "")))
+    for index, value in hash_features(tokenize(job.get("description", ""))).items():
+        counts[index] = counts.get(index, 0.0) + value
+    for tag in job.get("tags") or []:
+        for index, value in hash_features(tokenize(tag), TAG_WEIGHT).items():
+            counts[index] = counts.get(index, 0.0) + value
+    return to_sparse(counts)
+
+
+def application_vector(application: dict) -> SparseVector:
+    """Build the sparse vector for an application from its resume text and message"""
+    text = f"{application.get('resume_text') or ''} {application.get('message') or ''}"
+    return to_sparse(hash_features(tokenize(text)))
+
+
+class MatchIndex:
+    """
+    In-memory cache of job and application vectors with incremental
+    document-frequency bookkeeping for IDF weighting
+
+    Application vectors are kept least recently scored first, so
+    trim_applications can bound the cache.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, SparseVector] = {}
+        self.applications: "OrderedDict[str, Tuple[Optional[str], SparseVector]]" = OrderedDict()
+        self.doc_freq = np.zeros(N_FEATURES, dtype=np.float32)
+        self.n_docs = 0
+
+    def _add_df(self, vector: SparseVector, sign: int):
+        self.doc_freq[vector[0]] += sign
+        self.n_docs += sign
+
+    def upsert_job(self, job: dict):
+        """Add or refresh a job vector"""
+        self.remove_job(job["id"])
+        vector = job_vector(job)
+        self.jobs[job["id"]] = vector
+        self._add_df(vector, 1)
+
+    def remove_job(self, job_id: str):
+        """Drop a job vector if cached"""
+        vector = self.jobs.pop(job_id, None)
+        if vector is not None:
+            self._add_df(vector, -1)
+
+    def upsert_application(self, application: dict):
+        """Add or refresh an application vector"""
+        self.remove_application(application["id"])
+        vector = application_vector(application)
+        self.applications[application["id"]] = (application.get("job_id"), vector)
+        self._add_df(vector, 1)
+
+    def remove_application(self, application_id: str):
+        """Drop an application vector if cached"""
+        entry = self.applications.pop(application_id, None)
+        if entry is not None:
+            self._add_df(entry[1], -1)
+
+    def trim_applications(self, max_applications: int):
+        """Drop the least recently scored application vectors beyond max_applications"""
+        while len(self.applications) > max_applications:
+            _, (_, vector) = self.applications.popitem(last=False)
+            self._add_df(vector, -1)
+
+    def has_job(self, job_id: str) -> bool:
+        return job_id in self.jobs
+
+    def has_application(self, application_id: str) -> bool:
+        return application_id in self.applications
+
+    def idf(self) -> np.ndarray:
+        """Smoothed inverse document frequency over all cached documents"""
+        return np.log((1.0 + self.n_docs) / (1.0 + self.doc_freq)) + 1.0
+
+    def score(self, job_id: str, application_ids: List[str]) -> Dict[str, float]:
+        """
+        Score applications against a job with cosine similarity
+
+        All applications are scored together: their sparse vectors are
+        concatenated and reduced per row with a single weighted bincount.
+
+        Args:
+            job_id: Job to score against (must be cached)
+            application_ids: Applications to score (must be cached)
+
+        Returns:
+            Mapping of application ID to score in [0, 1]
+        """
+        if not application_ids:
+            return {}
+
+        idf = self.idf()
+        job_indices, job_values = self.jobs[job_id]
+        job_weights = np.zeros(N_FEATURES, dtype=np.float32)
+        job_weights[job_indices] = job_values * idf[job_indices]
+        job_norm = float(np.linalg.norm(job_weights[job_indices]))
+        if job_norm == 0.0:
+            return {application_id: 0.0 for application_id in application_ids}
+        job_weights /= job_norm
+
+        for application_id in application_ids:
+            self.applications.move_to_end(application_id)
+        vectors = [self.applications[application_id][1] for application_id in application_ids]
+        lengths = np.fromiter((len(v[0]) for v in vectors), dtype=np.int64, count=len(vectors))
+        rows = np.repeat(np.arange(len(vectors)), lengths)
+        indices = np.concatenate([v[0] for v in vectors])
+        if indices.size == 0:
+            # No resume text yet (pending scans, unreadable files): nothing to match
+            return {application_id: 0.0 for application_id in application_ids}
+        values = np.concatenate([v[1] for v in vectors]) * idf[indices]
+
+        dots = np.bincount(rows, weights=values * job_weights[indices], minlength=len(vectors))
+        norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(vectors)))
+        scores = np.divide(dots, norms, out=np.zeros(len(vectors)), where=norms > 0)
+
+        return {
+            application_id: round(float(score), 4)
+            for application_id, score in zip(application_ids, scores)
+        }
@@ -0,0 +1,234 @@
+"""
+Project P Innovations - Metrics
+Lightweight Prometheus-style counters, gauges and histograms with an ASGI
+middleware for per-route request metrics
+
+Metrics live in process memory, so with several uvicorn workers each one
+exposes its own series and a scrape of /metrics reaches whichever worker
+accepts the connection. Every sample carries a worker="<pid>" label so the
+series don't overwrite each other; aggregate across workers in queries,
+e.g. sum without (worker) (rate(http_requests_total[5m])).
+"""
+
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, Tuple
+
+# Default latency buckets in seconds (5ms .. 10s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], *extra: str) -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    pairs.extend(label for label in extra if label)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """Base class holding name, help text and label names"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(labels)
+
+    def render(self, const_labels: str = "") -> str:
+        header = f"# HELP {self.name} {self.description}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(self.samples(const_labels))
+
+    def samples(self, const_labels: str = "") -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing value per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labels: Iterable[str] = ()):
+        super().__init__(name, description, labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self, const_labels: str = ""):
+        for labels, value in self.values.items():
+            yield f"{self.name}{_format_labels(self.label_names, labels, const_labels)} {value}\n"
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down"""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float):
+        self.values[labels] = value
+
+
+class Histogram(Metric):
+    """Cumulative bucketed observations per label set"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labels: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self.values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        state = self.values.get(labels)
+        if state is None:
+            state = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def samples(self, const_labels: str = ""):
+        for labels, state in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), state[:-1]):
+                cumulative += count
+                label_text = _format_labels(self.label_names, labels, const_labels, f'le="{bound}"')
+                yield f"{self.name}_bucket{label_text} {cumulative}\n"
+            label_text = _format_labels(self.label_names, labels, const_labels)
+            yield f"{self.name}_sum{label_text} {state[-1]}\n"
+            yield f"{self.name}_count{label_text} {cumulative}\n"
+
+    def time(self, *labels: str) -> "Timer":
+        """Time a block of code into this histogram"""
+        return Timer(self, labels)
+
+
+class Timer:
+    """Context manager observing elapsed wall time into a histogram"""
+
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+        return False
+
+
+class Registry:
+    """Collection of metrics rendered together in text exposition format"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        # Read at render time: the process that imported this module may
+        # not be the worker that serves the scrape
+        worker = f'worker="{os.getpid()}"'
+        return "\n".join(metric.render(worker) for metric in self.metrics)
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+))
+MONGO_LATENCY = REGISTRY.register(Histogram(
+    "mongo_operation_duration_seconds", "MongoDB operation latency", ("operation",)
+))
+EMAIL_LATENCY = REGISTRY.register(Histogram(
+    "email_send_duration_seconds", "Email provider call latency", ("status",)
+))
+FILE_WRITE_LATENCY = REGISTRY.register(Histogram(
+    "resume_write_duration_seconds", "Resume file write latency"
+))
+BCRYPT_LATENCY = REGISTRY.register(Histogram(
+    "bcrypt_duration_seconds", "bcrypt hash/verify latency", ("operation",)
+))
+TASKS_ENQUEUED = REGISTRY.register(Counter(
+    "tasks_enqueued_total", "Background tasks queued by name", ("task",)
+))
+TASKS_FINISHED = REGISTRY.register(Counter(
+    "tasks_finished_total", "Background task runs by name and outcome (succeeded, retried, dead_lettered)",
+    ("task", "outcome")
+))
+TASK_DURATION = REGISTRY.register(Histogram(
+    "task_duration_seconds", "Background task run time by name", ("task",)
+))
+TASKS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "tasks_in_flight", "Background tasks running in this worker"
+))
+TASK_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "task_queue_depth", "Background tasks queued or running when last checked"
+))
+RESUME_SCANS = REGISTRY.register(Counter(
+    "resume_scans_total", "Resume scan verdicts (clean, infected, rejected, missing)", ("verdict",)
+))
+PREVIEW_CACHE = REGISTRY.register(Counter(
+    "preview_cache_requests_total", "Resume preview cache lookups (hit, miss)", ("result",)
+))
+PREVIEW_RENDER_LATENCY = REGISTRY.register(Histogram(
+    "preview_render_duration_seconds", "Time to render a resume preview in a worker process"
+))
+LOGIN_THROTTLED = REGISTRY.register(Counter(
+    "login_throttled_total", "Admin login attempts delayed, rejected or locked out", ("outcome",)
+))
+STARTUP_PHASE_SECONDS = REGISTRY.register(Gauge(
+    "startup_phase_seconds", "Duration of each startup phase in this worker", ("phase",)
+))
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count, latency and in-flight requests
+
+    Routes are labelled by their path template (e.g. /api/jobs/{job_id}) so
+    label cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            route_label = getattr(route, "path", "unmatched")
+            HTTP_REQUESTS.inc(scope["method"], route_label, str(status_code))
+            HTTP_LATENCY.observe(elapsed, scope["method"], route_label)
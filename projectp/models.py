@@ -0,0 +1,126 @@
+"""
+Project P Innovations - API Models
+Pydantic request and response models
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+class HealthResponse(BaseModel):
+    """Health check response"""
+    status: str
+
+class JobCreate(BaseModel):
+    """Job creation model"""
+    title: str
+    location: str
+    type: str = "Full-time"
+    seniority: str
+    description: str
+    tags: List[str] = []
+
+class JobUpdate(BaseModel):
+    """Job update model (all fields optional)"""
+    title: Optional[str] = None
+    location: Optional[str] = None
+    type: Optional[str] = None
+    seniority: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+class JobResponse(BaseModel):
+    """Job response model"""
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    slug: str
+    title: str
+    location: str
+    type: str
+    seniority: str
+    description: str
+    tags: List[str]
+    created_at: str
+    updated_at: str
+
+class ApplicationResponse(BaseModel):
+    """Application response model"""
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    name: str
+    email: str
+    message: Optional[str] = None
+    job_id: Optional[str] = None
+    job_title: Optional[str] = None
+    resume_path: str
+    created_at: str
+    duplicate_of: Optional[str] = None
+    submission_count: int = 1
+    scan_status: Optional[str] = None
+    match_score: Optional[float] = None
+
+class AdminLogin(BaseModel):
+    """Admin login credentials"""
+    email: EmailStr
+    password: str
+
+class TokenResponse(BaseModel):
+    """Access and refresh token response"""
+    success: bool = True
+    token: str
+    refresh_token: str
+    expires_in: int
+    admin: dict
+
+class RefreshRequest(BaseModel):
+    """Refresh token presented to refresh or log out"""
+    refresh_token: str
+
+class JobApplicationCount(BaseModel):
+    """Applications received for one job"""
+    job_id: Optional[str] = None
+    job_title: Optional[str] = None
+    applications: int
+
+class DailyApplicationCount(BaseModel):
+    """Applications received on one day (UTC)"""
+    date: str
+    applications: int
+
+class EmailStats(BaseModel):
+    """Email delivery totals"""
+    sent: int
+    failed: int
+    success_rate: float
+
+class AdminSummary(BaseModel):
+    """Admin dashboard summary"""
+    total_jobs: int
+    total_applications: int
+    applications_per_job: List[JobApplicationCount]
+    applications_per_day: List[DailyApplicationCount]
+    emails: EmailStats
+    recent_applications: List[ApplicationResponse]
+
+class DownloadLink(BaseModel):
+    """Signed resume download URL"""
+    url: str
+    expires_at: str
+
+class ResumePreview(BaseModel):
+    """First-page thumbnail and text snippet of a resume"""
+    sha256: str
+    snippet: str
+    has_image: bool
+    width: Optional[int] = None
+    height: Optional[int] = None
+    generated_at: str
+
+class EmailLog(BaseModel):
+    """Email log model"""
+    id: str
+    to: str
+    subject: str
+    body: str
+    sent_at: str
+    status: str = "sent"
@@ -0,0 +1,240 @@
+"""
+Project P Innovations - MongoDB Command Profiling
+pymongo listeners recording per-command latency, a slow-query log with filter
+shapes, per-request MongoDB time for the Server-Timing header, and connection
+pool utilisation
+"""
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from pymongo import monitoring
+
+from projectp.metrics import REGISTRY, Counter, Gauge, Histogram
+
+slow_query_logger = logging.getLogger("mongo.slow")
+
+MONGO_COMMAND_LATENCY = REGISTRY.register(Histogram(
+    "mongo_command_duration_seconds", "MongoDB command round-trip time", ("collection", "command")
+))
+
+# Commands that aren't interesting to profile
+_IGNORED_COMMANDS = {"isMaster", "hello", "ping", "saslStart", "saslContinue", "endSessions", "buildInfo"}
+
+
+class RequestMongoStats:
+    """MongoDB call count and total time for one HTTP request"""
+
+    __slots__ = ("calls", "seconds", "_lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        # Listener callbacks run on Motor's executor threads
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+
+
+# Stats for the current request; Motor copies the context into its executor
+# threads, so the listener sees the same object as the request handler
+request_mongo_stats: ContextVar[Optional[RequestMongoStats]] = ContextVar("request_mongo_stats", default=None)
+
+
+def filter_shape(value: Any) -> Any:
+    """
+    Replace literal values in a filter with "?" while keeping its structure
+
+    Args:
+        value: Filter document (or part of one)
+
+    Returns:
+        Shape such as {"job_id": "?", "$or": [{"email": "?"}]}
+    """
+    if isinstance(value, dict):
+        return {key: filter_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], dict):
+            return [filter_shape(item) for item in value]
+        return ["?"]
+    return "?"
+
+
+def command_filter(command_name: str, command: dict) -> Any:
+    """Pull the filter (or pipeline) out of a command document"""
+    if command_name == "find":
+        return command.get("filter", {})
+    if command_name in ("count", "findAndModify"):
+        return command.get("query", {})
+    if command_name == "aggregate":
+        return command.get("pipeline", [])
+    if command_name in ("update", "delete"):
+        statements = command.get("updates") or command.get("deletes") or []
+        return [statement.get("q", {}) for statement in statements]
+    return None
+
+
+class CommandProfiler(monitoring.CommandListener):
+    """
+    Record duration of each MongoDB command
+
+    Args:
+        slow_ms: Commands slower than this are written to the slow-query log
+    """
+
+    def __init__(self, slow_ms: float = 100.0):
+        self.slow_ms = slow_ms
+        self.pending = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        if event.command_name in _IGNORED_COMMANDS:
+            return
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = "-"
+        self.pending[(event.connection_id, event.request_id)] = (
+            collection,
+            command_filter(event.command_name, event.command),
+            request_mongo_stats.get()
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finish(event)
+
+    def _finish(self, event):
+        entry = self.pending.pop((event.connection_id, event.request_id), None)
+        if entry is None:
+            return
+        collection, filter_doc, stats = entry
+        seconds = event.duration_micros / 1_000_000
+
+        MONGO_COMMAND_LATENCY.observe(seconds, collection, event.command_name)
+        if stats is not None:
+            stats.add(seconds)
+
+        if seconds * 1000 >= self.slow_ms:
+            slow_query_logger.warning(
+                "🐢 Slow MongoDB command: %s.%s took %.1fms",
+                collection, event.command_name, seconds * 1000,
+                extra={
+                    "collection": collection,
+                    "command": event.command_name,
+                    "duration_ms": round(seconds * 1000, 2),
+                    "filter_shape": filter_shape(filter_doc) if filter_doc is not None else None
+                }
+            )
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware adding a Server-Timing header with per-request MongoDB
+    time and call count, plus total handler time
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestMongoStats()
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'mongo;dur={stats.seconds * 1000:.1f};desc="{stats.calls} calls", '
+                    f"app;dur={total_ms:.1f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        token = request_mongo_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_mongo_stats.reset(token)
+
+
+MONGO_POOL_CONNECTIONS = REGISTRY.register(Gauge(
+    "mongo_pool_connections", "MongoDB pool connections by state", ("address", "state")
+))
+MONGO_POOL_CHECKOUT_FAILURES = REGISTRY.register(Counter(
+    "mongo_pool_checkout_failures_total", "MongoDB connection checkouts that failed", ("address", "reason")
+))
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Track connection pool utilisation per server address
+
+    States: "open" (established connections), "in_use" (checked out) and
+    "waiting" (checkouts queued for a free connection).
+    """
+
+    def __init__(self):
+        self.pools = {}
+        self._lock = threading.Lock()
+
+    def _adjust(self, address, state: str, delta: int):
+        label = f"{address[0]}:{address[1]}"
+        with self._lock:
+            pool = self.pools.setdefault(label, {"open": 0, "in_use": 0, "waiting": 0, "checkout_failures": 0})
+            pool[state] += delta
+            if state != "checkout_failures":
+                MONGO_POOL_CONNECTIONS.set(label, state, value=pool[state])
+
+    def snapshot(self) -> dict:
+        """Copy of the current per-address pool counters"""
+        with self._lock:
+            return {address: dict(pool) for address, pool in self.pools.items()}
+
+    def pool_created(self, event):
+        self._adjust(event.address, "open", 0)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._adjust(event.address, "open", 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._adjust(event.address, "open", -1)
+
+    def connection_check_out_started(self, event):
+        self._adjust(event.address, "waiting", 1)
+
+    def connection_check_out_failed(self, event):
+        self._adjust(event.address, "waiting", -1)
+        self._adjust(event.address, "checkout_failures", 1)
+        MONGO_POOL_CHECKOUT_FAILURES.inc(f"{event.address[0]}:{event.address[1]}", str(event.reason))
+
+    def connection_checked_out(self, event):
+        self._adjust(event.address, "waiting", -1)
+        self._adjust(event.address, "in_use", 1)
+
+    def connection_checked_in(self, event):
+        self._adjust(event.address, "in_use", -1)
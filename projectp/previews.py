@@ -0,0 +1,89 @@
+"""
+Project P Innovations - Resume Previews
+First-page PNG and text snippet of a resume, run in the resume worker processes
+
+Like scanning.py this imports no application modules. The PNG needs the
+optional pypdfium2 package and is only rendered for PDFs; other types, or
+a PDF without pypdfium2, get the snippet alone.
+"""
+
+import struct
+import zlib
+from typing import Optional, Tuple
+
+from projectp.resume_text import extract_text
+
+# Tallest preview relative to its width, so odd page sizes stay small
+MAX_ASPECT_RATIO = 2
+
+
+def encode_png(width: int, height: int, rows, channels: int) -> bytes:
+    """Encode 8-bit RGB (3 channels) or RGBA (4) rows as a PNG"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack("!I", len(data)) + kind + data + struct.pack("!I", zlib.crc32(kind + data))
+
+    color_type = 6 if channels == 4 else 2
+    header = struct.pack("!IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    # Filter type 0 (none) in front of every row
+    raw = b"".join(b"\x00" + bytes(row) for row in rows)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b"")
+
+
+def render_first_page(path: str, width: int) -> Optional[Tuple[bytes, int, int]]:
+    """
+    Render page one of a PDF
+
+    Returns:
+        (PNG bytes, width, height), or None without pypdfium2 or if the
+        page can't be rendered
+    """
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+
+    try:
+        pdf = pypdfium2.PdfDocument(path)
+    except pypdfium2.PdfiumError:
+        return None
+    try:
+        page = pdf[0]
+        page_width, page_height = page.get_size()
+        scale = min(width / page_width, width * MAX_ASPECT_RATIO / page_height)
+        bitmap = page.render(scale=scale, rev_byteorder=True)
+        channels = len(bitmap.mode)
+        buffer = bitmap.buffer
+        rows = (
+            buffer[y * bitmap.stride:y * bitmap.stride + bitmap.width * channels]
+            for y in range(bitmap.height)
+        )
+        return encode_png(bitmap.width, bitmap.height, rows, channels), bitmap.width, bitmap.height
+    except (pypdfium2.PdfiumError, IndexError):
+        # Scanned clean but malformed, or no pages: fall back to the snippet
+        return None
+    finally:
+        pdf.close()
+
+
+def render_preview(path: str, ext: str, width: int, snippet_chars: int) -> dict:
+    """
+    Build the preview of one resume (runs in a resume worker process)
+
+    Args:
+        path: Stored resume (already scanned clean)
+        ext: File extension including the dot
+        width: PNG width in pixels
+        snippet_chars: Snippet length
+
+    Returns:
+        Dictionary with png (bytes or None), width, height and snippet
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    snippet = extract_text(content, ext)[:snippet_chars]
+
+    image = render_first_page(path, width) if ext == ".pdf" else None
+    if image is None:
+        return {"png": None, "width": None, "height": None, "snippet": snippet}
+    png, image_width, image_height = image
+    return {"png": png, "width": image_width, "height": image_height, "snippet": snippet}
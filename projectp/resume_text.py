@@ -0,0 +1,116 @@
+"""
+Project P Innovations - Resume Text Extraction
+Best-effort plain-text extraction from uploaded PDF, DOC and DOCX resumes
+
+Uploaded files are hostile until proven otherwise: the app only calls this
+in the resume worker processes (see services/resumes.py), and inflated
+content is capped at MAX_INFLATED_BYTES per file so zip and deflate bombs
+stop early.
+"""
+
+import re
+import zipfile
+import zlib
+from io import BytesIO
+
+# Cap stored text so application documents stay small
+MAX_TEXT_CHARS = 20000
+
+# Decompressed bytes read from one file (PDF streams or the DOCX body)
+MAX_INFLATED_BYTES = 16 * 1024 * 1024
+
+_PDF_STREAM_RE = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.DOTALL)
+_PDF_TEXT_BLOCK_RE = re.compile(rb"BT(.*?)ET", re.DOTALL)
+_PDF_STRING_RE = re.compile(rb"\(((?:\\.|[^\\)])*)\)")
+_PDF_ESCAPES = {b"n": b" ", b"r": b" ", b"t": b" ", b"b": b"", b"f": b"", b"(": b"(", b")": b")", b"\\": b"\\"}
+_XML_TAG_RE = re.compile(r"<[^>]+>")
+_DOC_RUN_RE = re.compile(rb"(?:[\x20-\x7e]\x00){4,}|[\x20-\x7e]{6,}")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _unescape_pdf_string(raw: bytes) -> bytes:
+    """Resolve backslash escapes inside a PDF literal string"""
+    return re.sub(rb"\\(.)", lambda m: _PDF_ESCAPES.get(m.group(1), m.group(1)), raw)
+
+
+def _extract_pdf(content: bytes) -> str:
+    """Pull literal strings from the text blocks of every content stream"""
+    chunks = []
+    length = 0
+    budget = MAX_INFLATED_BYTES
+    for match in _PDF_STREAM_RE.finditer(content):
+        stream = match.group(1)
+        try:
+            inflater = zlib.decompressobj()
+            stream = inflater.decompress(stream, budget)
+        except zlib.error:
+            pass
+        budget -= len(stream)
+        for block in _PDF_TEXT_BLOCK_RE.finditer(stream):
+            for literal in _PDF_STRING_RE.finditer(block.group(1)):
+                chunk = _unescape_pdf_string(literal.group(1)).decode("latin-1")
+                chunks.append(chunk)
+                length += len(chunk) + 1
+                if length > MAX_TEXT_CHARS:
+                    return " ".join(chunks)
+        if budget <= 0:
+            break
+    return " ".join(chunks)
+
+
+def _extract_docx(content: bytes) -> str:
+    """Strip WordprocessingML tags from the main document part"""
+    with zipfile.ZipFile(BytesIO(content)) as archive, archive.open("word/document.xml") as part:
+        # The declared size can lie, so stop reading at the cap instead
+        xml = part.read(MAX_INFLATED_BYTES).decode("utf-8", errors="ignore")
+    xml = xml.replace("</w:p>", " ").replace("<w:tab/>", " ")
+    return _XML_TAG_RE.sub("", xml)
+
+
+def _extract_doc(content: bytes) -> str:
+    """Collect printable ASCII and UTF-16LE runs from a legacy binary document"""
+    runs = []
+    for match in _DOC_RUN_RE.finditer(content):
+        run = match.group(0)
+        if b"\x00" in run:
+            runs.append(run.decode("utf-16-le", errors="ignore"))
+        else:
+            runs.append(run.decode("latin-1"))
+    return " ".join(runs)
+
+
+_EXTRACTORS = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".doc": _extract_doc,
+}
+
+
+def extract_text(content: bytes, file_ext: str) -> str:
+    """
+    Extract searchable text from a resume file
+
+    Args:
+        content: Raw file bytes
+        file_ext: Lower-cased file extension including the dot
+
+    Returns:
+        Whitespace-normalised text, or an empty string if nothing could be read
+    """
+    extractor = _EXTRACTORS.get(file_ext)
+    if extractor is None:
+        return ""
+
+    try:
+        text = extractor(content)
+    except Exception:
+        return ""
+
+    return _WHITESPACE_RE.sub(" ", text).strip()[:MAX_TEXT_CHARS]
+
+
+def extract_file_text(path: str, file_ext: str) -> str:
+    """Extract a stored resume's text (runs in a resume worker process)"""
+    with open(path, "rb") as f:
+        content = f.read()
+    return extract_text(content, file_ext)
@@ -0,0 +1,4 @@
+"""
+Project P Innovations - Routers
+API route groups included by the app factory
+"""
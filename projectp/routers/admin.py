@@ -0,0 +1,623 @@
+"""
+Project P Innovations - Admin Routes
+Authentication, applications, dashboard summary and events, resumes and
+their previews, email logs and job management
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import List, Optional
+from urllib.parse import quote, urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.events import format_sse, job_event
+from projectp.models import (
+    AdminLogin, AdminSummary, ApplicationResponse, DownloadLink, EmailLog,
+    JobCreate, JobResponse, JobUpdate, RefreshRequest, ResumePreview, TokenResponse
+)
+from projectp.services.auth import get_current_admin, verify_password
+from projectp.services.background import run_in_background
+from projectp.services.catalog import ACTIVE_JOBS, job_catalog, propagate_job_title, slugify
+from projectp.services.coordination import broadcast_invalidation
+from projectp.services.counters import increment_counter
+from projectp.services.downloads import download_name, expires_at, sign_download
+from projectp.services.live_events import event_broker, publish_event
+from projectp.services.login_throttle import check_login_allowed, record_login_success
+from projectp.services.previews import get_preview
+from projectp.services.scoring import index_job, score_applications, unindex_job
+from projectp.services.sessions import end_session, rotate_session, start_session
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api")
+
+
+@router.post("/admin/login", response_model=TokenResponse)
+async def admin_login(credentials: AdminLogin, request: Request):
+    """
+    Admin login endpoint
+
+    Args:
+        credentials: Admin email and password
+        request: Incoming request (client IP for throttling)
+
+    Returns:
+        Access token, refresh token and admin info
+
+    Raises:
+        HTTPException: If credentials are invalid, or 429 while the account
+            or client IP is throttled
+    """
+    client_ip = request.client.host
+    # Throttle before any bcrypt work (see services/login_throttle.py)
+    await check_login_allowed(credentials.email, client_ip)
+
+    admin = await timed("admins.find_one", database.db.admins.find_one({"email": credentials.email}, {"_id": 0}))
+
+    if not admin:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # Verify password off the event loop
+    password_ok = await verify_password(credentials.password, admin["password"])
+
+    if not password_ok:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    await record_login_success(credentials.email, client_ip)
+    tokens = await start_session(admin)
+
+    logger.info("✅ Admin logged in: %s", admin['email'])
+
+    return {"success": True, **tokens}
+
+
+@router.post("/admin/refresh", response_model=TokenResponse)
+async def refresh_admin_token(body: RefreshRequest):
+    """
+    Exchange a refresh token for a new access token and refresh token
+
+    Args:
+        body: Current refresh token (it cannot be used again)
+
+    Returns:
+        New tokens and admin info
+
+    Raises:
+        HTTPException: If the refresh token is invalid, expired, reused or revoked
+    """
+    return {"success": True, **await rotate_session(body.refresh_token)}
+
+
+@router.post("/admin/logout", status_code=204)
+async def admin_logout(body: RefreshRequest):
+    """
+    Log out: revoke the session's refresh token and outstanding access tokens
+
+    Args:
+        body: Session refresh token
+    """
+    await end_session(body.refresh_token)
+    return None
+
+
+@router.get("/admin/applications", response_model=List[ApplicationResponse])
+async def get_applications(
+    admin=Depends(get_current_admin),
+    job_id: Optional[str] = None,
+    sort: str = "newest"
+):
+    """
+    Get job applications (admin only)
+
+    Args:
+        admin: Current authenticated admin (from dependency)
+        job_id: Optional job ID to filter by
+        sort: "newest" (default) or "match" to rank by fit against the job
+
+    Returns:
+        List of applications sorted by date (newest first) or match score
+
+    Raises:
+        HTTPException: If sort is invalid or "match" is used without job_id
+    """
+    if sort not in ("newest", "match"):
+        raise HTTPException(status_code=400, detail="Invalid sort. Allowed: newest, match")
+
+    query = {"job_id": job_id} if job_id else {}
+
+    if sort == "match":
+        if not job_id:
+            raise HTTPException(status_code=400, detail="Sorting by match requires job_id")
+
+        # Rank on IDs and cached vectors, then load only the top 200 for the response
+        application_ids = await timed("applications.find", database.db.applications.find(
+            query, {"_id": 0, "id": 1}
+        ).to_list(None))
+        scores = await score_applications(job_id, [a["id"] for a in application_ids])
+        top = sorted(scores, key=scores.get, reverse=True)[:200]
+
+        applications = await timed("applications.find", database.db.applications.find(
+            {"id": {"$in": top}},
+            {"_id": 0, "resume_text": 0}
+        ).to_list(None))
+        for application in applications:
+            application["match_score"] = scores[application["id"]]
+        return sorted(applications, key=lambda a: a["match_score"], reverse=True)
+
+    applications = await timed("applications.find", database.db.applications.find(
+        query,
+        {"_id": 0, "resume_text": 0}
+    ).sort("created_at", -1).to_list(200))
+
+    return applications
+
+
+@router.get("/admin/summary", response_model=AdminSummary)
+async def get_admin_summary(admin=Depends(get_current_admin), days: int = 30):
+    """
+    Get dashboard summary from precomputed counters (admin only)
+
+    Args:
+        admin: Current authenticated admin (from dependency)
+        days: Number of days of per-day application counts to include
+
+    Returns:
+        Totals, applications per job and per day, email stats and recent applications
+    """
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
+
+    counters, recent = await asyncio.gather(
+        database.db.counters.find(
+            {"$or": [{"kind": {"$ne": "day"}}, {"date": {"$gte": since}}]}
+        ).to_list(None),
+        database.db.applications.find(
+            {},
+            {"_id": 0, "resume_text": 0}
+        ).sort("created_at", -1).to_list(5)
+    )
+
+    by_id = {counter["_id"]: counter for counter in counters}
+
+    per_job = sorted(
+        (
+            {
+                "job_id": c["job_id"],
+                "job_title": job_catalog.get(c["job_id"], {}).get("title", c.get("job_title")),
+                "applications": c["applications"]
+            }
+            for c in counters if c.get("kind") == "job"
+        ),
+        key=lambda row: row["applications"],
+        reverse=True
+    )
+    per_day = sorted(
+        (
+            {"date": c["date"], "applications": c["applications"]}
+            for c in counters if c.get("kind") == "day"
+        ),
+        key=lambda row: row["date"]
+    )
+
+    emails = by_id.get("emails", {})
+    sent = emails.get("sent", 0)
+    failed = emails.get("failed", 0)
+
+    return {
+        "total_jobs": by_id.get("jobs", {}).get("active", 0),
+        "total_applications": sum(row["applications"] for row in per_job),
+        "applications_per_job": per_job,
+        "applications_per_day": per_day,
+        "emails": {
+            "sent": sent,
+            "failed": failed,
+            "success_rate": round(sent / (sent + failed), 4) if sent + failed else 1.0
+        },
+        "recent_applications": recent
+    }
+
+
+@router.get("/admin/events")
+async def stream_events(request: Request, admin=Depends(get_current_admin)):
+    """
+    Stream dashboard events as server-sent events (admin only)
+
+    Clients reconnecting with a Last-Event-ID header (or ?last_event_id=)
+    first receive the buffered events they missed, or a stream.reset event
+    if this worker can't replay them (then reload /admin/summary).
+
+    Args:
+        request: FastAPI request object
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        text/event-stream of application, job and email events
+    """
+    last_event_id = request.headers.get("Last-Event-ID") or request.query_params.get("last_event_id") or None
+
+    async def event_stream():
+        async for event in event_broker.subscribe(last_event_id):
+            yield format_sse(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def require_clean_resume(application: dict):
+    """
+    Only resumes the scanner cleared can be downloaded
+
+    Raises:
+        HTTPException: 409 while the scan is pending, 403 if the resume was
+            quarantined (infected, wrong file type or missing)
+    """
+    status = application.get("scan_status")
+    if status == "clean":
+        return
+    if status in (None, "pending"):
+        raise HTTPException(status_code=409, detail="Resume is still being scanned. Please try again shortly.")
+    raise HTTPException(
+        status_code=403,
+        detail=f"Resume quarantined ({status}: {application.get('scan_detail') or 'no details'})"
+    )
+
+
+@router.get("/admin/applications/{application_id}/resume")
+async def download_application_resume(
+    application_id: str,
+    admin=Depends(get_current_admin)
+):
+    """
+    Download resume for a specific application (admin only)
+
+    Args:
+        application_id: Application ID
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        File response with resume
+
+    Raises:
+        HTTPException: If application or file not found, or the resume is
+            not scanned clean
+    """
+    # Find application
+    application = await timed("applications.find_one", database.db.applications.find_one(
+        {"id": application_id},
+        {"_id": 0}
+    ))
+
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    filename = application.get("resume_path")
+    if not filename:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    require_clean_resume(application)
+
+    # Check if file exists
+    filepath = settings.UPLOAD_DIR / filename
+    if not filepath.exists():
+        raise HTTPException(status_code=404, detail="Resume file not found on server")
+
+    # Create display filename
+    display_name = download_name(application.get("name"), filename)
+
+    logger.info("✅ Resume downloaded: %s", application_id)
+
+    return FileResponse(
+        filepath,
+        filename=display_name,
+        media_type='application/octet-stream',
+        headers={
+            "Access-Control-Expose-Headers": "Content-Disposition",
+            "Content-Disposition": f'attachment; filename="{display_name}"'
+        }
+    )
+
+
+@router.post("/admin/applications/{application_id}/resume-link", response_model=DownloadLink)
+async def create_resume_link(
+    application_id: str,
+    request: Request,
+    admin=Depends(get_current_admin)
+):
+    """
+    Mint a short-lived signed download URL for an application's resume (admin only)
+
+    The URL needs no Authorization header, so the browser can download it
+    directly, and it carries no admin token.
+
+    Args:
+        application_id: Application ID
+        request: FastAPI request object
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        Signed URL and its expiry time
+
+    Raises:
+        HTTPException: If application or resume not found, or the resume is
+            not scanned clean
+    """
+    application = await timed("applications.find_one", database.db.applications.find_one(
+        {"id": application_id},
+        {"_id": 0, "name": 1, "resume_path": 1, "scan_status": 1, "scan_detail": 1}
+    ))
+
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    filename = application.get("resume_path")
+    if not filename:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    require_clean_resume(application)
+
+    params = sign_download(filename, download_name(application.get("name"), filename))
+    if settings.DOWNLOAD_BASE_URL:
+        base = f"{settings.DOWNLOAD_BASE_URL.rstrip('/')}/api/files/resumes/{quote(filename)}"
+    else:
+        base = str(request.url_for("download_signed_resume", filename=filename))
+
+    logger.info("✅ Resume link issued: %s", application_id, extra={"admin": admin["email"]})
+
+    return {"url": f"{base}?{urlencode(params)}", "expires_at": expires_at(params["expires"])}
+
+
+async def find_previewable_resume(application_id: str) -> dict:
+    """
+    An application whose resume can be previewed
+
+    Raises:
+        HTTPException: If application or resume not found, or the resume is
+            not scanned clean
+    """
+    application = await timed("applications.find_one", database.db.applications.find_one(
+        {"id": application_id},
+        {"_id": 0, "resume_path": 1, "resume_sha256": 1, "scan_status": 1, "scan_detail": 1}
+    ))
+
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if not application.get("resume_path"):
+        raise HTTPException(status_code=404, detail="Resume not found")
+    require_clean_resume(application)
+    return application
+
+
+async def load_preview(application: dict, with_image: bool = False) -> dict:
+    try:
+        return await get_preview(application["resume_path"], application.get("resume_sha256"), with_image)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume file not found on server")
+    except TimeoutError:
+        raise HTTPException(status_code=503, detail="Preview is taking too long. Please try again shortly.")
+
+
+@router.get("/admin/applications/{application_id}/preview", response_model=ResumePreview)
+async def get_resume_preview(
+    application_id: str,
+    admin=Depends(get_current_admin)
+):
+    """
+    Text snippet and thumbnail details of an application's resume (admin only)
+
+    Args:
+        application_id: Application ID
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        Preview; fetch the thumbnail from /preview.png if has_image
+
+    Raises:
+        HTTPException: If application or resume not found, or the resume is
+            not scanned clean
+    """
+    application = await find_previewable_resume(application_id)
+    return await load_preview(application)
+
+
+@router.get("/admin/applications/{application_id}/preview.png")
+async def get_resume_thumbnail(
+    application_id: str,
+    admin=Depends(get_current_admin)
+):
+    """
+    First-page thumbnail of an application's resume (admin only)
+
+    Args:
+        application_id: Application ID
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        PNG image, cacheable by the browser since it's keyed by content
+
+    Raises:
+        HTTPException: If application or resume not found, the resume is
+            not scanned clean, or it has no thumbnail (not a PDF)
+    """
+    application = await find_previewable_resume(application_id)
+    preview = await load_preview(application, with_image=True)
+    if preview["png"] is None:
+        raise HTTPException(status_code=404, detail="No thumbnail for this resume")
+
+    return Response(
+        content=preview["png"],
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=86400"}
+    )
+
+
+@router.get("/admin/email-logs", response_model=List[EmailLog])
+async def get_email_logs(admin=Depends(get_current_admin), limit: int = 100):
+    """
+    Get email logs (admin only)
+
+    Args:
+        admin: Current authenticated admin (from dependency)
+        limit: Maximum number of logs to return
+
+    Returns:
+        List of email logs sorted by date (newest first)
+    """
+    logs = await timed("email_logs.find", database.db.email_logs.find(
+        {},
+        {"_id": 0}
+    ).sort("sent_at", -1).to_list(limit))
+
+    return logs
+
+
+@router.get("/admin/jobs", response_model=List[JobResponse])
+async def get_admin_jobs(admin=Depends(get_current_admin)):
+    """
+    Get all jobs (admin view with full details)
+
+    Read from the primary, unlike the public catalog, so the dashboard sees
+    job changes as soon as they are written.
+
+    Args:
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        List of all jobs
+    """
+    jobs = await timed("jobs.find", database.db.jobs.find(ACTIVE_JOBS, {"_id": 0}).to_list(200))
+    return jobs
+
+
+@router.post("/admin/jobs", response_model=JobResponse, status_code=201)
+async def create_job(job_data: JobCreate, admin=Depends(get_current_admin)):
+    """
+    Create a new job posting (admin only)
+
+    Args:
+        job_data: Job creation data
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        Created job details
+    """
+    now = datetime.now(timezone.utc).isoformat()
+
+    job = {
+        "id": str(uuid.uuid4()),
+        "slug": slugify(job_data.title),
+        "title": job_data.title,
+        "location": job_data.location,
+        "type": job_data.type,
+        "seniority": job_data.seniority,
+        "description": job_data.description,
+        "tags": job_data.tags,
+        "created_at": now,
+        "updated_at": now
+    }
+
+    await timed("jobs.insert_one", database.db.jobs.insert_one(job))
+    logger.info("✅ Job created: %s", job['title'])
+
+    job.pop("_id", None)
+    await increment_counter("jobs", {"active": 1})
+    job_catalog[job["id"]] = job
+    index_job(job)
+    await broadcast_invalidation("job_catalog")
+    publish_event("job.created", job_event(job))
+    return job
+
+
+@router.put("/admin/jobs/{job_id}", response_model=JobResponse)
+async def update_job(
+    job_id: str,
+    job_data: JobUpdate,
+    admin=Depends(get_current_admin)
+):
+    """
+    Update an existing job posting (admin only)
+
+    Args:
+        job_id: Job ID
+        job_data: Job update data
+        admin: Current authenticated admin (from dependency)
+
+    Returns:
+        Updated job details
+
+    Raises:
+        HTTPException: If job not found
+    """
+    # Check if job exists
+    existing = await timed("jobs.find_one", database.db.jobs.find_one({"id": job_id, **ACTIVE_JOBS}, {"_id": 0}))
+    if not existing:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Prepare update fields
+    update_fields = {
+        k: v for k, v in job_data.model_dump().items()
+        if v is not None
+    }
+
+    # Update slug if title changed
+    if "title" in update_fields:
+        update_fields["slug"] = slugify(update_fields["title"])
+
+    update_fields["updated_at"] = datetime.now(timezone.utc).isoformat()
+
+    # Update in database
+    await timed("jobs.update_one", database.db.jobs.update_one({"id": job_id}, {"$set": update_fields}))
+
+    # Get updated job
+    updated = await timed("jobs.find_one", database.db.jobs.find_one({"id": job_id}, {"_id": 0}))
+    job_catalog[job_id] = updated
+    index_job(updated)
+    await broadcast_invalidation("job_catalog")
+    publish_event("job.updated", job_event(updated))
+
+    # Keep applications' denormalized job title in step with renames
+    if updated["title"] != existing["title"]:
+        run_in_background(propagate_job_title(job_id, updated["title"]))
+
+    logger.info("✅ Job updated: %s", job_id)
+
+    return updated
+
+
+@router.delete("/admin/jobs/{job_id}", status_code=204)
+async def delete_job(job_id: str, admin=Depends(get_current_admin)):
+    """
+    Delete a job posting (admin only)
+
+    The job is soft-archived: it disappears from listings, while existing
+    applications keep their job ID and title.
+
+    Args:
+        job_id: Job ID
+        admin: Current authenticated admin (from dependency)
+
+    Raises:
+        HTTPException: If job not found
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    result = await timed("jobs.update_one", database.db.jobs.update_one(
+        {"id": job_id, **ACTIVE_JOBS},
+        {"$set": {"archived": True, "archived_at": now, "updated_at": now}}
+    ))
+
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    await increment_counter("jobs", {"active": -1})
+    archived = job_catalog.pop(job_id, {"id": job_id})
+    unindex_job(job_id)
+    await broadcast_invalidation("job_catalog")
+    publish_event("job.archived", job_event(archived))
+    logger.info("✅ Job deleted: %s", job_id)
+
+    return None
@@ -0,0 +1,310 @@
+"""
+Project P Innovations - Application Routes
+Public application submission and the email test endpoint
+"""
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from fastapi import APIRouter, File, Form, HTTPException, Request, Response, UploadFile
+from pymongo.errors import DuplicateKeyError
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.events import application_event
+from projectp.services.catalog import get_catalog_job
+from projectp.services.email import TEST_EMAIL_HTML, send_email
+from projectp.services.live_events import publish_event
+from projectp.services.rate_limit import enforce_rate_limit
+from projectp.services.resumes import delete_unreferenced_resume, resume_followups, write_resume
+from projectp.services.scoring import application_text_changed, index_application
+from projectp.services.tasks import enqueue_all
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api")
+
+
+async def find_duplicate(job_id: Optional[str], email: str, resume_sha256: str) -> Optional[dict]:
+    """The original application with this email, or this exact resume, for the job"""
+    return await timed("applications.find_one", database.db.applications.find_one(
+        {
+            "job_id": job_id,
+            "duplicate_of": None,
+            "$or": [{"email": email}, {"resume_sha256": resume_sha256}]
+        },
+        {"_id": 0, "resume_text": 0}
+    ))
+
+
+def reject_duplicate(duplicate: dict):
+    """
+    Raises:
+        HTTPException: 409 for a duplicate under the reject policy
+    """
+    logger.info("⚠️ Duplicate application rejected: %s", duplicate['id'])
+    raise HTTPException(
+        status_code=409,
+        detail="An application for this position has already been submitted"
+    )
+
+
+async def merge_duplicate(duplicate: dict, submission: dict) -> dict:
+    """
+    Update the original application with a resubmission (merge policy)
+
+    The resubmitted resume replaces the original; the original's stored file
+    is deleted unless another application still uses it.
+
+    Args:
+        duplicate: Original application
+        submission: name, message and resume fields of the resubmission
+
+    Returns:
+        Response body for the merged submission
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    merged_fields = {
+        **submission,
+        "message": submission["message"] or duplicate.get("message"),
+        "updated_at": now,
+        "text_updated_at": now
+    }
+    await timed("applications.update_one", database.db.applications.update_one(
+        {"id": duplicate["id"]},
+        {"$set": merged_fields, "$inc": {"submission_count": 1}}
+    ))
+    if duplicate.get("resume_path") and duplicate["resume_path"] != merged_fields["resume_path"]:
+        await delete_unreferenced_resume(duplicate["resume_path"])
+
+    await application_text_changed({**duplicate, **merged_fields})
+    followups = resume_followups(
+        duplicate["id"], merged_fields["resume_path"], merged_fields["resume_text"], merged_fields["scan_status"]
+    )
+    if followups:
+        await enqueue_all(followups)
+    publish_event("application.updated", application_event({**duplicate, **merged_fields}))
+    logger.info("✅ Duplicate application merged: %s", duplicate['id'])
+
+    return {
+        "success": True,
+        "message": "Application updated successfully",
+        "id": duplicate["id"],
+        "duplicate": True
+    }
+
+
+@router.post("/apply", status_code=201)
+async def submit_application(
+    request: Request,
+    response: Response,
+    name: str = Form(..., min_length=2, max_length=100),
+    email: str = Form(...),
+    message: str = Form(None, max_length=1000),
+    job_id: str = Form(None),
+    resume: UploadFile = File(...)
+):
+    """
+    Submit a job application
+
+    Duplicates (same email and job, or an identical resume for the same job)
+    are detected before anything is written and handled per DUPLICATE_POLICY;
+    unique indexes catch concurrent submissions that pass the check together.
+    The response is sent once the application is stored; the resume scan,
+    text extraction, counters and the notification email run from the task
+    queue.
+
+    Args:
+        request: FastAPI request object
+        response: FastAPI response (status set to 200 when merged)
+        name: Applicant name
+        email: Applicant email
+        message: Optional application message
+        job_id: Optional job ID
+        resume: Resume file (PDF, DOC, DOCX)
+
+    Returns:
+        Success message with application ID
+
+    Raises:
+        HTTPException: If validation fails, rate limit exceeded or duplicate rejected
+    """
+    # Rate limiting
+    client_ip = request.client.host
+    await enforce_rate_limit(client_ip, settings.APPLY_RATE_LIMIT, settings.APPLY_RATE_LIMIT_WINDOW_SECONDS)
+
+    # Validate file extension
+    file_ext = Path(resume.filename).suffix.lower()
+    if file_ext not in settings.ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+        )
+
+    # Validate file size while reading, so oversized uploads stop early
+    digest = hashlib.sha256()
+    chunks = []
+    size = 0
+    while chunk := await resume.read(settings.UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > settings.MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds {settings.MAX_FILE_SIZE // (1024 * 1024)}MB limit"
+            )
+        digest.update(chunk)
+        chunks.append(chunk)
+    content = b"".join(chunks)
+
+    email = email.strip().lower()
+    resume_sha256 = digest.hexdigest()
+
+    # Duplicate check (indexed) before any file write or email
+    duplicate = await find_duplicate(job_id, email, resume_sha256)
+
+    if duplicate and settings.DUPLICATE_POLICY == "reject":
+        reject_duplicate(duplicate)
+
+    # Reuse the stored file when this exact resume was uploaded before
+    same_file = await timed("applications.find_one", database.db.applications.find_one(
+        {"resume_sha256": resume_sha256},
+        {"_id": 0, "resume_path": 1, "resume_text": 1, "scan_status": 1}
+    ))
+
+    if same_file:
+        filename = same_file["resume_path"]
+        resume_text = same_file.get("resume_text", "")
+        # A pending scan is queued again below; it covers this application too
+        scan_status = same_file.get("scan_status") or "pending"
+    else:
+        # Save file with UUID name
+        file_id = str(uuid.uuid4())
+        filename = f"{file_id}{file_ext}"
+
+        await asyncio.to_thread(write_resume, filename, content)
+
+        logger.info("✅ Resume saved: %s", filename)
+
+        # Quarantined until scanned; the text is extracted once it is clean
+        resume_text = ""
+        scan_status = "pending"
+
+    submission = {
+        "name": name,
+        "message": message,
+        "resume_path": filename,
+        "resume_sha256": resume_sha256,
+        "original_filename": resume.filename,
+        "resume_text": resume_text,
+        "scan_status": scan_status
+    }
+
+    if duplicate and settings.DUPLICATE_POLICY == "merge":
+        response.status_code = 200
+        return await merge_duplicate(duplicate, submission)
+
+    # Get job title if job_id provided (served from the catalog cache)
+    job_title = None
+    if job_id:
+        job = await get_catalog_job(job_id)
+        if job:
+            job_title = job["title"]
+
+    # Create application record
+    application_id = str(uuid.uuid4())
+    application = {
+        "id": application_id,
+        **submission,
+        "email": email,
+        "job_id": job_id,
+        "job_title": job_title,
+        "duplicate_of": duplicate["id"] if duplicate else None,
+        "submission_count": 1,
+        "created_at": datetime.now(timezone.utc).isoformat()
+    }
+
+    try:
+        await timed("applications.insert_one", database.db.applications.insert_one(application))
+    except DuplicateKeyError:
+        # A concurrent submission won the unique (job_id, email) or
+        # (job_id, resume_sha256) index after our check: apply the policy now
+        application.pop("_id", None)
+        duplicate = await find_duplicate(job_id, email, resume_sha256)
+        if duplicate is None:
+            raise
+        if settings.DUPLICATE_POLICY == "reject":
+            if not same_file:
+                await delete_unreferenced_resume(filename)
+            reject_duplicate(duplicate)
+        if settings.DUPLICATE_POLICY == "merge":
+            response.status_code = 200
+            return await merge_duplicate(duplicate, submission)
+        application["duplicate_of"] = duplicate["id"]
+        await timed("applications.insert_one", database.db.applications.insert_one(application))
+
+    # Post-commit work, queued in one go
+    followups = [("count_application", {"job_id": job_id, "job_title": job_title, "created_at": application["created_at"]})]
+    followups += resume_followups(application_id, filename, resume_text, scan_status)
+    if resume_text:
+        index_application(application)
+    if not duplicate:
+        # flag policy keeps duplicates for review, but doesn't notify again
+        followups.append(("application_email", {
+            "name": name,
+            "email": email,
+            "job_title": job_title,
+            "message": message,
+            "filename": resume.filename
+        }))
+    await enqueue_all(followups)
+    publish_event("application.created", application_event(application))
+
+    if duplicate:
+        logger.info("⚠️ Duplicate application flagged: %s -> %s", application_id, duplicate['id'])
+        return {
+            "success": True,
+            "message": "Application submitted successfully",
+            "id": application_id,
+            "duplicate_of": duplicate["id"]
+        }
+
+    logger.info(
+        "✅ Application created: %s", application_id,
+        extra={"application_id": application_id, "job_id": job_id}
+    )
+
+    return {
+        "success": True,
+        "message": "Application submitted successfully",
+        "id": application_id
+    }
+
+
+@router.get("/test-email")
+async def test_email_endpoint():
+    """
+    Test email functionality
+
+    Returns:
+        Success message with email log ID
+    """
+    subject = "✅ Test Email - Project P Innovations"
+    result = await send_email(settings.EMAIL_TO, subject, TEST_EMAIL_HTML)
+
+    if result["success"]:
+        return {
+            "success": True,
+            "message": "Test email sent successfully",
+            "email_log_id": result["email_log_id"],
+            "resend_id": result.get("resend_id", "")
+        }
+    else:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to send email: {result.get('error', 'Unknown error')}"
+        )
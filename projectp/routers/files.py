@@ -0,0 +1,54 @@
+"""
+Project P Innovations - File Routes
+Resume downloads through signed links (no session or database lookup)
+"""
+
+import time
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from projectp import settings
+from projectp.services.downloads import verify_download
+
+router = APIRouter(prefix="/api")
+
+
+@router.get("/files/resumes/{filename}", name="download_signed_resume")
+async def download_signed_resume(filename: str, expires: int, name: str, signature: str):
+    """
+    Download a resume through a link minted by the admin resume-link route
+
+    Args:
+        filename: Stored resume file name
+        expires: Link expiry (Unix time)
+        name: File name offered to the browser
+        signature: Link signature
+
+    Returns:
+        File response with resume
+
+    Raises:
+        HTTPException: If the link is invalid or expired, or the file is missing
+    """
+    verify_download(filename, expires, name, signature)
+
+    # Only plain file names inside the upload directory
+    filepath = settings.UPLOAD_DIR / filename
+    if filepath.parent != settings.UPLOAD_DIR or not filepath.is_file():
+        raise HTTPException(status_code=404, detail="File not found")
+
+    # The URL is the credential: browsers may reuse it until it expires,
+    # shared caches may not
+    max_age = max(0, expires - int(time.time()))
+    return FileResponse(
+        filepath,
+        filename=name,
+        media_type='application/octet-stream',
+        headers={
+            "Access-Control-Expose-Headers": "Content-Disposition",
+            "Content-Disposition": f'attachment; filename="{name}"',
+            "Cache-Control": f"private, max-age={max_age}",
+            "Referrer-Policy": "no-referrer"
+        }
+    )
@@ -0,0 +1,70 @@
+"""
+Project P Innovations - Health Routes
+Liveness, readiness and MongoDB pool probes
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from projectp import settings
+from projectp.database import check_mongo, pool_monitor
+from projectp.models import HealthResponse
+from projectp.services.health import check_readiness
+
+router = APIRouter(prefix="/api")
+
+
+@router.get("/health", response_model=HealthResponse)
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "ok"}
+
+
+@router.get("/health/live", response_model=HealthResponse)
+async def liveness_check():
+    """
+    Liveness probe: the process is up and the event loop is serving requests
+
+    Deliberately touches no dependencies, so a database outage doesn't
+    cause the orchestrator to restart healthy pods.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: MongoDB ping latency, upload directory writability and
+    free space, and email backlog (cached for READY_CACHE_SECONDS)
+
+    Returns:
+        Check details (503 if any check fails)
+    """
+    result = await check_readiness()
+    body = {"status": "ready" if result["ready"] else "not_ready", **result}
+    if not result["ready"]:
+        return JSONResponse(status_code=503, content=body)
+    return body
+
+
+@router.get("/health/mongo")
+async def mongo_health():
+    """
+    MongoDB connectivity and connection pool utilisation
+
+    Returns:
+        Ping result and per-server pool counters (503 if MongoDB is unreachable)
+    """
+    mongo = await check_mongo()
+    body = {
+        "status": "ok" if mongo["connected"] else "unavailable",
+        "mongo": mongo,
+        "pool": {
+            "max_size": settings.MONGO_MAX_POOL_SIZE,
+            "min_size": settings.MONGO_MIN_POOL_SIZE,
+            "servers": pool_monitor.snapshot()
+        }
+    }
+    if not mongo["connected"]:
+        return JSONResponse(status_code=503, content=body)
+    return body
@@ -0,0 +1,59 @@
+"""
+Project P Innovations - Public Job Routes
+Job listings served through the catalog read profile
+"""
+
+from typing import List
+
+from fastapi import APIRouter, HTTPException
+
+from projectp import database
+from projectp.database import timed
+from projectp.models import JobResponse
+from projectp.services.catalog import ACTIVE_JOBS
+
+router = APIRouter(prefix="/api")
+
+
+@router.get("/jobs", response_model=List[JobResponse])
+async def get_jobs(limit: int = 100):
+    """
+    Get all job listings
+
+    Served through the catalog read profile, so results may come from a
+    secondary up to CATALOG_MAX_STALENESS_SECONDS behind the primary.
+
+    Args:
+        limit: Maximum number of jobs to return (default: 100)
+
+    Returns:
+        List of job postings
+    """
+    jobs = await timed("jobs.find", database.catalog_db.jobs.find(ACTIVE_JOBS, {"_id": 0}).to_list(limit))
+    return jobs
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """
+    Get a specific job by ID or slug (catalog read profile)
+
+    Args:
+        job_id: Job ID or slug
+
+    Returns:
+        Job posting details
+
+    Raises:
+        HTTPException: If job not found
+    """
+    # Match by ID or slug in a single round trip
+    job = await timed("jobs.find_one", database.catalog_db.jobs.find_one(
+        {"$or": [{"id": job_id}, {"slug": job_id}], **ACTIVE_JOBS},
+        {"_id": 0}
+    ))
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
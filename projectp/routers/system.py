@@ -0,0 +1,55 @@
+"""
+Project P Innovations - System Routes
+Metrics scrape endpoint, token verification keys and API root
+"""
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from projectp import settings
+from projectp.metrics import REGISTRY
+from projectp.services import tasks
+from projectp.services.signing_keys import jwks
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus text exposition of this worker's request, MongoDB, email, file, bcrypt and task queue metrics"""
+    if settings.METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {settings.METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    try:
+        await tasks.queue_depth()
+    except Exception:
+        pass  # The gauge keeps its last value
+
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get("/.well-known/jwks.json")
+async def json_web_key_set():
+    """
+    Public keys that verify admin access tokens (JWK Set)
+
+    Edge proxies can verify tokens with these keys. Cached for less than
+    JWT_KEY_PUBLISH_AHEAD_SECONDS, so caches see a new key before it signs.
+    """
+    max_age = min(300, settings.JWT_KEY_PUBLISH_AHEAD_SECONDS // 2)
+    return JSONResponse(jwks(), headers={"Cache-Control": f"public, max-age={max_age}"})
+
+
+@router.get("/")
+async def root():
+    """Root endpoint"""
+    return {
+        "message": "Project P Innovations API",
+        "version": "1.0.0",
+        "status": "running",
+        "docs": "/docs",
+        "health": "/api/health"
+    }
@@ -0,0 +1,144 @@
+"""
+Project P Innovations - Resume Scanning
+File type sniffing and malware scanners, run in a separate process pool
+
+Everything here works on a file path and plain arguments and imports no
+application modules, so hostile files are only ever parsed in the scan
+worker processes (see services/resumes.py), never in the API process.
+
+Scanners take (path, options) and return (verdict, detail) with verdict
+"clean" or "infected"; they raise when they cannot decide, so the scan is
+retried. "stub" only recognizes the EICAR test file; "clamd" streams the
+file to a ClamAV daemon (or anything speaking its INSTREAM protocol).
+"""
+
+import socket
+import struct
+import zipfile
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# Leading bytes of each accepted resume type
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_MAGIC = b"PK\x03\x04"
+
+EICAR_SIGNATURE = b"X5O!P%@AP[4\\PZX54(P^)7CC)7}$EICAR-STANDARD-ANTIVIRUS-TEST-FILE!$H+H*"
+
+CLAMD_CHUNK_SIZE = 64 * 1024
+
+
+def sniff_type(path: str, ext: str) -> Optional[str]:
+    """
+    Check that a file's content matches its extension
+
+    Args:
+        path: File to check
+        ext: Extension it was uploaded with (e.g. ".pdf")
+
+    Returns:
+        None if it matches (or the type has no known signature), else why not
+    """
+    with open(path, "rb") as f:
+        head = f.read(1024)
+
+    if ext == ".pdf":
+        # Readers accept junk before the header, so look at the first 1 KB
+        return None if b"%PDF-" in head else "not a PDF file"
+    if ext == ".doc":
+        return None if head.startswith(OLE_MAGIC) else "not a Word 97-2003 file"
+    if ext == ".docx":
+        if not head.startswith(ZIP_MAGIC):
+            return "not a DOCX file"
+        try:
+            with zipfile.ZipFile(path) as archive:
+                if "word/document.xml" not in archive.namelist():
+                    return "DOCX file has no document body"
+        except zipfile.BadZipFile:
+            return "corrupt DOCX file"
+    return None
+
+
+def scan_stub(path: str, options: dict) -> Tuple[str, str]:
+    """Local stand-in for a virus scanner: flags the EICAR test file only"""
+    with open(path, "rb") as f:
+        content = f.read()
+    if EICAR_SIGNATURE in content:
+        return "infected", "Eicar-Test-Signature"
+    return "clean", "stub scanner"
+
+
+def scan_clamd(path: str, options: dict) -> Tuple[str, str]:
+    """
+    Scan with clamd's INSTREAM command
+
+    Args:
+        path: File to scan
+        options: clamd_url (tcp://host:port or unix:///path/to/socket) and timeout
+
+    Raises:
+        RuntimeError: If clamd reports an error (e.g. the file exceeds StreamMaxLength)
+        OSError: If clamd is unreachable
+    """
+    url = urlparse(options["clamd_url"])
+    if url.scheme == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = url.path
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = (url.hostname or "127.0.0.1", url.port or 3310)
+
+    with sock:
+        sock.settimeout(options["timeout"])
+        sock.connect(address)
+        sock.sendall(b"zINSTREAM\0")
+        with open(path, "rb") as f:
+            while chunk := f.read(CLAMD_CHUNK_SIZE):
+                sock.sendall(struct.pack("!L", len(chunk)) + chunk)
+        sock.sendall(struct.pack("!L", 0))
+
+        reply = b""
+        while not reply.endswith(b"\0"):
+            data = sock.recv(4096)
+            if not data:
+                break
+            reply += data
+
+    # "stream: OK", "stream: <signature> FOUND" or "<message> ERROR"
+    answer = reply.rstrip(b"\0").decode("utf-8", "replace").strip()
+    if answer.endswith("FOUND"):
+        return "infected", answer.removeprefix("stream:").removesuffix("FOUND").strip()
+    if answer.endswith("OK"):
+        return "clean", "clamd"
+    raise RuntimeError(f"clamd: {answer or 'no reply'}")
+
+
+SCANNERS: Dict[str, Callable[[str, dict], Tuple[str, str]]] = {
+    "stub": scan_stub,
+    "clamd": scan_clamd
+}
+
+
+def scan_file(path: str, ext: str, scanner: str, options: dict) -> Tuple[str, str]:
+    """
+    Sniff and scan one file (runs in a scan worker process)
+
+    Returns:
+        (verdict, detail) with verdict "clean", "infected" or "rejected"
+        (content doesn't match the extension)
+    """
+    problem = sniff_type(path, ext)
+    if problem:
+        return "rejected", problem
+    return SCANNERS[scanner](path, options)
+
+
+def limit_worker_memory(limit_mb: int):
+    """Scan worker initializer: cap the address space so a hostile file can't exhaust memory"""
+    if limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
@@ -0,0 +1,367 @@
+"""
+Project P Innovations - Database Seeding
+Idempotent fixture loading from seed_data.json and synthetic datasets for
+load and benchmark testing
+
+Usage:
+    python -m projectp.seeding                      # indexes, fixtures, counters
+    python -m projectp.seeding --data other.json    # fixtures from another file
+    python -m projectp.seeding --jobs 10000 --applications 100000
+    python -m projectp.seeding --purge-synthetic
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pymongo import ReplaceOne, UpdateOne
+
+from projectp.metrics import BCRYPT_LATENCY
+
+logger = logging.getLogger(__name__)
+
+SEED_DATA_FILE = Path(__file__).parent / "seed_data.json"
+
+# Documents per bulk_write round trip
+BATCH_SIZE = 1000
+
+# Synthetic documents get deterministic IDs from this namespace, so reruns
+# with the same size and random seed replace rather than duplicate them
+SYNTHETIC_NAMESPACE = uuid.UUID("6f1c2a4e-3b7d-4e0a-9c55-2d8f1e7b9a10")
+
+
+def load_seed_data(path: Path = SEED_DATA_FILE) -> dict:
+    """
+    Read admins and jobs from a seed data file
+
+    SEED_ADMIN_PASSWORD, when set, replaces the passwords in the file.
+
+    Args:
+        path: JSON file with "admins" and "jobs" lists
+
+    Returns:
+        Dictionary with "admins" and "jobs"
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    password = os.environ.get("SEED_ADMIN_PASSWORD")
+    if password:
+        for admin in data.get("admins", []):
+            admin["password"] = password
+
+    return {"admins": data.get("admins", []), "jobs": data.get("jobs", [])}
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt (same scheme the login route verifies)"""
+    import bcrypt
+
+    with BCRYPT_LATENCY.time("hash"):
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode("utf-8")
+
+
+async def bulk_write(collection, operations: list) -> int:
+    """
+    Run write operations in unordered batches
+
+    Returns:
+        Number of documents inserted by upserts
+    """
+    upserted = 0
+    for start in range(0, len(operations), BATCH_SIZE):
+        result = await collection.bulk_write(operations[start:start + BATCH_SIZE], ordered=False)
+        upserted += result.upserted_count
+    return upserted
+
+
+async def seed_admins(db, admins: List[dict]) -> int:
+    """
+    Create missing admin users, keyed on email
+
+    Existing admins (and their passwords) are left untouched, and only new
+    admins pay for a bcrypt hash.
+
+    Args:
+        db: Motor database
+        admins: Dictionaries with "email" and "password"
+
+    Returns:
+        Number of admins created
+    """
+    emails = [admin["email"].lower() for admin in admins]
+    existing = {
+        doc["email"]
+        for doc in await db.admins.find({"email": {"$in": emails}}, {"_id": 0, "email": 1}).to_list(None)
+    }
+    missing = [admin for admin in admins if admin["email"].lower() not in existing]
+    if not missing:
+        return 0
+
+    hashes = await asyncio.gather(*(
+        asyncio.to_thread(hash_password, admin["password"]) for admin in missing
+    ))
+    now = datetime.now(timezone.utc).isoformat()
+    created = await bulk_write(db.admins, [
+        UpdateOne(
+            {"email": admin["email"].lower()},
+            {"$setOnInsert": {"id": str(uuid.uuid4()), "password": hashed, "created_at": now}},
+            upsert=True
+        )
+        for admin, hashed in zip(missing, hashes)
+    ])
+    if created:
+        logger.info("✅ Admin users seeded: %s", ", ".join(admin["email"] for admin in missing))
+    return created
+
+
+async def seed_jobs(db, jobs: List[dict], overwrite: bool = False) -> int:
+    """
+    Create jobs from fixtures, keyed on slug
+
+    Args:
+        db: Motor database
+        jobs: Job fields without id or timestamps
+        overwrite: Also reset existing jobs to the fixture content
+
+    Returns:
+        Number of jobs created
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    operations = []
+    for job in jobs:
+        fields = {key: value for key, value in job.items() if key != "slug"}
+        on_insert = {"id": str(uuid.uuid4()), "created_at": now, "updated_at": now}
+        if overwrite:
+            update = {"$set": {**fields, "updated_at": now}, "$setOnInsert": {"id": on_insert["id"], "created_at": now}}
+        else:
+            update = {"$setOnInsert": {**fields, **on_insert}}
+        operations.append(UpdateOne({"slug": job["slug"]}, update, upsert=True))
+
+    created = await bulk_write(db.jobs, operations) if operations else 0
+    logger.info("✅ Jobs seeded: %s created, %s already present", created, len(jobs) - created)
+    return created
+
+
+# ============================================================================
+# SYNTHETIC DATASETS
+# ============================================================================
+
+ROLES = [
+    "AI Engineer", "ML Engineer", "Data Engineer", "Data Scientist", "Backend Engineer",
+    "Frontend Engineer", "Platform Engineer", "Research Scientist", "Product Manager",
+    "Solutions Architect", "DevOps Engineer", "Analytics Engineer"
+]
+SENIORITIES = ["Junior", "Mid-Level", "Senior", "Lead"]
+LOCATIONS = ["Remote", "Remote / London", "Hybrid / London", "Hybrid / San Francisco", "Remote / Bangalore"]
+JOB_TYPES = ["Full-time", "Full-time", "Full-time", "Contract"]
+SKILLS = [
+    "Python", "PyTorch", "TensorFlow", "LLMs", "MLOps", "SQL", "Airflow", "Spark", "Kubernetes",
+    "AWS", "GCP", "React", "TypeScript", "FastAPI", "MongoDB", "Docker", "Computer Vision",
+    "NLP", "Scikit-learn", "Go", "Rust", "Terraform", "Kafka", "Research", "Agile"
+]
+WORDS = [
+    "built", "designed", "deployed", "scaled", "led", "maintained", "optimised", "pipelines",
+    "models", "services", "platform", "production", "team", "customers", "latency", "data",
+    "training", "inference", "experiments", "dashboards", "migration", "architecture", "testing"
+]
+FIRST_NAMES = ["Aisha", "Ben", "Chen", "Diego", "Elena", "Farah", "George", "Hana", "Ivan", "Jaya", "Kofi", "Lena"]
+LAST_NAMES = ["Patel", "Smith", "Wang", "Garcia", "Ivanova", "Khan", "Brown", "Sato", "Novak", "Rao", "Mensah", "Meyer"]
+
+
+def synthetic_id(kind: str, index: int) -> str:
+    return str(uuid.uuid5(SYNTHETIC_NAMESPACE, f"{kind}-{index}"))
+
+
+def generate_jobs(count: int, rng: random.Random) -> List[dict]:
+    """
+    Build synthetic job documents
+
+    Args:
+        count: Number of jobs
+        rng: Random source (seeded for reproducible datasets)
+
+    Returns:
+        Job documents marked ``synthetic: True``
+    """
+    now = datetime.now(timezone.utc)
+    jobs = []
+    for index in range(count):
+        seniority = rng.choice(SENIORITIES)
+        role = rng.choice(ROLES)
+        tags = rng.sample(SKILLS, 4)
+        created_at = (now - timedelta(days=rng.randint(0, 365))).isoformat()
+        jobs.append({
+            "id": synthetic_id("job", index),
+            "slug": f"synthetic-{seniority}-{role}-{index}".lower().replace(" ", "-"),
+            "title": f"{seniority} {role}",
+            "location": rng.choice(LOCATIONS),
+            "type": rng.choice(JOB_TYPES),
+            "seniority": seniority,
+            "description": f"Work on {', '.join(tags)} " + " ".join(rng.choices(WORDS, k=30)),
+            "tags": tags,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "synthetic": True
+        })
+    return jobs
+
+
+def generate_applications(
+    count: int,
+    jobs: List[dict],
+    rng: random.Random,
+    start: int = 0,
+    days: int = 90
+) -> List[dict]:
+    """
+    Build synthetic application documents spread over recent days
+
+    Args:
+        count: Number of applications
+        jobs: Jobs to apply to
+        rng: Random source (seeded for reproducible datasets)
+        start: Index of the first application (for generating in chunks)
+        days: How far back created_at values go
+
+    Returns:
+        Application documents marked ``synthetic: True``
+    """
+    now = datetime.now(timezone.utc)
+    applications = []
+    for index in range(start, start + count):
+        job = rng.choice(jobs) if jobs else None
+        skills = rng.sample(SKILLS, 6)
+        if job:
+            skills += rng.sample(job["tags"], 2)
+        application_id = synthetic_id("application", index)
+        applications.append({
+            "id": application_id,
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": f"candidate{index}@example.com",
+            "message": " ".join(rng.choices(WORDS, k=12)),
+            "job_id": job["id"] if job else None,
+            "job_title": job["title"] if job else None,
+            "resume_path": f"{application_id}.pdf",
+            "resume_sha256": hashlib.sha256(application_id.encode("utf-8")).hexdigest(),
+            "original_filename": "resume.pdf",
+            "resume_text": " ".join(skills + rng.choices(WORDS, k=80)),
+            # No file is written, so there is nothing to scan or download
+            "scan_status": "missing",
+            "scan_detail": "synthetic application, no file",
+            "duplicate_of": None,
+            "submission_count": 1,
+            "created_at": (now - timedelta(seconds=rng.randint(0, days * 86400))).isoformat(),
+            "synthetic": True
+        })
+    return applications
+
+
+async def seed_synthetic(db, job_count: int, application_count: int, random_seed: int = 42) -> Dict[str, int]:
+    """
+    Write a synthetic dataset, replacing a previous one of the same shape
+
+    Args:
+        db: Motor database
+        job_count: Number of jobs
+        application_count: Number of applications
+        random_seed: Seed for reproducible content
+
+    Returns:
+        Number of jobs and applications written
+    """
+    rng = random.Random(random_seed)
+    jobs = generate_jobs(job_count, rng)
+    if jobs:
+        await bulk_write(db.jobs, [ReplaceOne({"id": job["id"]}, job, upsert=True) for job in jobs])
+    if not jobs:
+        jobs = await db.jobs.find({"archived": {"$ne": True}}, {"_id": 0, "id": 1, "title": 1, "tags": 1}).to_list(None)
+
+    # Generated in chunks so 100k+ applications never sit in memory at once
+    written = 0
+    chunk_size = BATCH_SIZE * 10
+    for start in range(0, application_count, chunk_size):
+        chunk = generate_applications(min(chunk_size, application_count - start), jobs, rng, start)
+        await bulk_write(db.applications, [ReplaceOne({"id": a["id"]}, a, upsert=True) for a in chunk])
+        written += len(chunk)
+        logger.info("⏳ Synthetic applications written: %s/%s", written, application_count)
+
+    logger.info("✅ Synthetic dataset seeded: %s jobs, %s applications", job_count, written)
+    return {"jobs": job_count, "applications": written}
+
+
+async def purge_synthetic(db) -> Dict[str, int]:
+    """Delete all synthetic jobs and applications"""
+    jobs = await db.jobs.delete_many({"synthetic": True})
+    applications = await db.applications.delete_many({"synthetic": True})
+    logger.info("🗑️ Synthetic data purged: %s jobs, %s applications", jobs.deleted_count, applications.deleted_count)
+    return {"jobs": jobs.deleted_count, "applications": applications.deleted_count}
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Seed the Project P Innovations database")
+    parser.add_argument("--data", type=Path, default=SEED_DATA_FILE, help="Fixture file (default: seed_data.json)")
+    parser.add_argument("--overwrite", action="store_true", help="Reset existing fixture jobs to the file content")
+    parser.add_argument("--jobs", type=int, default=0, help="Synthetic jobs to generate")
+    parser.add_argument("--applications", type=int, default=0, help="Synthetic applications to generate")
+    parser.add_argument("--random-seed", type=int, default=42, help="Seed for synthetic content")
+    parser.add_argument("--purge-synthetic", action="store_true", help="Delete synthetic data and exit")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> bool:
+    """Run the seeding command against the configured database"""
+    # Imported here: startup seeding imports this module from the services
+    from projectp import database
+    from projectp.services.counters import rebuild_counters
+
+    database.connect()
+    db = database.db
+    try:
+        if args.purge_synthetic:
+            await purge_synthetic(db)
+            await rebuild_counters(force=True)
+            return True
+
+        await database.ensure_indexes()
+        data = load_seed_data(args.data)
+        await seed_admins(db, data["admins"])
+        await seed_jobs(db, data["jobs"], overwrite=args.overwrite)
+        if args.jobs or args.applications:
+            await seed_synthetic(db, args.jobs, args.applications, args.random_seed)
+
+        await rebuild_counters(force=True)
+        return True
+    except Exception as e:
+        logger.error("❌ Seeding failed: %s", e)
+        return False
+    finally:
+        database.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from projectp import settings
+    from projectp.logging_config import configure_logging, stop_logging
+
+    configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
+    try:
+        return 0 if asyncio.run(run(parse_args(argv))) else 1
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Project P Innovations - Server Entry Point
+Run the API under uvicorn with WEB_CONCURRENCY worker processes
+
+With WEB_CONCURRENCY=0 there is one worker per available CPU core. Workers
+share rate limits (RATE_LIMIT_BACKEND=mongo), live events
+(EVENTS_SOURCE=change_streams) and cache invalidations
+(CACHE_SYNC_INTERVAL_SECONDS) through MongoDB; settings validation rejects
+more than one worker without the first two. /metrics is per worker (see
+projectp/metrics.py).
+
+Usage:
+    python -m projectp.serve --port 8000
+    WEB_CONCURRENCY=4 RATE_LIMIT_BACKEND=mongo EVENTS_SOURCE=change_streams python -m projectp.serve
+"""
+
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from projectp import settings
+from projectp.logging_config import configure_logging, stop_logging
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    """CPU cores this process may run on (respects affinity masks)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(configured: int) -> int:
+    """
+    Number of worker processes to start
+
+    Args:
+        configured: WEB_CONCURRENCY (0 = one per CPU core)
+
+    Returns:
+        Worker count, at least 1
+    """
+    return configured or available_cpus()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Project P Innovations API")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    args = parser.parse_args(argv)
+
+    configure_logging(level=settings.LOG_LEVEL, fmt=settings.LOG_FORMAT)
+    workers = worker_count(settings.WEB_CONCURRENCY)
+    logger.info("🚀 Starting %s worker(s) on %s:%s (%s profile)", workers, args.host, args.port, settings.APP_ENV)
+    stop_logging()
+
+    import uvicorn
+
+    uvicorn.run(
+        "projectp.main:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        proxy_headers=True
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""
+Project P Innovations - Services
+Application logic shared by the routers and the startup lifecycle
+"""
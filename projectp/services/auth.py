@@ -0,0 +1,122 @@
+"""
+Project P Innovations - Admin Authentication
+Access token issue/verify, password checks and the current-admin dependency
+"""
+
+import asyncio
+from datetime import datetime, timezone, timedelta
+
+import jwt
+from fastapi import HTTPException, Request
+
+from projectp import settings
+from projectp.metrics import BCRYPT_LATENCY
+from projectp.services import revocation, signing_keys
+
+
+def create_access_token(email: str, session_id: str) -> str:
+    """
+    Create a short-lived access token for admin authentication
+
+    Args:
+        email: Admin email address
+        session_id: Session the token belongs to (see services/sessions.py)
+
+    Returns:
+        Encoded JWT token string
+    """
+    now = datetime.now(timezone.utc)
+    payload = {
+        "iss": settings.JWT_ISSUER,
+        "sub": email,
+        "sid": session_id,
+        "typ": "access",
+        "exp": now + timedelta(minutes=settings.ACCESS_TOKEN_TTL_MINUTES),
+        "iat": now
+    }
+    if not signing_keys.asymmetric():
+        return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+    key = signing_keys.current_signing_key()
+    if key is None:
+        raise RuntimeError("No JWT signing key loaded")
+    return jwt.encode(payload, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+
+def verify_jwt_token(token: str) -> dict:
+    """
+    Verify and decode an access token
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded token payload
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    try:
+        if signing_keys.asymmetric():
+            key = signing_keys.verification_key(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                raise jwt.InvalidTokenError("Unknown signing key")
+            verify_with, algorithm = key.public_key, key.algorithm
+        else:
+            verify_with, algorithm = settings.JWT_SECRET, settings.JWT_ALGORITHM
+
+        payload = jwt.decode(
+            token, verify_with, algorithms=[algorithm], issuer=settings.JWT_ISSUER,
+            options={"require": ["exp", "iss", "sub", "sid"]}
+        )
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    if payload.get("typ") != "access":
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
+
+
+def check_password(password: str, hashed: str) -> bool:
+    """Verify a password against its bcrypt hash (blocking; CPU-bound)"""
+    import bcrypt
+
+    with BCRYPT_LATENCY.time("verify"):
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """check_password in a worker thread (bcrypt releases the GIL), keeping the event loop free"""
+    return await asyncio.to_thread(check_password, password, hashed)
+
+
+async def get_current_admin(request: Request):
+    """
+    Dependency to get current authenticated admin
+
+    The access token is verified locally; only a session that may have
+    been revoked costs a database lookup (see services/revocation.py).
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Admin identity: email and session ID
+
+    Raises:
+        HTTPException: If authentication fails
+    """
+    auth_header = request.headers.get("Authorization")
+    if not auth_header or not auth_header.startswith("Bearer "):
+        raise HTTPException(
+            status_code=401,
+            detail="Missing or invalid authorization header"
+        )
+
+    payload = verify_jwt_token(auth_header.split(" ")[1])
+    if await revocation.is_revoked(payload["sid"]):
+        raise HTTPException(status_code=401, detail="Session revoked")
+
+    return {"email": payload["sub"], "session_id": payload["sid"]}
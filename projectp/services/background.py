@@ -0,0 +1,23 @@
+"""
+Project P Innovations - Background Tasks
+Fire-and-forget tasks that are awaited on shutdown
+"""
+
+import asyncio
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+background_tasks = set()
+
+
+def run_in_background(coro):
+    """Schedule a coroutine without awaiting it, keeping a reference until done"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+async def drain():
+    """Wait for pending background tasks"""
+    if background_tasks:
+        await asyncio.gather(*background_tasks, return_exceptions=True)
@@ -0,0 +1,89 @@
+"""
+Project P Innovations - Job Catalog
+In-memory cache of active jobs and job helpers shared by the routes
+"""
+
+import logging
+import re
+from typing import Dict, Optional
+
+from projectp import database
+from projectp.database import timed
+from projectp.services.scoring import drop_job_vectors
+
+logger = logging.getLogger(__name__)
+
+# Deleted jobs are archived rather than removed so application history stays intact
+ACTIVE_JOBS = {"archived": {"$ne": True}}
+
+# In-memory map of active jobs by ID, kept in sync by the job CRUD routes
+job_catalog: Dict[str, dict] = {}
+
+
+def slugify(text: str) -> str:
+    """
+    Convert text to URL-friendly slug
+
+    Args:
+        text: Text to convert
+
+    Returns:
+        URL-safe slug string
+    """
+    text = text.lower().strip()
+    text = re.sub(r'[^\w\s-]', '', text)
+    text = re.sub(r'[-\s]+', '-', text)
+    return text
+
+
+async def load_job_catalog():
+    """Load all active jobs into the in-memory catalog"""
+    jobs = await database.db.jobs.find(ACTIVE_JOBS, {"_id": 0}).to_list(None)
+    job_catalog.clear()
+    job_catalog.update({job["id"]: job for job in jobs})
+    logger.info("✅ Job catalog loaded: %s jobs", len(job_catalog))
+
+
+async def refresh_job_caches():
+    """Reload the catalog and job match vectors after another worker changed jobs"""
+    await load_job_catalog()
+    drop_job_vectors()
+
+
+async def get_catalog_job(job_id: str) -> Optional[dict]:
+    """
+    Look up an active job in the catalog, falling back to the database
+
+    Covers jobs created after this worker loaded its catalog (by another
+    worker or by background seeding).
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        Job document, or None if no active job has this ID
+    """
+    job = job_catalog.get(job_id)
+    if job is None:
+        job = await timed("jobs.find_one", database.db.jobs.find_one({"id": job_id, **ACTIVE_JOBS}, {"_id": 0}))
+        if job:
+            job_catalog[job_id] = job
+    return job
+
+
+async def propagate_job_title(job_id: str, title: str):
+    """
+    Bulk-update the denormalized job title on a job's applications
+
+    Args:
+        job_id: Renamed job ID
+        title: New job title
+    """
+    try:
+        result = await database.db.applications.update_many(
+            {"job_id": job_id, "job_title": {"$ne": title}},
+            {"$set": {"job_title": title}}
+        )
+        logger.info("✅ Job title propagated to %s applications: %s", result.modified_count, job_id)
+    except Exception as e:
+        logger.error("❌ Job title propagation failed for %s: %s", job_id, e)
@@ -0,0 +1,110 @@
+"""
+Project P Innovations - Worker Coordination
+Cross-worker cache invalidation through MongoDB
+
+Each cache that workers hold in memory (the job catalog, match vectors)
+has a version document in db.cache_versions. A worker that changes the
+underlying data bumps the version; every worker polls the versions every
+CACHE_SYNC_INTERVAL_SECONDS and reloads the caches that moved. Polling
+one small collection works without a replica set, unlike change streams.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict
+
+from pymongo import ReturnDocument
+
+from projectp import database, settings
+from projectp.database import timed
+
+logger = logging.getLogger(__name__)
+
+# Cache name -> coroutine function that reloads it
+cache_reloaders: Dict[str, Callable[[], Awaitable[None]]] = {}
+
+# Last version of each cache this worker has applied
+cache_versions: Dict[str, int] = {}
+
+sync_task = None
+
+
+def register_cache(name: str, reload: Callable[[], Awaitable[None]]):
+    """
+    Reload a per-worker cache whenever another worker invalidates it
+
+    Args:
+        name: Cache name shared by all workers, e.g. "job_catalog"
+        reload: Coroutine function rebuilding the cache from the database
+    """
+    cache_reloaders[name] = reload
+
+
+async def broadcast_invalidation(name: str):
+    """
+    Tell every worker that a cache is stale
+
+    Call after this worker has already updated its own copy. If another
+    worker's change arrived in between, this worker's version is left
+    behind so the next sync reloads it as well.
+
+    Args:
+        name: Cache name
+    """
+    doc = await timed("cache_versions.find_one_and_update", database.db.cache_versions.find_one_and_update(
+        {"_id": name},
+        {
+            "$inc": {"version": 1},
+            "$set": {"updated_at": datetime.now(timezone.utc), "updated_by": database.INSTANCE_ID}
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    ))
+    if doc["version"] == cache_versions.get(name, 0) + 1:
+        cache_versions[name] = doc["version"]
+
+
+async def sync_caches(reload: bool = True):
+    """
+    Reload caches whose version moved since this worker last looked
+
+    Args:
+        reload: False to only record the current versions (at startup,
+            before the caches are first loaded)
+    """
+    docs = await timed("cache_versions.find", database.db.cache_versions.find(
+        {"_id": {"$in": list(cache_reloaders)}}
+    ).to_list(None))
+
+    for doc in docs:
+        name, version = doc["_id"], doc["version"]
+        if version == cache_versions.get(name):
+            continue
+        if reload:
+            await cache_reloaders[name]()
+            logger.info("🔄 Cache %s reloaded (version %s)", name, version)
+        cache_versions[name] = version
+
+
+async def run_cache_sync():
+    """Poll cache versions until cancelled"""
+    while True:
+        await asyncio.sleep(settings.CACHE_SYNC_INTERVAL_SECONDS)
+        try:
+            await sync_caches()
+        except Exception as e:
+            logger.warning("⚠️ Cache sync failed: %s", e)
+
+
+def start_cache_sync():
+    """Start polling cache versions (CACHE_SYNC_INTERVAL_SECONDS > 0)"""
+    global sync_task
+    if settings.CACHE_SYNC_INTERVAL_SECONDS > 0:
+        sync_task = asyncio.create_task(run_cache_sync())
+
+
+def stop_cache_sync():
+    """Cancel the cache sync poller if running"""
+    if sync_task:
+        sync_task.cancel()
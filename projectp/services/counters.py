@@ -0,0 +1,123 @@
+"""
+Project P Innovations - Counters
+Precomputed dashboard totals maintained with atomic $inc upserts
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from pymongo import UpdateOne
+
+from projectp import database
+from projectp.database import timed
+from projectp.services.catalog import ACTIVE_JOBS
+from projectp.services.tasks import task
+
+logger = logging.getLogger(__name__)
+
+# Counter documents in db.counters, all updated with atomic $inc upserts:
+#   "jobs"           -> {"active": n}
+#   "emails"         -> {"sent": n, "failed": n}
+#   "job:<job_id>"   -> {"kind": "job", "job_id": ..., "job_title": ..., "applications": n}
+#   "day:YYYY-MM-DD" -> {"kind": "day", "date": ..., "applications": n}
+
+# Counter upserts per bulk_write when rebuilding
+REBUILD_BATCH_SIZE = 1000
+
+
+async def increment_counter(key: str, fields: dict, on_insert: Optional[dict] = None):
+    """
+    Atomically increment counter fields, creating the counter if needed
+
+    Args:
+        key: Counter document ID
+        fields: Field name to increment amount
+        on_insert: Extra fields set only when the counter is created
+    """
+    update = {"$inc": fields}
+    if on_insert:
+        update["$setOnInsert"] = on_insert
+    await timed("counters.update_one", database.db.counters.update_one({"_id": key}, update, upsert=True))
+
+
+async def count_application(job_id: Optional[str], job_title: Optional[str], created_at: str):
+    """Bump the per-job and per-day application counters"""
+    date = created_at[:10]
+    await asyncio.gather(
+        increment_counter(
+            f"job:{job_id or 'general'}",
+            {"applications": 1},
+            {"kind": "job", "job_id": job_id, "job_title": job_title}
+        ),
+        increment_counter(
+            f"day:{date}",
+            {"applications": 1},
+            {"kind": "day", "date": date}
+        )
+    )
+
+
+@task("count_application")
+async def count_application_task(payload: dict):
+    """count_application for a new application (queued by /api/apply)"""
+    await count_application(payload["job_id"], payload["job_title"], payload["created_at"])
+
+
+async def rebuild_counters(force: bool = False):
+    """
+    Recompute counters from the source collections
+
+    Each counter is written with a $set upsert rather than deleted and
+    reinserted, so the API can keep incrementing counters meanwhile.
+
+    Args:
+        force: Recompute even if counters exist (seeding, load tests);
+            otherwise only an empty collection is backfilled (startup)
+    """
+    if not force and await timed("counters.find_one", database.db.counters.find_one({}, {"_id": 1})):
+        return
+
+    per_job = await database.db.applications.aggregate([
+        {"$group": {"_id": "$job_id", "job_title": {"$first": "$job_title"}, "count": {"$sum": 1}}}
+    ]).to_list(None)
+    per_day = await database.db.applications.aggregate([
+        {"$group": {"_id": {"$substr": ["$created_at", 0, 10]}, "count": {"$sum": 1}}}
+    ]).to_list(None)
+    emails = await database.db.email_logs.aggregate([
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+    ]).to_list(None)
+    email_counts = {row["_id"]: row["count"] for row in emails}
+
+    counters = [
+        {"_id": "jobs", "active": await database.db.jobs.count_documents(ACTIVE_JOBS)},
+        {"_id": "emails", "sent": email_counts.get("sent", 0), "failed": email_counts.get("failed", 0)}
+    ]
+    counters += [
+        {
+            "_id": f"job:{row['_id'] or 'general'}",
+            "kind": "job",
+            "job_id": row["_id"],
+            "job_title": row["job_title"],
+            "applications": row["count"]
+        }
+        for row in per_job
+    ]
+    counters += [
+        {"_id": f"day:{row['_id']}", "kind": "day", "date": row["_id"], "applications": row["count"]}
+        for row in per_day
+    ]
+
+    operations = [
+        UpdateOne({"_id": counter["_id"]}, {"$set": {k: v for k, v in counter.items() if k != "_id"}}, upsert=True)
+        for counter in counters
+    ]
+    for start in range(0, len(operations), REBUILD_BATCH_SIZE):
+        await timed("counters.bulk_write", database.db.counters.bulk_write(
+            operations[start:start + REBUILD_BATCH_SIZE], ordered=False
+        ))
+    # Jobs and days with no applications left (e.g. purged synthetic data)
+    stale = await timed("counters.delete_many", database.db.counters.delete_many(
+        {"_id": {"$nin": [counter["_id"] for counter in counters]}}
+    ))
+    logger.info("✅ Counters rebuilt: %s documents, %s stale removed", len(counters), stale.deleted_count)
@@ -0,0 +1,77 @@
+"""
+Project P Innovations - Signed Downloads
+Short-lived HMAC-signed resume URLs, verified without a database lookup
+
+A link covers one stored file, the file name offered to the browser and
+an expiry time. The signature is the URL-safe base64 HMAC-SHA256 of
+"<stored filename>\\n<expires>\\n<download name>" under DOWNLOAD_URL_SECRET,
+so any layer holding the secret (a CDN edge function, a static file
+server) can verify a link the same way.
+"""
+
+import base64
+import hashlib
+import hmac
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException
+
+from projectp import settings
+
+
+def signing_key() -> bytes:
+    """DOWNLOAD_URL_SECRET, or a key derived from JWT_SECRET when unset"""
+    if settings.DOWNLOAD_URL_SECRET:
+        return settings.DOWNLOAD_URL_SECRET.encode("utf-8")
+    return hmac.new(settings.JWT_SECRET.encode("utf-8"), b"resume-downloads", hashlib.sha256).digest()
+
+
+def download_signature(filename: str, expires: int, name: str) -> str:
+    """URL-safe signature of one download link"""
+    message = f"{filename}\n{expires}\n{name}".encode("utf-8")
+    digest = hmac.new(signing_key(), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def download_name(applicant_name: Optional[str], filename: str) -> str:
+    """File name offered to the browser, e.g. Jane_Doe_resume.pdf"""
+    safe_name = re.sub(r"[^\w.-]+", "_", applicant_name or "applicant").strip("_") or "applicant"
+    return f"{safe_name}_resume{Path(filename).suffix}"
+
+
+def sign_download(filename: str, name: str, ttl_seconds: Optional[int] = None) -> dict:
+    """
+    Mint the query parameters of a signed download link
+
+    Args:
+        filename: Stored resume file name (application resume_path)
+        name: File name offered to the browser
+        ttl_seconds: Link lifetime (default DOWNLOAD_URL_TTL_SECONDS)
+
+    Returns:
+        Dictionary with expires, name and signature
+    """
+    expires = int(time.time()) + (ttl_seconds or settings.DOWNLOAD_URL_TTL_SECONDS)
+    return {"expires": expires, "name": name, "signature": download_signature(filename, expires, name)}
+
+
+def verify_download(filename: str, expires: int, name: str, signature: str):
+    """
+    Check a signed download link
+
+    Raises:
+        HTTPException: If the signature is wrong or the link has expired
+    """
+    if not hmac.compare_digest(download_signature(filename, expires, name), signature):
+        raise HTTPException(status_code=403, detail="Invalid download link")
+    if expires < time.time():
+        raise HTTPException(status_code=403, detail="Download link expired")
+
+
+def expires_at(expires: int) -> str:
+    """Link expiry as an ISO timestamp"""
+    return datetime.fromtimestamp(expires, timezone.utc).isoformat()
@@ -0,0 +1,242 @@
+"""
+Project P Innovations - Email
+Notification templates and delivery through Resend, with every attempt logged
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.events import email_event
+from projectp.metrics import EMAIL_LATENCY
+from projectp.services.counters import increment_counter
+from projectp.services.live_events import publish_event
+from projectp.services.tasks import last_attempt, task
+
+logger = logging.getLogger(__name__)
+
+_resend = None
+
+
+def resend_client():
+    """The Resend SDK, imported and configured on first use"""
+    global _resend
+    if _resend is None:
+        import resend
+
+        resend.api_key = settings.RESEND_API_KEY
+        _resend = resend
+    return _resend
+
+
+def application_email_html(
+    name: str,
+    email: str,
+    job_title: Optional[str],
+    message: Optional[str],
+    filename: str
+) -> str:
+    """
+    Build the HTML body of the new application notification
+
+    Args:
+        name: Applicant name
+        email: Applicant email
+        job_title: Position applied for (None for general applications)
+        message: Optional application message
+        filename: Original resume filename
+
+    Returns:
+        HTML email body
+    """
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+            .header {{ background: linear-gradient(135deg, #071020, #0a1628); color: white; padding: 30px; text-align: center; border-radius: 8px 8px 0 0; }}
+            .content {{ background: #f9f9f9; padding: 30px; border-radius: 0 0 8px 8px; }}
+            .info-row {{ margin: 15px 0; padding: 10px; background: white; border-left: 4px solid #FF7A2A; }}
+            .label {{ font-weight: bold; color: #071020; }}
+            .footer {{ text-align: center; margin-top: 20px; font-size: 12px; color: #666; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>🎯 New Job Application</h1>
+            </div>
+            <div class="content">
+                <div class="info-row">
+                    <span class="label">Name:</span> {name}
+                </div>
+                <div class="info-row">
+                    <span class="label">Email:</span> {email}
+                </div>
+                <div class="info-row">
+                    <span class="label">Position:</span> {job_title or 'General Application'}
+                </div>
+                <div class="info-row">
+                    <span class="label">Message:</span><br>
+                    {message or 'No message provided'}
+                </div>
+                <div class="info-row">
+                    <span class="label">Resume:</span> {filename}
+                </div>
+                <div class="footer">
+                    <p>Login to the admin dashboard to download the resume and review the application.</p>
+                    <p>Project P Innovations - AI Solutions & Consulting</p>
+                </div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+
+# Body of the /api/test-email message
+TEST_EMAIL_HTML = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body { font-family: Arial, sans-serif; padding: 20px; }
+            .container { max-width: 600px; margin: 0 auto; background: #f9f9f9; padding: 30px; border-radius: 8px; }
+            h1 { color: #071020; }
+            .success { background: #d4edda; border-left: 4px solid #28a745; padding: 15px; margin: 20px 0; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>Test Email</h1>
+            <div class="success">
+                <strong>Success!</strong> Your email system is working correctly.
+            </div>
+            <p>This is a test email to verify the Resend integration.</p>
+            <p>If you're seeing this, everything is configured properly! ✅</p>
+        </div>
+    </body>
+    </html>
+    """
+
+
+# Bounds concurrent Resend calls (created on first send)
+_send_slots = None
+
+
+async def call_resend(params: dict) -> dict:
+    """Run the blocking Resend call in a worker thread, EMAIL_CONCURRENCY at a time"""
+    global _send_slots
+    if _send_slots is None:
+        _send_slots = asyncio.Semaphore(settings.EMAIL_CONCURRENCY)
+    async with _send_slots:
+        return await asyncio.to_thread(resend_client().Emails.send, params)
+
+
+async def send_email(to: str, subject: str, html_body: str, log_failure: bool = True) -> dict:
+    """
+    Send email via Resend and log to database
+
+    Only the Resend call counts as a failure: if logging a sent email fails,
+    the email was still delivered, so it is reported as sent and never resent.
+
+    Args:
+        to: Recipient email address
+        subject: Email subject line
+        html_body: HTML email body
+        log_failure: False to skip the failed-email log and counter (a
+            retried task logs only its last attempt)
+
+    Returns:
+        Dictionary with success status and email log ID
+    """
+    start = time.perf_counter()
+    params = {
+        "from": settings.EMAIL_FROM,
+        "to": [to],
+        "subject": subject,
+        "html": html_body
+    }
+    try:
+        # Send via Resend
+        resend_response = await call_resend(params)
+    except Exception as e:
+        EMAIL_LATENCY.observe(time.perf_counter() - start, "failed")
+        logger.error("❌ Email failed: %s", e)
+        if not log_failure:
+            return {"success": False, "error": str(e), "email_log_id": None}
+
+        # Log failure
+        email_log = {
+            "id": str(uuid.uuid4()),
+            "to": to,
+            "subject": subject,
+            "body": html_body,
+            "sent_at": datetime.now(timezone.utc).isoformat(),
+            "status": "failed",
+            "error": str(e)
+        }
+        await timed("email_logs.insert_one", database.db.email_logs.insert_one(email_log))
+        await increment_counter("emails", {"failed": 1})
+        publish_event("email.failed", email_event(email_log))
+
+        return {
+            "success": False,
+            "error": str(e),
+            "email_log_id": email_log["id"]
+        }
+
+    EMAIL_LATENCY.observe(time.perf_counter() - start, "sent")
+
+    # Log to database
+    email_log = {
+        "id": str(uuid.uuid4()),
+        "to": to,
+        "subject": subject,
+        "body": html_body,
+        "sent_at": datetime.now(timezone.utc).isoformat(),
+        "resend_id": resend_response.get('id', ''),
+        "status": "sent"
+    }
+    try:
+        await timed("email_logs.insert_one", database.db.email_logs.insert_one(email_log))
+        await increment_counter("emails", {"sent": 1})
+    except Exception as e:
+        logger.error("❌ Email sent but not logged: %s", e, extra={"email_log_id": email_log["id"]})
+    publish_event("email.sent", email_event(email_log))
+
+    logger.info(
+        "✅ Email sent to %s | Subject: %s", to, subject,
+        extra={"email_log_id": email_log["id"]}
+    )
+
+    return {
+        "success": True,
+        "email_log_id": email_log["id"],
+        "resend_id": resend_response.get('id', '')
+    }
+
+
+@task("application_email")
+async def send_application_email(payload: dict):
+    """
+    Notify EMAIL_TO of a new application (queued by /api/apply)
+
+    Raises:
+        RuntimeError: If delivery failed, so the task is retried
+    """
+    subject = f"New Application: {payload['name']} — {payload['job_title'] or 'General'}"
+    html_body = application_email_html(
+        payload["name"], payload["email"], payload["job_title"], payload["message"], payload["filename"]
+    )
+    # Earlier attempts are retried, so only the last one logs a failure
+    result = await send_email(settings.EMAIL_TO, subject, html_body, log_failure=last_attempt())
+    if not result["success"]:
+        raise RuntimeError(result["error"])
@@ -0,0 +1,86 @@
+"""
+Project P Innovations - Health Checks
+Readiness checks with a short result cache so frequent probes stay cheap
+"""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from projectp import database, settings
+from projectp.services import tasks
+
+readiness_cache = {"checked_at": 0.0, "result": None}
+readiness_lock = asyncio.Lock()
+
+
+def check_upload_dir() -> dict:
+    """Verify the upload and quarantine directories are writable and have enough free space (blocking)"""
+    try:
+        for directory in (settings.UPLOAD_DIR, settings.QUARANTINE_DIR):
+            with tempfile.NamedTemporaryFile(dir=directory, prefix=".ready-"):
+                pass
+        free_bytes = shutil.disk_usage(settings.UPLOAD_DIR).free
+    except OSError as e:
+        return {"ok": False, "writable": False, "error": str(e)}
+
+    return {
+        "ok": free_bytes >= settings.READY_MIN_FREE_BYTES,
+        "writable": True,
+        "free_bytes": free_bytes
+    }
+
+
+async def check_task_queue() -> dict:
+    """
+    This worker's task workers are alive and none of its tasks is stuck
+
+    The queue depth is reported but only fails the probe for this worker's
+    own memory queue: with TASK_BACKEND=mongo it is the whole cluster's
+    backlog, and failing on it would take every worker out of rotation at
+    once when the queue is merely slow.
+    """
+    health = tasks.worker_health()
+    ok = (
+        bool(tasks.worker_tasks)
+        and health["workers_alive"] == len(tasks.worker_tasks)
+        and health["stuck"] == 0
+        and health["local_backlog"] <= settings.READY_MAX_TASK_BACKLOG
+    )
+    try:
+        depth = await tasks.queue_depth()
+    except Exception as e:
+        return {"ok": ok, **health, "depth": None, "error": str(e), "backend": settings.TASK_BACKEND}
+    return {"ok": ok, **health, "depth": depth, "backend": settings.TASK_BACKEND}
+
+
+async def check_readiness() -> dict:
+    """
+    Run all readiness checks, reusing a recent result when available
+
+    Returns:
+        Dictionary with overall "ready" flag and per-check details
+    """
+    async with readiness_lock:
+        now = time.monotonic()
+        if readiness_cache["result"] and now - readiness_cache["checked_at"] < settings.READY_CACHE_SECONDS:
+            return readiness_cache["result"]
+
+        mongo, uploads, task_check = await asyncio.gather(
+            database.check_mongo(),
+            asyncio.to_thread(check_upload_dir),
+            check_task_queue()
+        )
+        mongo["ok"] = mongo["connected"] and mongo["latency_ms"] <= settings.READY_MAX_MONGO_LATENCY_MS
+
+        checks = {"mongo": mongo, "uploads": uploads, "tasks": task_check}
+        result = {
+            "ready": all(check["ok"] for check in checks.values()),
+            "worker": database.INSTANCE_ID,
+            "checks": checks,
+            "checked_at": datetime.now(timezone.utc).isoformat()
+        }
+        readiness_cache.update(checked_at=now, result=result)
+        return result
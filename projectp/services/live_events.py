@@ -0,0 +1,39 @@
+"""
+Project P Innovations - Live Events
+The process-wide event broker feeding the admin dashboard stream
+"""
+
+import asyncio
+
+from projectp import database, settings
+from projectp.events import EventBroker, watch_change_streams
+
+event_broker = EventBroker()
+change_stream_task = None
+
+
+def publish_event(event_type: str, data: dict):
+    """
+    Publish a dashboard event from a write path
+
+    Skipped when events are sourced from change streams, which would
+    otherwise deliver the same change twice.
+
+    Args:
+        event_type: Event name, e.g. "application.created"
+        data: Compact event payload
+    """
+    if settings.EVENTS_SOURCE == "local":
+        event_broker.publish(event_type, data)
+
+
+def start_change_stream():
+    """Tail MongoDB change streams into the broker (EVENTS_SOURCE=change_streams)"""
+    global change_stream_task
+    change_stream_task = asyncio.create_task(watch_change_streams(database.db, event_broker))
+
+
+def stop_change_stream():
+    """Cancel the change stream watcher if running"""
+    if change_stream_task:
+        change_stream_task.cancel()
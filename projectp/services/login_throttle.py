@@ -0,0 +1,181 @@
+"""
+Project P Innovations - Login Throttling
+Brute-force protection for admin login, checked before any bcrypt work
+
+Attempts are counted per account (the submitted email, known or not) and
+per client IP. The first LOGIN_ACCOUNT_FREE_ATTEMPTS (LOGIN_IP_FREE_ATTEMPTS
+for an IP, which may be shared by several admins) go straight through;
+each later one must trail the previous attempt by a growing delay
+(LOGIN_BACKOFF_BASE_SECONDS, doubling up to LOGIN_BACKOFF_MAX_SECONDS). Short
+waits are slept without blocking the event loop, longer ones are answered
+with 429 at once. Reaching the lockout threshold blocks the key for
+LOGIN_LOCKOUT_SECONDS. A successful login clears the account's count and
+takes itself off the IP's count; otherwise counts lapse after
+LOGIN_FAILURE_WINDOW_SECONDS without attempts.
+
+Attempts are counted when they start, not when bcrypt fails, so a burst of
+parallel requests backs off and locks out like a sequential one. Counts are
+kept in process memory or in db.login_attempts, following
+RATE_LIMIT_BACKEND.
+"""
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timezone, timedelta
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.metrics import LOGIN_THROTTLED
+
+logger = logging.getLogger(__name__)
+
+# key -> {"attempts", "last_attempt", "locked_until", "expires_at"}
+login_attempt_store = {}
+
+
+def throttle_keys(email: str, ip: str) -> List[Tuple[str, int, int]]:
+    """Counter keys of one login attempt with their free attempts and lockout thresholds"""
+    return [
+        (f"account:{email.strip().lower()}", settings.LOGIN_ACCOUNT_FREE_ATTEMPTS, settings.LOGIN_ACCOUNT_LOCKOUT_ATTEMPTS),
+        (f"ip:{ip}", settings.LOGIN_IP_FREE_ATTEMPTS, settings.LOGIN_IP_LOCKOUT_ATTEMPTS)
+    ]
+
+
+def backoff_seconds(attempts: int, free_attempts: int) -> float:
+    """Minimum gap before the attempt numbered ``attempts`` (1-based)"""
+    excess = attempts - free_attempts
+    if excess <= 0:
+        return 0.0
+    return min(settings.LOGIN_BACKOFF_BASE_SECONDS * 2 ** (excess - 1), settings.LOGIN_BACKOFF_MAX_SECONDS)
+
+
+def too_many_attempts(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="Too many login attempts. Please try again later.",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+async def record_attempt(key: str, now: datetime) -> Tuple[int, Optional[datetime], Optional[datetime]]:
+    """
+    Count an attempt for one key
+
+    Returns:
+        Attempts in the current window including this one, the time of the
+        previous attempt and the end of an active lockout (None if none)
+    """
+    expires_at = now + timedelta(seconds=settings.LOGIN_FAILURE_WINDOW_SECONDS)
+
+    if settings.RATE_LIMIT_BACKEND != "mongo":
+        if len(login_attempt_store) > 10_000:
+            for stale in [k for k, s in login_attempt_store.items() if s["expires_at"] <= now]:
+                del login_attempt_store[stale]
+        state = login_attempt_store.get(key)
+        if state is None or state["expires_at"] <= now:
+            state = login_attempt_store[key] = {"attempts": 0, "last_attempt": None, "locked_until": None}
+        previous = state["last_attempt"]
+        state["attempts"] += 1
+        state["last_attempt"] = now
+        state["expires_at"] = max(expires_at, state["locked_until"] or expires_at)
+        return state["attempts"], previous, state["locked_until"]
+
+    # Expired counters may outlive expires_at until the TTL monitor runs
+    await timed("login_attempts.delete_one", database.db.login_attempts.delete_one(
+        {"_id": key, "expires_at": {"$lte": now}}
+    ))
+    doc = await timed("login_attempts.find_one_and_update", database.db.login_attempts.find_one_and_update(
+        {"_id": key},
+        {"$inc": {"attempts": 1}, "$set": {"last_attempt": now, "expires_at": expires_at}},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE
+    ))
+    doc = doc or {}
+    locked_until = as_utc(doc.get("locked_until"))
+    if locked_until and locked_until > expires_at:
+        # Keep the counter at least as long as its lockout
+        await timed("login_attempts.update_one", database.db.login_attempts.update_one(
+            {"_id": key}, {"$set": {"expires_at": locked_until}}
+        ))
+    return doc.get("attempts", 0) + 1, as_utc(doc.get("last_attempt")), locked_until
+
+
+async def lock_out(key: str, until: datetime):
+    """Block a key until ``until`` and restart its count afterwards"""
+    expires_at = until + timedelta(seconds=settings.LOGIN_FAILURE_WINDOW_SECONDS)
+    if settings.RATE_LIMIT_BACKEND != "mongo":
+        login_attempt_store[key] = {"attempts": 0, "last_attempt": None, "locked_until": until, "expires_at": expires_at}
+        return
+
+    await timed("login_attempts.update_one", database.db.login_attempts.update_one(
+        {"_id": key},
+        {"$set": {"attempts": 0, "last_attempt": None, "locked_until": until, "expires_at": expires_at}}
+    ))
+
+
+async def check_login_allowed(email: str, ip: str):
+    """
+    Count a login attempt and wait out or reject it before the password check
+
+    Args:
+        email: Submitted admin email
+        ip: Client IP address
+
+    Raises:
+        HTTPException: 429 with Retry-After while a key is locked out or its
+            backoff is longer than LOGIN_MAX_SLEEP_SECONDS
+    """
+    now = datetime.now(timezone.utc)
+    wait = 0.0
+
+    for key, free_attempts, lockout_attempts in throttle_keys(email, ip):
+        attempts, previous, locked_until = await record_attempt(key, now)
+
+        if locked_until and locked_until > now:
+            LOGIN_THROTTLED.inc("locked")
+            raise too_many_attempts((locked_until - now).total_seconds())
+
+        if attempts >= lockout_attempts:
+            until = now + timedelta(seconds=settings.LOGIN_LOCKOUT_SECONDS)
+            await lock_out(key, until)
+            LOGIN_THROTTLED.inc("locked")
+            logger.warning("⚠️ Login locked out for %s until %s", key, until.isoformat())
+            raise too_many_attempts(settings.LOGIN_LOCKOUT_SECONDS)
+
+        if previous is not None:
+            wait = max(wait, (previous - now).total_seconds() + backoff_seconds(attempts, free_attempts))
+
+    if wait > settings.LOGIN_MAX_SLEEP_SECONDS:
+        LOGIN_THROTTLED.inc("rejected")
+        raise too_many_attempts(wait)
+    if wait > 0:
+        LOGIN_THROTTLED.inc("delayed")
+        await asyncio.sleep(wait)
+
+
+async def record_login_success(email: str, ip: str):
+    """Clear the account's count and take this attempt off the IP's count"""
+    (account_key, _, _), (ip_key, _, _) = throttle_keys(email, ip)
+
+    if settings.RATE_LIMIT_BACKEND != "mongo":
+        login_attempt_store.pop(account_key, None)
+        state = login_attempt_store.get(ip_key)
+        if state and state["attempts"] > 0:
+            state["attempts"] -= 1
+        return
+
+    await timed("login_attempts.delete_one", database.db.login_attempts.delete_one({"_id": account_key}))
+    await timed("login_attempts.update_one", database.db.login_attempts.update_one(
+        {"_id": ip_key, "attempts": {"$gt": 0}}, {"$inc": {"attempts": -1}}
+    ))
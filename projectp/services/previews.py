@@ -0,0 +1,221 @@
+"""
+Project P Innovations - Resume Preview Cache
+First-page thumbnails and text snippets of clean resumes for the dashboard
+
+Previews are rendered by projectp/previews.py in the resume worker
+processes (see services/resumes.py), never in the API process, and only
+for files the scanner cleared. The render_preview task warms the cache once
+a scan comes back clean; a lookup that misses (evicted, or cached on another
+host) renders on demand, with concurrent misses for the same resume sharing
+one render.
+
+The cache lives in PREVIEW_CACHE_DIR, keyed by the resume's SHA-256 so
+applications sharing a stored file share its preview. Reads bump an entry's
+mtime and every write evicts the least recently read entries until the
+directory is within PREVIEW_CACHE_MAX_BYTES, so workers on one host share
+both the cache and its eviction order.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.metrics import PREVIEW_CACHE, PREVIEW_RENDER_LATENCY
+from projectp.previews import render_preview
+from projectp.services.resumes import run_in_worker
+from projectp.services.tasks import task
+
+logger = logging.getLogger(__name__)
+
+# Resume SHA-256 -> render in progress in this worker
+rendering: Dict[str, asyncio.Task] = {}
+
+
+class PreviewCache:
+    """
+    Size-bounded LRU cache of previews on disk
+
+    Each entry is <key>.json (snippet, image size, render time) and, if the
+    resume has an image, <key>.png. The JSON file is written last and read
+    first, so a half-written or half-evicted entry is a miss. Methods block;
+    call them in a thread.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+    def paths(self, key: str):
+        return self.directory / f"{key}.json", self.directory / f"{key}.png"
+
+    def get(self, key: str, with_image: bool = False) -> Optional[dict]:
+        """
+        Look up a preview and mark it recently used
+
+        Returns:
+            Preview metadata (plus "png" bytes if with_image), None on a miss
+        """
+        meta_path, image_path = self.paths(key)
+        try:
+            preview = json.loads(meta_path.read_text())
+            if with_image:
+                preview["png"] = image_path.read_bytes() if preview["has_image"] else None
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+        return preview
+
+    def put(self, key: str, preview: dict, png: Optional[bytes]):
+        """Store a preview, then evict down to max_bytes"""
+        meta_path, image_path = self.paths(key)
+        if png is not None:
+            self.write_atomic(image_path, png)
+        self.write_atomic(meta_path, json.dumps(preview).encode("utf-8"))
+        self.evict()
+
+    def write_atomic(self, path: Path, data: bytes):
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        with self.lock:
+            entries = []
+            total = 0
+            for meta_path in self.directory.glob("*.json"):
+                image_path = meta_path.with_suffix(".png")
+                try:
+                    stat = meta_path.stat()
+                    size = stat.st_size + (image_path.stat().st_size if image_path.exists() else 0)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, meta_path, image_path, size))
+                total += size
+
+            if total <= self.max_bytes:
+                return
+
+            evicted = 0
+            for _, meta_path, image_path, size in sorted(entries, key=lambda entry: entry[0]):
+                if total <= self.max_bytes:
+                    break
+                meta_path.unlink(missing_ok=True)
+                image_path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+            logger.info("🧹 Preview cache: evicted %s entries, %s bytes left", evicted, total)
+
+
+preview_cache: Optional[PreviewCache] = None
+
+
+def get_preview_cache() -> PreviewCache:
+    global preview_cache
+    if preview_cache is None:
+        preview_cache = PreviewCache(settings.PREVIEW_CACHE_DIR, settings.PREVIEW_CACHE_MAX_BYTES)
+    return preview_cache
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a stored file (blocking)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def render_and_store(filename: str, key: str) -> dict:
+    """
+    Render a clean resume's preview in the worker pool and cache it
+
+    Raises:
+        FileNotFoundError: If the resume is not in UPLOAD_DIR
+        TimeoutError: If rendering took longer than SCAN_TIMEOUT_SECONDS
+    """
+    path = settings.UPLOAD_DIR / filename
+    if not path.is_file():
+        raise FileNotFoundError(f"Resume not found: {filename}")
+
+    start = time.perf_counter()
+    rendered = await run_in_worker(
+        render_preview, str(path), path.suffix.lower(), settings.PREVIEW_WIDTH, settings.PREVIEW_SNIPPET_CHARS
+    )
+    PREVIEW_RENDER_LATENCY.observe(time.perf_counter() - start)
+
+    png = rendered["png"]
+    preview = {
+        "sha256": key,
+        "snippet": rendered["snippet"],
+        "has_image": png is not None,
+        "width": rendered["width"],
+        "height": rendered["height"],
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
+    await asyncio.to_thread(get_preview_cache().put, key, preview, png)
+    logger.info("✅ Resume preview rendered: %s", filename)
+    return {**preview, "png": png}
+
+
+async def get_preview(filename: str, key: Optional[str], with_image: bool = False) -> dict:
+    """
+    A clean resume's preview, from the cache or rendered now
+
+    Args:
+        filename: Stored file name in UPLOAD_DIR
+        key: The resume's SHA-256 (hashed from the file if None)
+        with_image: Include the PNG bytes (None without an image) as "png"
+
+    Returns:
+        Preview with sha256, snippet, has_image, width, height and generated_at
+    """
+    if key is None:
+        key = await asyncio.to_thread(file_sha256, settings.UPLOAD_DIR / filename)
+
+    preview = await asyncio.to_thread(get_preview_cache().get, key, with_image)
+    if preview is not None:
+        PREVIEW_CACHE.inc("hit")
+        return preview
+    PREVIEW_CACHE.inc("miss")
+
+    render = rendering.get(key)
+    if render is None:
+        render = rendering[key] = asyncio.create_task(render_and_store(filename, key))
+        render.add_done_callback(lambda _: rendering.pop(key, None))
+    # One caller giving up must not cancel the render for the others
+    preview = dict(await asyncio.shield(render))
+    if not with_image:
+        preview.pop("png")
+    return preview
+
+
+@task("render_preview")
+async def warm_preview(payload: dict):
+    """
+    Render a newly cleared resume's preview ahead of the first dashboard view
+
+    Args:
+        payload: resume_path (stored file name)
+    """
+    filename = payload["resume_path"]
+    application = await timed("applications.find_one", database.db.applications.find_one(
+        {"resume_path": filename, "scan_status": "clean"}, {"_id": 0, "resume_sha256": 1}
+    ))
+    if application is None:
+        return
+    try:
+        await get_preview(filename, application.get("resume_sha256"))
+    except FileNotFoundError:
+        logger.warning("⚠️ Resume to preview not found: %s", filename)
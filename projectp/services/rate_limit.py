@@ -0,0 +1,93 @@
+"""
+Project P Innovations - Rate Limiting
+Per-client request limits, in process memory or shared by all workers in MongoDB
+"""
+
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+from projectp import database, settings
+from projectp.database import timed
+
+rate_limit_store = {}
+
+
+def check_rate_limit(ip: str, limit: int = 10, window: int = 3600):
+    """
+    Simple in-memory rate limiting
+
+    Args:
+        ip: Client IP address
+        limit: Maximum requests allowed
+        window: Time window in seconds
+
+    Raises:
+        HTTPException: If rate limit exceeded
+    """
+    now = datetime.now(timezone.utc).timestamp()
+
+    if ip not in rate_limit_store:
+        rate_limit_store[ip] = []
+
+    # Remove expired timestamps
+    rate_limit_store[ip] = [
+        t for t in rate_limit_store[ip]
+        if now - t < window
+    ]
+
+    if len(rate_limit_store[ip]) >= limit:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests. Please try again later."
+        )
+
+    rate_limit_store[ip].append(now)
+
+
+async def check_shared_rate_limit(key: str, limit: int, window: int):
+    """
+    Rate limiting shared by all workers via db.rate_limits
+
+    Counts requests in fixed windows with one atomic upsert per request;
+    a client can burst up to twice the limit across a window boundary.
+    Expired windows are removed by the TTL index on expires_at.
+
+    Args:
+        key: Client key, e.g. the IP address
+        limit: Maximum requests allowed per window
+        window: Window length in seconds
+
+    Raises:
+        HTTPException: If rate limit exceeded
+    """
+    bucket = int(datetime.now(timezone.utc).timestamp() // window)
+    doc = await timed("rate_limits.find_one_and_update", database.db.rate_limits.find_one_and_update(
+        {"_id": f"{key}:{window}:{bucket}"},
+        {
+            "$inc": {"count": 1},
+            "$setOnInsert": {"expires_at": datetime.fromtimestamp((bucket + 1) * window, timezone.utc)}
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    ))
+
+    if doc["count"] > limit:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests. Please try again later."
+        )
+
+
+async def enforce_rate_limit(key: str, limit: int, window: int):
+    """
+    Apply a rate limit with the configured backend (RATE_LIMIT_BACKEND)
+
+    Raises:
+        HTTPException: If rate limit exceeded
+    """
+    if settings.RATE_LIMIT_BACKEND == "mongo":
+        await check_shared_rate_limit(key, limit, window)
+    else:
+        check_rate_limit(key, limit, window)
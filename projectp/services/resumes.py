@@ -0,0 +1,266 @@
+"""
+Project P Innovations - Resume Processing
+Resume storage, and the work on stored resumes that runs from the task
+queue after /api/apply returns
+
+Uploads land in QUARANTINE_DIR with scan_status "pending". The scan_resume
+task sniffs the file type and runs the configured scanner (SCANNER) in a
+pool of separate processes; a clean file moves to UPLOAD_DIR, where the
+download routes serve it, and only then is its text extracted, in the same
+processes. Infected
+files and files whose content doesn't match their extension stay in
+quarantine. Every application sharing the stored file gets the verdict.
+Previews (services/previews.py) are rendered in the same worker processes,
+and only for clean files.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.metrics import FILE_WRITE_LATENCY, RESUME_SCANS
+from projectp.resume_text import extract_file_text
+from projectp.scanning import limit_worker_memory, scan_file
+from projectp.services.scoring import application_text_changed
+from projectp.services.tasks import enqueue_all, task
+
+logger = logging.getLogger(__name__)
+
+# Worker processes for scans, text extraction and previews (created on first use)
+worker_pool: Optional[ProcessPoolExecutor] = None
+
+
+def write_resume(filename: str, content: bytes):
+    """Store an uploaded resume in QUARANTINE_DIR until it is scanned (blocking)"""
+    with FILE_WRITE_LATENCY.time(), open(settings.QUARANTINE_DIR / filename, "wb") as f:
+        f.write(content)
+
+
+async def delete_unreferenced_resume(filename: str):
+    """Delete a stored resume (quarantined or released) once no application uses it"""
+    if await timed("applications.find_one", database.db.applications.find_one(
+        {"resume_path": filename}, {"_id": 1}
+    )):
+        return
+    for directory in (settings.QUARANTINE_DIR, settings.UPLOAD_DIR):
+        await asyncio.to_thread((directory / filename).unlink, missing_ok=True)
+    logger.info("🧹 Unreferenced resume deleted: %s", filename)
+
+
+@task("extract_resume_text")
+async def extract_resume_text(payload: dict):
+    """
+    Extract a resume's text for match scoring and store it on the application
+
+    Args:
+        payload: application_id and resume_path (stored file name)
+    """
+    filename = payload["resume_path"]
+    path = settings.UPLOAD_DIR / filename
+    # Parsing an upload is CPU-bound and may hit a decompression bomb, so it
+    # runs in the memory-capped worker processes
+    resume_text = await run_in_worker(extract_file_text, str(path), path.suffix.lower())
+
+    application = await timed("applications.find_one_and_update", database.db.applications.find_one_and_update(
+        {"id": payload["application_id"], "resume_path": filename},
+        {"$set": {"resume_text": resume_text, "text_updated_at": datetime.now(timezone.utc).isoformat()}},
+        projection={"_id": 0, "id": 1, "job_id": 1, "resume_text": 1, "message": 1},
+        return_document=ReturnDocument.AFTER
+    ))
+    if application:
+        await application_text_changed(application)
+        logger.info("✅ Resume text extracted: %s", payload["application_id"])
+
+
+def resume_followups(application_id: str, filename: str, resume_text: str, scan_status: str) -> list:
+    """Tasks an application still needs for its resume, as (name, payload) pairs"""
+    if scan_status == "pending":
+        return [("scan_resume", {"resume_path": filename})]
+    if scan_status == "clean" and not resume_text:
+        return [("extract_resume_text", {"application_id": application_id, "resume_path": filename})]
+    return []
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    """
+    The pool that scans, extracts and previews resumes, created on first use
+
+    Workers are spawned rather than forked, so they share no state with the
+    API process, and their memory is capped by SCAN_MEMORY_LIMIT_MB.
+    """
+    global worker_pool
+    if worker_pool is None:
+        worker_pool = ProcessPoolExecutor(
+            max_workers=settings.SCAN_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=limit_worker_memory,
+            initargs=(settings.SCAN_MEMORY_LIMIT_MB,)
+        )
+    return worker_pool
+
+
+def shutdown_worker_pool():
+    """Stop the worker processes if started"""
+    global worker_pool
+    if worker_pool is not None:
+        worker_pool.shutdown(wait=False, cancel_futures=True)
+        worker_pool = None
+
+
+def terminate_worker_pool():
+    """Kill the worker processes, e.g. one stuck on a hostile file, and drop the pool"""
+    if worker_pool is not None:
+        # ProcessPoolExecutor has no public way to stop a running call
+        for process in list((worker_pool._processes or {}).values()):
+            process.terminate()
+    shutdown_worker_pool()
+
+
+async def run_in_worker(function: Callable[..., Any], *args) -> Any:
+    """
+    Run a function on an uploaded file in the worker pool
+
+    Raises:
+        TimeoutError: If it took longer than SCAN_TIMEOUT_SECONDS (the
+            pool's processes are killed, so the stuck call can't hold a
+            worker, and the pool is replaced)
+        BrokenProcessPool: If a worker process died, e.g. on its memory
+            limit (the pool is replaced)
+    """
+    pool = get_worker_pool()
+    future = asyncio.get_running_loop().run_in_executor(pool, function, *args)
+    try:
+        return await asyncio.wait_for(future, settings.SCAN_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        # wait_for only stops waiting; the call would keep its process busy.
+        # Other calls in the pool fail with BrokenProcessPool and are retried
+        if worker_pool is pool:
+            terminate_worker_pool()
+        raise
+    except BrokenProcessPool:
+        if worker_pool is pool:
+            shutdown_worker_pool()
+        raise
+
+
+async def run_scan(path: Path) -> Tuple[str, str]:
+    """Sniff and scan a file in the worker pool (see run_in_worker)"""
+    options = {"clamd_url": settings.CLAMD_URL, "timeout": settings.SCAN_TIMEOUT_SECONDS}
+    return await run_in_worker(scan_file, str(path), path.suffix.lower(), settings.SCANNER, options)
+
+
+async def set_scan_status(filename: str, status: str, detail: str):
+    """Record a scan verdict on every application using the stored file"""
+    await timed("applications.update_many", database.db.applications.update_many(
+        {"resume_path": filename},
+        {"$set": {
+            "scan_status": status,
+            "scan_detail": detail,
+            "scanned_at": datetime.now(timezone.utc).isoformat()
+        }}
+    ))
+    RESUME_SCANS.inc(status)
+
+
+@task("scan_resume")
+async def scan_resume(payload: dict):
+    """
+    Scan a stored resume and release it from quarantine if clean
+
+    Idempotent: the file is scanned wherever it is and moved to match the
+    verdict, so repeated or backfill scans are safe.
+
+    Args:
+        payload: resume_path (stored file name)
+    """
+    filename = payload["resume_path"]
+    quarantined = settings.QUARANTINE_DIR / filename
+    published = settings.UPLOAD_DIR / filename
+
+    if quarantined.is_file():
+        path = quarantined
+    elif published.is_file():
+        path = published
+    else:
+        logger.warning("⚠️ Resume to scan not found: %s", filename)
+        await set_scan_status(filename, "missing", "file not found")
+        return
+
+    verdict, detail = await run_scan(path)
+
+    target = published if verdict == "clean" else quarantined
+    if path != target:
+        await asyncio.to_thread(shutil.move, path, target)
+    await set_scan_status(filename, verdict, detail)
+
+    if verdict != "clean":
+        logger.warning("⚠️ Resume quarantined: %s (%s: %s)", filename, verdict, detail)
+        return
+
+    logger.info("✅ Resume scanned clean: %s", filename)
+    pending_text = await timed("applications.find", database.db.applications.find(
+        {"resume_path": filename, "resume_text": ""}, {"_id": 0, "id": 1}
+    ).to_list(None))
+    await enqueue_all([
+        ("extract_resume_text", {"application_id": application["id"], "resume_path": filename})
+        for application in pending_text
+    ] + [("render_preview", {"resume_path": filename})])
+
+
+# File names per update when backfilling scan statuses
+BACKFILL_BATCH_SIZE = 1000
+
+
+def stored_resumes(filenames: List[str]) -> List[str]:
+    """The files that are in UPLOAD_DIR or QUARANTINE_DIR (blocking)"""
+    return [
+        filename for filename in filenames
+        if (settings.UPLOAD_DIR / filename).is_file() or (settings.QUARANTINE_DIR / filename).is_file()
+    ]
+
+
+async def set_unscanned_status(filenames: List[str], fields: dict):
+    """Set scan fields on applications that have no scan_status yet, in batches"""
+    for start in range(0, len(filenames), BACKFILL_BATCH_SIZE):
+        await timed("applications.update_many", database.db.applications.update_many(
+            {"resume_path": {"$in": filenames[start:start + BACKFILL_BATCH_SIZE]}, "scan_status": {"$exists": False}},
+            {"$set": fields}
+        ))
+
+
+async def backfill_resume_scans() -> int:
+    """
+    Queue scans for resumes stored before scanning existed (startup maintenance)
+
+    Applications whose file isn't stored (e.g. imported data) are marked
+    "missing" at once instead of queueing a scan that can only say so.
+
+    Returns:
+        Number of stored files queued
+    """
+    filenames = await timed("applications.distinct", database.db.applications.distinct(
+        "resume_path", {"scan_status": {"$exists": False}}
+    ))
+    if not filenames:
+        return 0
+
+    stored = await asyncio.to_thread(stored_resumes, filenames)
+    absent = sorted(set(filenames) - set(stored))
+    if absent:
+        await set_unscanned_status(absent, {"scan_status": "missing", "scan_detail": "file not found"})
+        logger.warning("⚠️ Resumes not stored, marked missing: %s files", len(absent))
+    if stored:
+        await set_unscanned_status(stored, {"scan_status": "pending"})
+        await enqueue_all([("scan_resume", {"resume_path": filename}) for filename in stored])
+        logger.info("✅ Resume scans queued for %s stored files", len(stored))
+    return len(stored)
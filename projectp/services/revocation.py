@@ -0,0 +1,58 @@
+"""
+Project P Innovations - Session Revocation
+Revoked admin sessions, held in each worker as a Bloom filter
+
+Revoked sessions are kept in db.revoked_sessions for as long as their
+access tokens can live. A request from a session that was never revoked
+is answered from the filter with no database lookup; only filter hits
+(including rare false positives) are confirmed against MongoDB. Workers
+rebuild the filter when another worker revokes a session (see
+services/coordination.py).
+"""
+
+import logging
+from datetime import datetime, timezone, timedelta
+
+from projectp import database, settings
+from projectp.bloom import BloomFilter
+from projectp.database import timed
+from projectp.services.coordination import broadcast_invalidation
+
+logger = logging.getLogger(__name__)
+
+# Revoked session IDs in this worker, rebuilt from db.revoked_sessions
+revoked_filter = BloomFilter(1024)
+
+
+async def revoke(session_id: str):
+    """Reject a session's access tokens in every worker until they expire"""
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_TTL_MINUTES)
+    await timed("revoked_sessions.update_one", database.db.revoked_sessions.update_one(
+        {"_id": session_id},
+        {"$set": {"expires_at": expires_at}},
+        upsert=True
+    ))
+    revoked_filter.add(session_id)
+    await broadcast_invalidation("revoked_sessions")
+
+
+async def load_revocations():
+    """Rebuild this worker's filter from db.revoked_sessions"""
+    global revoked_filter
+    docs = await timed("revoked_sessions.find", database.db.revoked_sessions.find(
+        {"expires_at": {"$gt": datetime.now(timezone.utc)}},
+        {"_id": 1}
+    ).to_list(None))
+    revoked_filter = BloomFilter.from_items(doc["_id"] for doc in docs)
+    logger.info("✅ Revoked sessions loaded: %s", len(docs))
+
+
+async def is_revoked(session_id: str) -> bool:
+    """Whether a session was revoked (as of this worker's last sync)"""
+    if session_id not in revoked_filter:
+        return False
+    revoked = await timed("revoked_sessions.find_one", database.db.revoked_sessions.find_one(
+        {"_id": session_id, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+        {"_id": 1}
+    ))
+    return revoked is not None
@@ -0,0 +1,140 @@
+"""
+Project P Innovations - Match Scoring Service
+Lazily built match index (NumPy is only imported once scoring is used)
+
+Application vectors are cached per worker, at most
+MATCH_CACHE_MAX_APPLICATIONS of them. When an application's matchable text
+changes (resume text extracted, duplicate merged) the write stamps
+text_updated_at and bumps the "application_vectors" cache version; every
+worker then drops the vectors of applications stamped since its last
+reload, so scores don't depend on which worker answers.
+"""
+
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.services.coordination import broadcast_invalidation
+
+# Created by the first match-sorted listing; until then write paths skip
+# vector upkeep so workers that never score don't pay for it
+match_index = None
+
+# Start of the last application vector reload in this worker
+vectors_checked_at: Optional[datetime] = None
+
+# Re-check this far back on each reload, for clock skew between hosts and
+# writes that landed just after the previous reload's query
+VECTOR_RELOAD_LOOKBACK = timedelta(seconds=60)
+
+# Application IDs per $in query when loading vectors
+LOAD_BATCH_SIZE = 1000
+
+
+def get_match_index():
+    """The match index, created on first use"""
+    global match_index, vectors_checked_at
+    if match_index is None:
+        from projectp.matching import MatchIndex
+
+        match_index = MatchIndex()
+        vectors_checked_at = datetime.now(timezone.utc)
+    return match_index
+
+
+def index_job(job: dict):
+    """Refresh a job vector if the index is in use"""
+    if match_index is not None:
+        match_index.upsert_job(job)
+
+
+def unindex_job(job_id: str):
+    """Drop a job vector if the index is in use"""
+    if match_index is not None:
+        match_index.remove_job(job_id)
+
+
+def drop_job_vectors():
+    """Forget cached job vectors so they are reloaded on the next scoring"""
+    if match_index is not None:
+        for job_id in list(match_index.jobs):
+            match_index.remove_job(job_id)
+
+
+def index_application(application: dict):
+    """Add an application vector if the index is in use"""
+    if match_index is not None:
+        match_index.upsert_application(application)
+
+
+async def application_text_changed(application: dict):
+    """
+    Refresh an application's vector here and have other workers drop theirs
+
+    The caller must have stored text_updated_at with the new text.
+
+    Args:
+        application: Application document with id, resume_text and message
+    """
+    index_application(application)
+    await broadcast_invalidation("application_vectors")
+
+
+async def reload_application_vectors():
+    """Drop vectors of applications whose text changed since the last reload"""
+    global vectors_checked_at
+    if match_index is None:
+        return
+
+    now = datetime.now(timezone.utc)
+    since = vectors_checked_at - VECTOR_RELOAD_LOOKBACK
+    changed = await timed("applications.find", database.db.applications.find(
+        {"text_updated_at": {"$gte": since.isoformat()}}, {"_id": 0, "id": 1}
+    ).to_list(None))
+    for application in changed:
+        match_index.remove_application(application["id"])
+    vectors_checked_at = now
+
+
+async def score_applications(job_id: str, application_ids: List[str]) -> Dict[str, float]:
+    """
+    Score applications against a job
+
+    Job and application vectors are cached in the match index; only cache
+    misses are loaded from the database (just the text fields) before
+    scoring in one batch.
+
+    Args:
+        job_id: Job to score against
+        application_ids: Applications to score
+
+    Returns:
+        Mapping of application ID to match score
+
+    Raises:
+        HTTPException: If job not found
+    """
+    index = get_match_index()
+
+    if not index.has_job(job_id):
+        job = await timed("jobs.find_one", database.db.jobs.find_one({"id": job_id}, {"_id": 0}))
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        index.upsert_job(job)
+
+    missing = [application_id for application_id in application_ids if not index.has_application(application_id)]
+    for start in range(0, len(missing), LOAD_BATCH_SIZE):
+        applications = await timed("applications.find", database.db.applications.find(
+            {"id": {"$in": missing[start:start + LOAD_BATCH_SIZE]}},
+            {"_id": 0, "id": 1, "job_id": 1, "resume_text": 1, "message": 1}
+        ).to_list(None))
+        for application in applications:
+            index.upsert_application(application)
+
+    scores = index.score(job_id, [a for a in application_ids if index.has_application(a)])
+    # Trim after scoring, so one large job can't evict its own vectors mid-request
+    index.trim_applications(settings.MATCH_CACHE_MAX_APPLICATIONS)
+    return scores
@@ -0,0 +1,129 @@
+"""
+Project P Innovations - Admin Sessions
+Session start, refresh-token rotation and logout
+
+Login starts a session: a short-lived access token (verified locally, see
+services/auth.py) plus an opaque refresh token stored hashed in
+db.refresh_tokens. Each refresh token works once and is replaced by a new
+one; presenting a used token again means it leaked, so the whole session
+is revoked (see services/revocation.py). Dashboard tabs share one refresh
+token, so a token reused within REFRESH_REUSE_GRACE_SECONDS of its rotation
+is taken as a concurrent refresh and gets fresh tokens for the same session.
+"""
+
+import hashlib
+import logging
+import secrets
+import uuid
+from datetime import datetime, timezone, timedelta
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.services import revocation
+from projectp.services.auth import create_access_token
+
+logger = logging.getLogger(__name__)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Refresh tokens are stored as SHA-256 hashes, never in the clear"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def issue_tokens(admin: dict, session_id: str) -> dict:
+    """Create an access token and a new refresh token for a session"""
+    refresh_token = secrets.token_urlsafe(32)
+    now = datetime.now(timezone.utc)
+    await timed("refresh_tokens.insert_one", database.db.refresh_tokens.insert_one({
+        "_id": hash_refresh_token(refresh_token),
+        "session_id": session_id,
+        "admin_id": admin.get("id", ""),
+        "email": admin["email"],
+        "created_at": now,
+        "expires_at": now + timedelta(days=settings.REFRESH_TOKEN_TTL_DAYS),
+        "rotated_at": None
+    }))
+
+    return {
+        "token": create_access_token(admin["email"], session_id),
+        "refresh_token": refresh_token,
+        "expires_in": settings.ACCESS_TOKEN_TTL_MINUTES * 60,
+        "admin": {"id": admin.get("id", ""), "email": admin["email"]}
+    }
+
+
+async def start_session(admin: dict) -> dict:
+    """
+    Start a session after a successful login
+
+    Args:
+        admin: Admin document
+
+    Returns:
+        Access token, refresh token, access token lifetime and admin info
+    """
+    return await issue_tokens(admin, uuid.uuid4().hex)
+
+
+async def rotate_session(refresh_token: str) -> dict:
+    """
+    Exchange a refresh token for new tokens
+
+    Args:
+        refresh_token: Refresh token from the previous login or refresh
+
+    Returns:
+        Same as start_session
+
+    Raises:
+        HTTPException: If the token is unknown, expired, already used
+            outside the grace period (the session is then revoked) or its
+            session was revoked
+    """
+    now = datetime.now(timezone.utc)
+    token_hash = hash_refresh_token(refresh_token)
+    current = await timed("refresh_tokens.find_one_and_update", database.db.refresh_tokens.find_one_and_update(
+        {"_id": token_hash, "rotated_at": None, "expires_at": {"$gt": now}},
+        {"$set": {"rotated_at": now}},
+        return_document=ReturnDocument.BEFORE
+    ))
+
+    if current is None:
+        current = await timed("refresh_tokens.find_one", database.db.refresh_tokens.find_one({
+            "_id": token_hash,
+            "rotated_at": {"$gt": now - timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS)},
+            "expires_at": {"$gt": now}
+        }))
+        if current:
+            logger.info("🔄 Refresh token reused within the grace period: session %s", current["session_id"])
+
+    if current is None:
+        used = await timed("refresh_tokens.find_one", database.db.refresh_tokens.find_one({"_id": token_hash}))
+        if used and used.get("rotated_at"):
+            logger.warning("⚠️ Refresh token reused, revoking session %s", used["session_id"])
+            await revoke_session(used["session_id"])
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    if await revocation.is_revoked(current["session_id"]):
+        raise HTTPException(status_code=401, detail="Session revoked")
+
+    return await issue_tokens({"id": current["admin_id"], "email": current["email"]}, current["session_id"])
+
+
+async def end_session(refresh_token: str):
+    """Log out the session a refresh token belongs to (unknown tokens are ignored)"""
+    current = await timed("refresh_tokens.find_one", database.db.refresh_tokens.find_one(
+        {"_id": hash_refresh_token(refresh_token)}
+    ))
+    if current:
+        await revoke_session(current["session_id"])
+
+
+async def revoke_session(session_id: str):
+    """Delete a session's refresh tokens and reject its access tokens in every worker"""
+    await timed("refresh_tokens.delete_many", database.db.refresh_tokens.delete_many({"session_id": session_id}))
+    await revocation.revoke(session_id)
+    logger.info("✅ Session revoked: %s", session_id)
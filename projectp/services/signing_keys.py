@@ -0,0 +1,282 @@
+"""
+Project P Innovations - Signing Keys
+Asymmetric JWT signing keys: generation, scheduled rotation and the JWKS
+
+Keys live in db.signing_keys, private halves encrypted with JWT_SECRET,
+and every worker holds the whole ring in memory. Tokens carry the signing
+key's ``kid``; any key in the ring verifies. A new key is published
+JWT_KEY_PUBLISH_AHEAD_SECONDS before it starts signing, so workers and
+edge proxies caching /.well-known/jwks.json know it before they see it,
+and a key stays in the ring until tokens it signed have expired.
+
+Public keys are stored in the clear. After JWT_SECRET changes, keys
+encrypted with the old secret can't sign here but still verify the tokens
+they signed; a worker without any key it can sign with publishes a new
+one.
+
+With JWT_ALGORITHM=HS256 tokens are signed with JWT_SECRET as before and
+the JWKS is empty.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Any, List, Optional
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.services.coordination import broadcast_invalidation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SigningKey:
+    """One key pair of the ring (private_key is None if it can only verify)"""
+    kid: str
+    algorithm: str
+    active_from: datetime
+    private_key: Any
+    public_key: Any
+
+    def jwk(self) -> dict:
+        """Public key as a JSON Web Key"""
+        from jwt.algorithms import get_default_algorithms
+
+        jwk = json.loads(get_default_algorithms()[self.algorithm].to_jwk(self.public_key))
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+# All keys this worker signs or verifies with, oldest first
+key_ring: List[SigningKey] = []
+
+rotation_task = None
+
+
+def asymmetric() -> bool:
+    return settings.JWT_ALGORITHM != "HS256"
+
+
+def generate_key(algorithm: str, active_from: datetime) -> SigningKey:
+    """
+    Create a new key pair
+
+    Args:
+        algorithm: "EdDSA" (Ed25519) or "RS256" (RSA 2048)
+        active_from: When the key starts signing
+
+    Returns:
+        Signing key with a random kid
+    """
+    if algorithm == "EdDSA":
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    return SigningKey(uuid.uuid4().hex, algorithm, active_from, private_key, private_key.public_key())
+
+
+def key_document(key: SigningKey) -> dict:
+    """Serialize a key for db.signing_keys (private key encrypted with JWT_SECRET)"""
+    from cryptography.hazmat.primitives import serialization
+
+    private_pem = key.private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.BestAvailableEncryption(settings.JWT_SECRET.encode("utf-8"))
+    )
+    public_pem = key.public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return {
+        "_id": key.kid,
+        "algorithm": key.algorithm,
+        "active_from": key.active_from,
+        "created_at": datetime.now(timezone.utc),
+        "private_key": private_pem.decode("ascii"),
+        "public_key": public_pem.decode("ascii")
+    }
+
+
+def key_from_document(doc: dict) -> Optional[SigningKey]:
+    """
+    Load a key stored by key_document
+
+    Returns:
+        The key; verify-only if its private key was encrypted with another
+        JWT_SECRET, or None if it can't be used at all (no stored public key)
+    """
+    from cryptography.hazmat.primitives import serialization
+
+    active_from = doc["active_from"]
+    if active_from.tzinfo is None:
+        active_from = active_from.replace(tzinfo=timezone.utc)
+
+    try:
+        private_key = serialization.load_pem_private_key(
+            doc["private_key"].encode("ascii"),
+            password=settings.JWT_SECRET.encode("utf-8")
+        )
+    except (ValueError, TypeError):
+        if not doc.get("public_key"):
+            return None
+        public_key = serialization.load_pem_public_key(doc["public_key"].encode("ascii"))
+        return SigningKey(doc["_id"], doc["algorithm"], active_from, None, public_key)
+    return SigningKey(doc["_id"], doc["algorithm"], active_from, private_key, private_key.public_key())
+
+
+def keys_from_documents(docs: List[dict]) -> List[SigningKey]:
+    """Load stored keys, skipping (and logging) those that can't be used"""
+    keys = []
+    for doc in docs:
+        key = key_from_document(doc)
+        if key is None:
+            logger.error("❌ Signing key %s can't be decrypted with JWT_SECRET, skipped", doc["_id"])
+        else:
+            if key.private_key is None:
+                logger.warning("⚠️ Signing key %s was encrypted with another JWT_SECRET, verifying only", key.kid)
+            keys.append(key)
+    return keys
+
+
+def current_signing_key() -> Optional[SigningKey]:
+    """The newest key that has started signing and can sign here"""
+    now = datetime.now(timezone.utc)
+    active = [key for key in key_ring if key.active_from <= now and key.private_key is not None]
+    return active[-1] if active else None
+
+
+def verification_key(kid: Optional[str]) -> Optional[SigningKey]:
+    """The ring key with this kid"""
+    for key in key_ring:
+        if key.kid == kid:
+            return key
+    return None
+
+
+def jwks() -> dict:
+    """Public keys of the ring as a JWK Set"""
+    return {"keys": [key.jwk() for key in key_ring]}
+
+
+async def load_signing_keys():
+    """Replace this worker's ring with the keys in db.signing_keys"""
+    docs = await timed("signing_keys.find", database.db.signing_keys.find(
+        {"algorithm": settings.JWT_ALGORITHM}
+    ).sort("active_from", 1).to_list(None))
+    key_ring[:] = await asyncio.to_thread(keys_from_documents, docs)
+    logger.info("✅ Signing keys loaded: %s", len(key_ring))
+
+
+async def rotate_signing_keys() -> bool:
+    """
+    Publish the next key when the signing key is due for rotation (or none
+    can sign with this JWT_SECRET), and drop keys whose tokens have all
+    expired (one worker at a time)
+
+    Returns:
+        True if db.signing_keys changed
+    """
+    if not await database.acquire_lock("signing-key-rotation", 60):
+        return False
+
+    try:
+        now = datetime.now(timezone.utc)
+        docs = await timed("signing_keys.find", database.db.signing_keys.find(
+            {"algorithm": settings.JWT_ALGORITHM}
+        ).sort("active_from", 1).to_list(None))
+        for doc in docs:
+            if doc["active_from"].tzinfo is None:
+                doc["active_from"] = doc["active_from"].replace(tzinfo=timezone.utc)
+        keys = await asyncio.to_thread(lambda: [key_from_document(doc) for doc in docs])
+        signing = [key for key in keys if key is not None and key.private_key is not None]
+        changed = False
+
+        rotation = timedelta(days=settings.JWT_KEY_ROTATION_DAYS)
+        ahead = timedelta(seconds=settings.JWT_KEY_PUBLISH_AHEAD_SECONDS)
+        if not signing or now >= signing[-1].active_from + rotation - ahead:
+            # The first usable key signs at once; later ones are published ahead of use
+            active_from = max(now + ahead, signing[-1].active_from) if signing else now
+            key = await asyncio.to_thread(generate_key, settings.JWT_ALGORITHM, active_from)
+            await timed("signing_keys.insert_one", database.db.signing_keys.insert_one(key_document(key)))
+            logger.info("🔑 Signing key %s published, signing from %s", key.kid, active_from.isoformat())
+            changed = True
+
+        # A key is retired once a later key signs; keep it until its last
+        # tokens expire. Only a key this worker can sign with retires one it
+        # can sign with, so a key left by an old JWT_SECRET (published
+        # ahead, say) never retires the key that replaced it.
+        token_lifetime = timedelta(minutes=settings.ACCESS_TOKEN_TTL_MINUTES)
+        signing_kids = {key.kid for key in signing}
+        retired = [
+            doc["_id"] for i, doc in enumerate(docs)
+            if any(
+                later["active_from"] + token_lifetime < now
+                and (later["_id"] in signing_kids or doc["_id"] not in signing_kids)
+                for later in docs[i + 1:]
+            )
+        ]
+        if retired:
+            await timed("signing_keys.delete_many", database.db.signing_keys.delete_many({"_id": {"$in": retired}}))
+            logger.info("🔑 Signing keys removed: %s", ", ".join(retired))
+            changed = True
+
+        return changed
+    finally:
+        await database.release_lock("signing-key-rotation")
+
+
+async def prepare_signing_keys():
+    """
+    Make sure a signing key exists and load the ring (at startup)
+
+    Raises:
+        RuntimeError: If no signing key became available
+    """
+    if not asymmetric():
+        return
+
+    if await rotate_signing_keys():
+        await broadcast_invalidation("signing_keys")
+    await load_signing_keys()
+
+    # Another worker may be creating the first key right now
+    for _ in range(40):
+        if current_signing_key():
+            return
+        await asyncio.sleep(0.25)
+        await load_signing_keys()
+    raise RuntimeError("No JWT signing key available")
+
+
+async def run_key_rotation():
+    """Check for due rotations every JWT_KEY_CHECK_INTERVAL_SECONDS until cancelled"""
+    while True:
+        await asyncio.sleep(settings.JWT_KEY_CHECK_INTERVAL_SECONDS)
+        try:
+            if await rotate_signing_keys():
+                await load_signing_keys()
+                await broadcast_invalidation("signing_keys")
+        except Exception as e:
+            logger.warning("⚠️ Signing key rotation failed: %s", e)
+
+
+def start_key_rotation():
+    """Start the rotation checker (asymmetric algorithms only)"""
+    global rotation_task
+    if asymmetric():
+        rotation_task = asyncio.create_task(run_key_rotation())
+
+
+def stop_key_rotation():
+    """Cancel the rotation checker if running"""
+    if rotation_task:
+        rotation_task.cancel()
@@ -0,0 +1,96 @@
+"""
+Project P Innovations - Startup
+Per-phase startup timing and the once-per-deployment maintenance task
+(indexes, seeding, counter backfill)
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+from projectp import database, settings
+from projectp.metrics import STARTUP_PHASE_SECONDS
+from projectp.seeding import load_seed_data, seed_admins, seed_jobs
+from projectp.services.catalog import load_job_catalog
+from projectp.services.coordination import broadcast_invalidation
+from projectp.services.counters import rebuild_counters
+from projectp.services.resumes import backfill_resume_scans
+
+logger = logging.getLogger(__name__)
+
+# Duration in seconds of each startup phase in this worker
+startup_phases: Dict[str, float] = {}
+
+
+@contextmanager
+def startup_phase(name: str):
+    """Time a startup phase into ``startup_phases`` and the metrics registry"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        startup_phases[name] = round(elapsed, 4)
+        STARTUP_PHASE_SECONDS.set(name, value=elapsed)
+        logger.info(
+            "⏱️ Startup phase %s: %.1fms", name, elapsed * 1000,
+            extra={"phase": name, "duration_ms": round(elapsed * 1000, 2)}
+        )
+
+
+async def seed_database() -> bool:
+    """
+    Seed the admin user and, on an empty database, the fixture jobs
+
+    Jobs are only seeded into an empty collection so renamed or archived
+    sample jobs are not recreated on every deploy. Use the seeding command
+    to load fixtures into an existing database.
+
+    Returns:
+        True if jobs were inserted
+    """
+    db = database.db
+    data = load_seed_data()
+    await seed_admins(db, data["admins"])
+
+    if await db.jobs.find_one({}, {"_id": 1}):
+        return False
+    return await seed_jobs(db, data["jobs"]) > 0
+
+
+async def run_startup_maintenance() -> bool:
+    """
+    Ensure indexes, seed, backfill counters and queue scans of unscanned
+    resumes once across all workers
+
+    Every step is idempotent; the lock only keeps concurrently booting
+    workers from repeating the work.
+
+    Returns:
+        False if maintenance failed
+    """
+    try:
+        if not await database.acquire_lock("startup-maintenance", settings.STARTUP_LOCK_TTL_SECONDS):
+            logger.info("⏭️ Startup maintenance running elsewhere, skipped")
+            return True
+
+        try:
+            with startup_phase("indexes"):
+                await database.ensure_indexes()
+            with startup_phase("seed"):
+                jobs_seeded = await seed_database()
+            with startup_phase("counters"):
+                await rebuild_counters()
+            with startup_phase("resume_scans"):
+                await backfill_resume_scans()
+            if jobs_seeded:
+                await load_job_catalog()
+                await broadcast_invalidation("job_catalog")
+        finally:
+            await database.release_lock("startup-maintenance")
+    except Exception as e:
+        logger.error("❌ Startup maintenance failed: %s", e)
+        return False
+
+    return True
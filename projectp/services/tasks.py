@@ -0,0 +1,333 @@
+"""
+Project P Innovations - Task Queue
+Post-request work (emails, resume text extraction, counter updates) run by
+asyncio workers after the response has been sent
+
+Handlers register with ``@task("name")`` and are queued with
+``enqueue("name", payload)``. With TASK_BACKEND=memory tasks wait in an
+asyncio.Queue of this worker and are lost if the process dies. With
+TASK_BACKEND=mongo they are stored in db.tasks and claimed by any worker
+with a lease (TASK_LEASE_SECONDS), so they survive restarts and a crashed
+worker's task runs again once its lease expires. Either way a task can run
+more than once, so handlers must be idempotent or tolerate a repeat.
+
+A failing task is retried up to TASK_MAX_ATTEMPTS times with exponential
+backoff, then recorded in db.dead_letters. Handlers that record failures
+themselves can check last_attempt() so a retried failure is recorded once.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from projectp import database, settings
+from projectp.database import timed
+from projectp.metrics import TASK_DURATION, TASK_QUEUE_DEPTH, TASKS_ENQUEUED, TASKS_FINISHED, TASKS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+# Task name -> handler taking the task payload
+handlers: Dict[str, Callable[[dict], Awaitable[None]]] = {}
+
+# Memory backend: queued tasks and retries waiting out their backoff
+task_queue: Optional[asyncio.Queue] = None
+retry_handles = set()
+
+# Mongo backend: set when this worker enqueues, so idle workers claim at once
+wake_up: Optional[asyncio.Event] = None
+
+worker_tasks: List[asyncio.Task] = []
+stopping = False
+
+# Task ID -> monotonic start time, for tasks running in this worker
+running_since: Dict[str, float] = {}
+
+# The task whose handler is running in the current context (see last_attempt)
+current_task: ContextVar[Optional[dict]] = ContextVar("current_task", default=None)
+
+
+def task(name: str):
+    """Register the decorated coroutine function as the handler for ``name``"""
+    def register(handler):
+        handlers[name] = handler
+        return handler
+    return register
+
+
+def last_attempt() -> bool:
+    """Whether the running task won't be retried if it fails (True outside a task)"""
+    doc = current_task.get()
+    return doc is None or doc["attempts"] >= settings.TASK_MAX_ATTEMPTS
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next try of a task that failed ``attempts`` times"""
+    return min(settings.TASK_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.TASK_RETRY_MAX_SECONDS)
+
+
+async def enqueue_all(jobs: List[Tuple[str, dict]]) -> List[str]:
+    """
+    Queue several tasks (one insert with the mongo backend)
+
+    Args:
+        jobs: (task name, payload) pairs; payloads must be BSON-serializable
+
+    Returns:
+        Task IDs
+
+    Raises:
+        ValueError: If a task name has no handler
+    """
+    now = datetime.now(timezone.utc)
+    docs = []
+    for name, payload in jobs:
+        if name not in handlers:
+            raise ValueError(f"Unknown task: {name}")
+        docs.append({
+            "_id": uuid.uuid4().hex,
+            "name": name,
+            "payload": payload,
+            "attempts": 0,
+            "created_at": now,
+            "run_at": now
+        })
+
+    if settings.TASK_BACKEND == "mongo":
+        await timed("tasks.insert_many", database.db.tasks.insert_many(
+            [{**doc, "status": "queued", "locked_until": None} for doc in docs]
+        ))
+        if wake_up:
+            wake_up.set()
+    else:
+        for doc in docs:
+            get_task_queue().put_nowait(doc)
+
+    for doc in docs:
+        TASKS_ENQUEUED.inc(doc["name"])
+    return [doc["_id"] for doc in docs]
+
+
+async def enqueue(name: str, payload: dict) -> str:
+    """Queue one task (see enqueue_all)"""
+    task_ids = await enqueue_all([(name, payload)])
+    return task_ids[0]
+
+
+def get_task_queue() -> asyncio.Queue:
+    global task_queue
+    if task_queue is None:
+        task_queue = asyncio.Queue()
+    return task_queue
+
+
+async def queue_depth() -> int:
+    """Tasks queued or running (all workers with the mongo backend)"""
+    if settings.TASK_BACKEND == "mongo":
+        depth = await timed("tasks.count_documents", database.db.tasks.count_documents({}))
+    else:
+        depth = get_task_queue().qsize() + len(retry_handles) + len(running_since)
+    TASK_QUEUE_DEPTH.set(value=depth)
+    return depth
+
+
+def worker_health() -> dict:
+    """
+    Task health of this worker alone, for its readiness probe
+
+    Returns:
+        workers_alive (task worker coroutines still running), running and
+        stuck (running longer than TASK_LEASE_SECONDS) tasks, and
+        local_backlog (tasks waiting in this worker's memory queue)
+    """
+    now = time.monotonic()
+    local_backlog = 0
+    if settings.TASK_BACKEND == "memory" and task_queue is not None:
+        local_backlog = task_queue.qsize() + len(retry_handles)
+    return {
+        "workers_alive": sum(1 for worker in worker_tasks if not worker.done()),
+        "running": len(running_since),
+        "stuck": sum(1 for started in running_since.values() if now - started > settings.TASK_LEASE_SECONDS),
+        "local_backlog": local_backlog
+    }
+
+
+async def run_task(doc: dict) -> Optional[Exception]:
+    """Run a task's handler, returning the error if it failed"""
+    name = doc["name"]
+    running_since[doc["_id"]] = time.monotonic()
+    TASKS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    token = current_task.set(doc)
+    try:
+        handler = handlers.get(name)
+        if handler is None:
+            raise LookupError(f"No handler for task {name}")
+        await handler(doc["payload"])
+        return None
+    except Exception as e:
+        return e
+    finally:
+        current_task.reset(token)
+        TASK_DURATION.observe(time.perf_counter() - start, name)
+        TASKS_IN_FLIGHT.dec()
+        running_since.pop(doc["_id"], None)
+
+
+async def dead_letter(doc: dict, error: Exception):
+    """Record a task that used up its attempts in db.dead_letters"""
+    await timed("dead_letters.insert_one", database.db.dead_letters.insert_one({
+        "_id": doc["_id"],
+        "name": doc["name"],
+        "payload": doc["payload"],
+        "attempts": doc["attempts"],
+        "error": str(error),
+        "created_at": doc["created_at"],
+        "failed_at": datetime.now(timezone.utc)
+    }))
+    TASKS_FINISHED.inc(doc["name"], "dead_lettered")
+    logger.error("❌ Task %s (%s) failed %s times, dead-lettered: %s", doc["_id"], doc["name"], doc["attempts"], error)
+
+
+async def process_memory_task(doc: dict):
+    doc["attempts"] += 1
+    error = await run_task(doc)
+    if error is None:
+        TASKS_FINISHED.inc(doc["name"], "succeeded")
+    elif doc["attempts"] < settings.TASK_MAX_ATTEMPTS:
+        delay = retry_delay(doc["attempts"])
+        logger.warning("⚠️ Task %s (%s) failed, retrying in %.0fs: %s", doc["_id"], doc["name"], delay, error)
+        TASKS_FINISHED.inc(doc["name"], "retried")
+
+        def requeue():
+            retry_handles.discard(handle)
+            get_task_queue().put_nowait(doc)
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        retry_handles.add(handle)
+    else:
+        await dead_letter(doc, error)
+
+
+async def run_memory_worker():
+    """Run tasks from this worker's queue until cancelled"""
+    queue = get_task_queue()
+    while True:
+        doc = await queue.get()
+        try:
+            await process_memory_task(doc)
+        except Exception as e:
+            logger.error("❌ Task %s (%s) could not be settled: %s", doc["_id"], doc["name"], e)
+        finally:
+            queue.task_done()
+
+
+async def claim_task() -> Optional[dict]:
+    """Lease the next due task in db.tasks, including ones whose lease ran out"""
+    now = datetime.now(timezone.utc)
+    return await timed("tasks.find_one_and_update", database.db.tasks.find_one_and_update(
+        {
+            "$or": [
+                {"status": "queued", "run_at": {"$lte": now}},
+                {"status": "running", "locked_until": {"$lte": now}}
+            ]
+        },
+        {
+            "$set": {
+                "status": "running",
+                "locked_until": now + timedelta(seconds=settings.TASK_LEASE_SECONDS),
+                "worker": database.INSTANCE_ID
+            },
+            "$inc": {"attempts": 1}
+        },
+        sort=[("run_at", 1)],
+        return_document=ReturnDocument.AFTER
+    ))
+
+
+async def process_mongo_task(doc: dict):
+    error = await run_task(doc)
+    if error is None:
+        await timed("tasks.delete_one", database.db.tasks.delete_one({"_id": doc["_id"]}))
+        TASKS_FINISHED.inc(doc["name"], "succeeded")
+    elif doc["attempts"] < settings.TASK_MAX_ATTEMPTS:
+        delay = retry_delay(doc["attempts"])
+        logger.warning("⚠️ Task %s (%s) failed, retrying in %.0fs: %s", doc["_id"], doc["name"], delay, error)
+        await timed("tasks.update_one", database.db.tasks.update_one(
+            {"_id": doc["_id"]},
+            {"$set": {
+                "status": "queued",
+                "run_at": datetime.now(timezone.utc) + timedelta(seconds=delay),
+                "locked_until": None,
+                "error": str(error)
+            }}
+        ))
+        TASKS_FINISHED.inc(doc["name"], "retried")
+    else:
+        await dead_letter(doc, error)
+        await timed("tasks.delete_one", database.db.tasks.delete_one({"_id": doc["_id"]}))
+
+
+async def run_mongo_worker():
+    """Claim and run tasks from db.tasks until stopped"""
+    while not stopping:
+        try:
+            doc = await claim_task()
+            if doc is not None:
+                await process_mongo_task(doc)
+                continue
+        except Exception as e:
+            logger.warning("⚠️ Task worker error: %s", e)
+
+        wake_up.clear()
+        try:
+            await asyncio.wait_for(wake_up.wait(), settings.TASK_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_task_workers():
+    """Start TASK_WORKERS workers for the configured backend"""
+    global wake_up, stopping
+    stopping = False
+    if settings.TASK_BACKEND == "mongo":
+        wake_up = asyncio.Event()
+        worker = run_mongo_worker
+    else:
+        get_task_queue()
+        worker = run_memory_worker
+    worker_tasks[:] = [asyncio.create_task(worker()) for _ in range(settings.TASK_WORKERS)]
+    logger.info("✅ Task workers started: %s (%s)", settings.TASK_WORKERS, settings.TASK_BACKEND)
+
+
+async def stop_task_workers():
+    """Let queued (memory) or running (mongo) tasks finish for up to TASK_DRAIN_SECONDS, then stop"""
+    global stopping
+    stopping = True
+    if wake_up:
+        wake_up.set()
+
+    try:
+        if settings.TASK_BACKEND == "mongo":
+            if worker_tasks:
+                await asyncio.wait(worker_tasks, timeout=settings.TASK_DRAIN_SECONDS)
+        elif task_queue is not None:
+            await asyncio.wait_for(task_queue.join(), settings.TASK_DRAIN_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("⚠️ Task queue not drained: %s tasks left", task_queue.qsize())
+
+    for worker in worker_tasks:
+        worker.cancel()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
+    worker_tasks.clear()
+
+    if retry_handles:
+        logger.warning("⚠️ Dropping %s task retries on shutdown", len(retry_handles))
+        for handle in retry_handles:
+            handle.cancel()
+        retry_handles.clear()
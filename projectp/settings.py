@@ -0,0 +1,333 @@
+"""
+Project P Innovations - Settings
+Typed configuration, validated once at import from the environment (and .env)
+
+Every value comes from, in order of precedence: an environment variable of
+the same name, the profile selected by APP_ENV (development, load_test or
+production), then the defaults below. Invalid values fail at startup with
+one error listing every problem.
+
+Check a configuration without starting the server:
+    APP_ENV=production python -m projectp.settings
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Mapping, Optional, Set
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(ROOT_DIR / '.env')
+
+DEFAULT_JWT_SECRET = 'projectp-secret-key-change-in-prod'
+
+# Environment variables whose names differ from the setting they fill
+ENV_ALIASES = {"DUPLICATE_POLICY": "DUPLICATE_APPLICATION_POLICY"}
+
+# Settings that are never printed in full
+SECRETS = {"MONGO_URL", "JWT_SECRET", "RESEND_API_KEY", "METRICS_TOKEN", "DOWNLOAD_URL_SECRET"}
+
+
+class Settings(BaseModel):
+    """All server configuration; field names match the environment variables"""
+
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    APP_ENV: Literal["development", "load_test", "production"] = "development"
+
+    # Logging (JSON lines via a background writer thread;
+    # LOG_INFO_SAMPLE_RATE keeps only a fraction of INFO records under load)
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    LOG_INFO_SAMPLE_RATE: float = Field(1.0, ge=0, le=1)
+
+    # MongoDB Configuration
+    MONGO_URL: str = 'mongodb://localhost:27017'
+    DB_NAME: str = Field('test_database', min_length=1)
+    # Connection pool (per worker process) and client tuning
+    MONGO_MAX_POOL_SIZE: int = Field(50, ge=1)
+    MONGO_MIN_POOL_SIZE: int = Field(5, ge=0)
+    MONGO_MAX_IDLE_TIME_MS: int = Field(300000, ge=0)
+    MONGO_CONNECT_TIMEOUT_MS: int = Field(5000, gt=0)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(5000, gt=0)
+    MONGO_SOCKET_TIMEOUT_MS: int = Field(20000, ge=0)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = Field(2000, gt=0)
+    MONGO_READ_PREFERENCE: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = 'primary'
+    MONGO_COMPRESSORS: str = ''
+
+    # Read routing for public catalog reads (get_jobs, get_job): these may be
+    # served by secondaries within a staleness bound. Admin routes, writes and
+    # read-after-write paths always use the client default (primary).
+    CATALOG_READ_PREFERENCE: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = 'secondaryPreferred'
+    CATALOG_MAX_STALENESS_SECONDS: int = 90
+    CATALOG_READ_CONCERN: Literal["local", "available", "majority", "linearizable", "snapshot"] = 'local'
+
+    # Commands slower than MONGO_SLOW_MS go to the "mongo.slow" log with their filter shape
+    MONGO_SLOW_MS: float = Field(100, ge=0)
+
+    # JWT Configuration: access tokens are short-lived and verified without
+    # MongoDB; refresh tokens rotate on every use (see services/sessions.py).
+    # EdDSA and RS256 sign with rotating key pairs published at
+    # /.well-known/jwks.json (see services/signing_keys.py), and JWT_SECRET
+    # encrypts the stored private keys; HS256 signs with JWT_SECRET itself
+    JWT_SECRET: str = Field(DEFAULT_JWT_SECRET, min_length=16)
+    JWT_ALGORITHM: Literal["EdDSA", "RS256", "HS256"] = "EdDSA"
+    JWT_ISSUER: str = Field("projectp-api", min_length=1)
+    JWT_KEY_ROTATION_DAYS: int = Field(30, ge=1)
+    JWT_KEY_PUBLISH_AHEAD_SECONDS: int = Field(3600, ge=0)
+    JWT_KEY_CHECK_INTERVAL_SECONDS: float = Field(600, gt=0)
+    ACCESS_TOKEN_TTL_MINUTES: int = Field(15, ge=1, le=24 * 60)
+    REFRESH_TOKEN_TTL_DAYS: int = Field(7, ge=1)
+    # A refresh token used again this soon after its rotation is another tab
+    # refreshing at the same moment, not a leak
+    REFRESH_REUSE_GRACE_SECONDS: int = Field(10, ge=0)
+
+    # Email Configuration (Resend); EMAIL_CONCURRENCY bounds the blocking
+    # Resend calls running at once in the thread pool
+    RESEND_API_KEY: Optional[str] = None
+    EMAIL_FROM: str = 'vishalpala@projectpinnovations.com'
+    EMAIL_TO: str = 'vishalpala@projectpinnovations.com'
+    EMAIL_CONCURRENCY: int = Field(4, ge=1)
+
+    # Readiness Checks (results cached so frequent probes stay cheap)
+    READY_CACHE_SECONDS: float = Field(2, ge=0)
+    READY_MAX_MONGO_LATENCY_MS: float = Field(500, gt=0)
+    READY_MIN_FREE_BYTES: int = Field(200 * 1024 * 1024, ge=0)
+    # Tasks waiting in this worker's memory queue (TASK_BACKEND=memory only;
+    # the shared mongo backlog is reported, not checked)
+    READY_MAX_TASK_BACKLOG: int = Field(200, ge=0)
+
+    # Post-request task queue (see services/tasks.py): memory keeps tasks in
+    # the worker that queued them; mongo stores them in db.tasks so any
+    # worker can run them and they survive restarts
+    TASK_BACKEND: Literal["memory", "mongo"] = "memory"
+    TASK_WORKERS: int = Field(4, ge=1)
+    TASK_MAX_ATTEMPTS: int = Field(5, ge=1)
+    TASK_RETRY_BASE_SECONDS: float = Field(5, gt=0)
+    TASK_RETRY_MAX_SECONDS: float = Field(600, gt=0)
+    TASK_LEASE_SECONDS: int = Field(300, ge=1)
+    TASK_POLL_INTERVAL_SECONDS: float = Field(1, gt=0)
+    TASK_DRAIN_SECONDS: float = Field(10, ge=0)
+
+    # File Upload Configuration (uploads are read UPLOAD_CHUNK_SIZE bytes at a
+    # time, so oversized files are rejected without buffering them whole)
+    UPLOAD_DIR: Path = ROOT_DIR / "uploads"
+    ALLOWED_EXTENSIONS: Set[str] = {".pdf", ".doc", ".docx"}
+
+    # Resume scanning (see services/resumes.py): uploads wait in
+    # QUARANTINE_DIR until a scan worker process clears them. SCANNER=stub
+    # only detects the EICAR test file; use clamd with a ClamAV daemon
+    QUARANTINE_DIR: Path = ROOT_DIR / "quarantine"
+    SCANNER: Literal["stub", "clamd"] = "stub"
+    CLAMD_URL: str = "tcp://127.0.0.1:3310"
+    # Scan workers also extract resume text and render previews
+    SCAN_WORKERS: int = Field(2, ge=1)
+    SCAN_TIMEOUT_SECONDS: float = Field(60, gt=0)
+    SCAN_MEMORY_LIMIT_MB: int = Field(512, ge=0)
+
+    # Resume previews (see services/previews.py): a text snippet and, for
+    # PDFs with the optional pypdfium2 package installed, a first-page PNG,
+    # cached in PREVIEW_CACHE_DIR by content hash and evicted least recently
+    # used first once the cache exceeds PREVIEW_CACHE_MAX_BYTES
+    PREVIEW_CACHE_DIR: Path = ROOT_DIR / "preview_cache"
+    PREVIEW_CACHE_MAX_BYTES: int = Field(256 * 1024 * 1024, ge=0)
+    PREVIEW_WIDTH: int = Field(600, ge=100, le=2000)
+    PREVIEW_SNIPPET_CHARS: int = Field(500, ge=0)
+    MAX_FILE_SIZE: int = Field(5 * 1024 * 1024, gt=0)  # 5MB
+    UPLOAD_CHUNK_SIZE: int = Field(64 * 1024, ge=1024)
+
+    # Signed resume download links (see services/downloads.py). The secret
+    # defaults to one derived from JWT_SECRET; DOWNLOAD_BASE_URL points the
+    # links at another host (a CDN or static file layer) instead of this API
+    DOWNLOAD_URL_SECRET: Optional[str] = Field(None, min_length=16)
+    DOWNLOAD_URL_TTL_SECONDS: int = Field(300, ge=10, le=86400)
+    DOWNLOAD_BASE_URL: Optional[str] = None
+
+    # Application Rate Limit (per client IP). "memory" counts per worker
+    # process; "mongo" shares the counts between workers and instances
+    APPLY_RATE_LIMIT: int = Field(10, ge=1)
+    APPLY_RATE_LIMIT_WINDOW_SECONDS: int = Field(3600, ge=1)
+    RATE_LIMIT_BACKEND: Literal["memory", "mongo"] = "memory"
+
+    # Admin login throttling, per account and per client IP (see
+    # services/login_throttle.py); counts use RATE_LIMIT_BACKEND
+    LOGIN_ACCOUNT_FREE_ATTEMPTS: int = Field(3, ge=0)
+    LOGIN_IP_FREE_ATTEMPTS: int = Field(20, ge=0)
+    LOGIN_BACKOFF_BASE_SECONDS: float = Field(1.0, gt=0)
+    LOGIN_BACKOFF_MAX_SECONDS: float = Field(60.0, gt=0)
+    LOGIN_MAX_SLEEP_SECONDS: float = Field(2.0, ge=0)
+    LOGIN_ACCOUNT_LOCKOUT_ATTEMPTS: int = Field(10, ge=1)
+    LOGIN_IP_LOCKOUT_ATTEMPTS: int = Field(50, ge=1)
+    LOGIN_LOCKOUT_SECONDS: int = Field(900, ge=1)
+    LOGIN_FAILURE_WINDOW_SECONDS: int = Field(900, ge=1)
+
+    # Duplicate Application Handling (same email + job, or identical resume for a job)
+    # reject: 409 error | merge: update the existing application | flag: store with duplicate_of
+    DUPLICATE_POLICY: Literal["reject", "merge", "flag"] = 'reject'
+
+    # Live Events: "local" publishes from the write paths in this process,
+    # "change_streams" tails MongoDB change streams (requires a replica set).
+    # "local" only sees this worker's writes, so it is limited to one worker
+    EVENTS_SOURCE: Literal["local", "change_streams"] = 'local'
+
+    # Startup: indexes, seeding and counter backfill run once per deployment under a
+    # MongoDB lock, off the critical path. "background" runs them after the worker
+    # starts serving; "off" leaves them to the separate command (python -m projectp.seeding)
+    SEED_ON_STARTUP: Literal["background", "off"] = 'background'
+    STARTUP_LOCK_TTL_SECONDS: int = Field(300, ge=1)
+
+    # Worker processes per instance (0 = one per CPU core; see projectp.serve)
+    # and how often each worker picks up cache invalidations from the others
+    # (0 disables, for a single worker)
+    WEB_CONCURRENCY: int = Field(1, ge=0)
+    CACHE_SYNC_INTERVAL_SECONDS: float = Field(2, ge=0)
+
+    # Match scoring: application vectors each worker caches, least recently
+    # scored dropped first (see services/scoring.py)
+    MATCH_CACHE_MAX_APPLICATIONS: int = Field(50_000, ge=0)
+
+    # Metrics: optional bearer token required to scrape /metrics
+    METRICS_TOKEN: Optional[str] = None
+
+    # CORS Origins
+    CORS_ORIGINS: List[str] = ['*']
+
+    @field_validator(
+        "DUPLICATE_POLICY", "EVENTS_SOURCE", "SEED_ON_STARTUP", "LOG_FORMAT", "RATE_LIMIT_BACKEND",
+        "TASK_BACKEND", "SCANNER", mode="before"
+    )
+    @classmethod
+    def lower_case(cls, value: Any) -> Any:
+        return value.lower() if isinstance(value, str) else value
+
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def upper_case(cls, value: Any) -> Any:
+        return value.upper() if isinstance(value, str) else value
+
+    @field_validator("CORS_ORIGINS", "ALLOWED_EXTENSIONS", mode="before")
+    @classmethod
+    def split_list(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(',') if item.strip()]
+        return value
+
+    @model_validator(mode="after")
+    def check_consistency(self) -> "Settings":
+        if self.MONGO_MIN_POOL_SIZE > self.MONGO_MAX_POOL_SIZE:
+            raise ValueError("MONGO_MIN_POOL_SIZE cannot exceed MONGO_MAX_POOL_SIZE")
+        if self.CATALOG_MAX_STALENESS_SECONDS != -1 and self.CATALOG_MAX_STALENESS_SECONDS < 90:
+            raise ValueError("CATALOG_MAX_STALENESS_SECONDS must be -1 (no bound) or at least 90")
+        if self.QUARANTINE_DIR.resolve() == self.UPLOAD_DIR.resolve():
+            raise ValueError("QUARANTINE_DIR must differ from UPLOAD_DIR")
+        if self.PREVIEW_CACHE_DIR.resolve() in (self.UPLOAD_DIR.resolve(), self.QUARANTINE_DIR.resolve()):
+            raise ValueError("PREVIEW_CACHE_DIR must differ from UPLOAD_DIR and QUARANTINE_DIR")
+        if self.UPLOAD_CHUNK_SIZE > self.MAX_FILE_SIZE:
+            raise ValueError("UPLOAD_CHUNK_SIZE cannot exceed MAX_FILE_SIZE")
+        if self.JWT_KEY_PUBLISH_AHEAD_SECONDS >= self.JWT_KEY_ROTATION_DAYS * 86400:
+            raise ValueError("JWT_KEY_PUBLISH_AHEAD_SECONDS must be shorter than JWT_KEY_ROTATION_DAYS")
+        if self.WEB_CONCURRENCY != 1 and self.RATE_LIMIT_BACKEND == "memory":
+            raise ValueError("RATE_LIMIT_BACKEND must be mongo when running more than one worker")
+        if self.WEB_CONCURRENCY != 1 and self.EVENTS_SOURCE == "local":
+            raise ValueError("EVENTS_SOURCE must be change_streams when running more than one worker")
+        if self.APP_ENV == "production" and self.JWT_SECRET == DEFAULT_JWT_SECRET:
+            raise ValueError("JWT_SECRET must be set in production")
+        return self
+
+
+# Per-environment defaults; environment variables still take precedence
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "development": {
+        "LOG_FORMAT": "text",
+        "MONGO_MAX_POOL_SIZE": 10,
+        "MONGO_MIN_POOL_SIZE": 1
+    },
+    # Throughput runs (benchmarks/load_test.py): no rate limit, little logging
+    "load_test": {
+        "LOG_LEVEL": "WARNING",
+        "LOG_INFO_SAMPLE_RATE": 0.01,
+        "DB_NAME": "projectp_load_test",
+        "MONGO_MAX_POOL_SIZE": 100,
+        "MONGO_MIN_POOL_SIZE": 10,
+        "EMAIL_CONCURRENCY": 16,
+        "READY_MAX_TASK_BACKLOG": 10 ** 6,
+        "APPLY_RATE_LIMIT": 10 ** 9,
+        "LOGIN_ACCOUNT_FREE_ATTEMPTS": 10 ** 9,
+        "LOGIN_IP_FREE_ATTEMPTS": 10 ** 9,
+        "LOGIN_ACCOUNT_LOCKOUT_ATTEMPTS": 10 ** 9,
+        "LOGIN_IP_LOCKOUT_ATTEMPTS": 10 ** 9
+    },
+    "production": {
+        "LOG_INFO_SAMPLE_RATE": 1.0,
+        "MONGO_MAX_POOL_SIZE": 50,
+        "MONGO_MIN_POOL_SIZE": 5,
+        "WEB_CONCURRENCY": 0,
+        "RATE_LIMIT_BACKEND": "mongo",
+        "TASK_BACKEND": "mongo",
+        "EVENTS_SOURCE": "change_streams"
+    }
+}
+
+
+def load_settings(environ: Mapping[str, str] = os.environ) -> Settings:
+    """
+    Build and validate the settings for the profile named by APP_ENV
+
+    Args:
+        environ: Environment variables to read (defaults to os.environ)
+
+    Returns:
+        Validated settings
+
+    Raises:
+        RuntimeError: If APP_ENV is unknown or any value is invalid
+    """
+    profile = environ.get("APP_ENV", "development").lower()
+    if profile not in PROFILES:
+        raise RuntimeError(f"Invalid APP_ENV: {profile} (expected one of {', '.join(PROFILES)})")
+
+    values = {**PROFILES[profile], "APP_ENV": profile}
+    for name in Settings.model_fields:
+        env_name = ENV_ALIASES.get(name, name)
+        if env_name in environ:
+            values[name] = environ[env_name]
+
+    try:
+        return Settings(**values)
+    except ValidationError as e:
+        problems = []
+        for error in e.errors():
+            if error["loc"]:
+                name = str(error["loc"][0])
+                problems.append(f"{ENV_ALIASES.get(name, name)}: {error['msg']}")
+            else:
+                problems.append(error["msg"].removeprefix("Value error, "))
+        raise RuntimeError(f"Invalid configuration ({profile}): {'; '.join(problems)}") from None
+
+
+def describe(config: Settings) -> Dict[str, Any]:
+    """Settings as plain values with secrets masked, for logs and the CLI"""
+    described = {}
+    for name, value in config.model_dump(mode="json").items():
+        if name in SECRETS and value:
+            value = "***"
+        described[name] = value
+    return described
+
+
+config = load_settings()
+
+# Module-level names for each setting (settings.MONGO_URL etc.); tests and
+# tools can still override them by assignment
+globals().update(config.model_dump())
+
+
+if __name__ == "__main__":
+    for name, value in describe(config).items():
+        print(f"{name}={value}")
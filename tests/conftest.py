@@ -0,0 +1,106 @@
+"""
+Shared fixtures: an in-memory MongoDB (mongomock-motor) in place of the
+real one, and the asyncio backend for @pytest.mark.anyio tests
+"""
+
+import mongomock_motor
+import pytest
+
+from projectp import database
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """A fresh in-memory database installed as database.db"""
+    import mongomock.collection
+
+    # pymongo 4.9+ passes sort= to bulk updates, which mongomock predates
+    # (as in benchmarks/load_test.py)
+    for name in ("add_update", "add_replace"):
+        original = getattr(mongomock.collection.BulkOperationBuilder, name)
+
+        def without_sort(self, *args, _original=original, **kwargs):
+            kwargs.pop("sort", None)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(mongomock.collection.BulkOperationBuilder, name, without_sort)
+
+    mock_db = mongomock_motor.AsyncMongoMockClient()["projectp_test"]
+    monkeypatch.setattr(database, "db", mock_db)
+    return mock_db
+
+
+@pytest.fixture
+def task_queue(monkeypatch):
+    """Fresh task queue state with one worker and near-instant retries"""
+    from projectp import settings
+    from projectp.services import tasks
+
+    monkeypatch.setattr(settings, "TASK_WORKERS", 1)
+    monkeypatch.setattr(settings, "TASK_RETRY_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "TASK_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "TASK_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "TASK_DRAIN_SECONDS", 1)
+    monkeypatch.setattr(tasks, "task_queue", None)
+    monkeypatch.setattr(tasks, "wake_up", None)
+    monkeypatch.setattr(tasks, "worker_tasks", [])
+    monkeypatch.setattr(tasks, "running_since", {})
+    monkeypatch.setattr(tasks, "retry_handles", set())
+    return tasks
+
+
+@pytest.fixture
+def resume_dirs(tmp_path, monkeypatch):
+    """Upload, quarantine and preview directories in a temp dir; stops the worker pool afterwards"""
+    from projectp import settings
+    from projectp.services import resumes
+
+    for name in ("UPLOAD_DIR", "QUARANTINE_DIR", "PREVIEW_CACHE_DIR"):
+        directory = tmp_path / name.lower()
+        directory.mkdir()
+        monkeypatch.setattr(settings, name, directory)
+    monkeypatch.setattr(settings, "SCAN_WORKERS", 1)
+    monkeypatch.setattr(settings, "SCANNER", "stub")
+    yield tmp_path
+    resumes.shutdown_worker_pool()
+
+
+@pytest.fixture
+async def client(db, resume_dirs, task_queue, monkeypatch):
+    """
+    HTTP client for the app, without its lifespan (no MongoDB connection,
+    task workers or log writer thread; tests set up the state they need)
+    """
+    import httpx
+
+    from projectp import main, settings
+    from projectp.bloom import BloomFilter
+    from projectp.services import catalog, coordination, rate_limit, revocation
+
+    monkeypatch.setattr(main, "configure_logging", lambda **kwargs: None)
+    monkeypatch.setattr(database, "catalog_db", db)
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "memory")
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "HS256")
+    monkeypatch.setattr(rate_limit, "rate_limit_store", {})
+    monkeypatch.setattr(revocation, "revoked_filter", BloomFilter(1024))
+    monkeypatch.setattr(coordination, "cache_versions", {})
+
+    catalog.job_catalog.clear()
+
+    transport = httpx.ASGITransport(app=main.create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
+    catalog.job_catalog.clear()
+
+
+@pytest.fixture
+def admin_headers(client):
+    """Authorization header of a logged-in admin session"""
+    from projectp.services.auth import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token('admin@example.com', 'test-session')}"}
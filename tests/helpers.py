@@ -0,0 +1,17 @@
+"""Polling helper for tests of background work"""
+
+import asyncio
+import time
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    """Poll an async or plain condition until it holds"""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition()
+        if asyncio.iscoroutine(result):
+            result = await result
+        if result:
+            return
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from projectp import database, settings
+from projectp.routers import applications
+
+pytestmark = pytest.mark.anyio
+
+JOB = {"id": "job-1", "slug": "python-engineer", "title": "Python Engineer", "description": "", "tags": []}
+
+
+@pytest.fixture
+async def job(db):
+    await database.ensure_indexes()
+    await db.jobs.insert_one(dict(JOB))
+    return JOB
+
+
+async def apply(client, email="ada@example.com", resume=b"%PDF-1.4 first resume", message="Hello"):
+    return await client.post("/api/apply", data={
+        "name": "Ada Lovelace",
+        "email": email,
+        "message": message,
+        "job_id": "job-1"
+    }, files={"resume": ("resume.pdf", resume, "application/pdf")})
+
+
+def queued_tasks(tasks):
+    """Names of the tasks queued so far (removed from the queue)"""
+    queue = tasks.get_task_queue()
+    names = []
+    while not queue.empty():
+        names.append(queue.get_nowait()["name"])
+    return names
+
+
+def stored_files():
+    return sorted(path.name for path in settings.QUARANTINE_DIR.iterdir())
+
+
+async def test_reject_policy_refuses_a_second_application(client, job, db, monkeypatch):
+    monkeypatch.setattr(settings, "DUPLICATE_POLICY", "reject")
+    assert (await apply(client)).status_code == 201
+
+    response = await apply(client, email=" ADA@example.com", resume=b"%PDF-1.4 another resume")
+
+    assert response.status_code == 409
+    assert await db.applications.count_documents({}) == 1
+    assert len(stored_files()) == 1
+
+
+async def test_merge_policy_updates_the_original(client, job, db, monkeypatch):
+    monkeypatch.setattr(settings, "DUPLICATE_POLICY", "merge")
+    first = (await apply(client)).json()
+    old_file = stored_files()
+
+    response = await apply(client, resume=b"%PDF-1.4 updated resume", message="Updated")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "success": True, "message": "Application updated successfully", "id": first["id"], "duplicate": True
+    }
+    [application] = await db.applications.find({}, {"_id": 0}).to_list(None)
+    assert application["message"] == "Updated"
+    assert application["submission_count"] == 2
+    # The replaced resume is deleted, only the new one is stored
+    assert stored_files() == [application["resume_path"]]
+    assert stored_files() != old_file
+
+
+async def test_flag_policy_stores_the_duplicate_without_emailing(client, job, db, task_queue, monkeypatch):
+    monkeypatch.setattr(settings, "DUPLICATE_POLICY", "flag")
+    first = (await apply(client)).json()
+    assert "application_email" in queued_tasks(task_queue)
+
+    response = await apply(client, resume=b"%PDF-1.4 another resume")
+
+    assert response.status_code == 201
+    assert response.json()["duplicate_of"] == first["id"]
+    assert "application_email" not in queued_tasks(task_queue)
+    assert await db.applications.count_documents({"duplicate_of": first["id"]}) == 1
+
+
+async def test_same_resume_reuses_the_stored_file(client, job, db):
+    await apply(client, email="ada@example.com")
+    await client.post("/api/apply", data={"name": "Ada Lovelace", "email": "ada@example.com"},
+                      files={"resume": ("resume.pdf", b"%PDF-1.4 first resume", "application/pdf")})
+
+    paths = await db.applications.distinct("resume_path")
+    assert len(paths) == 1
+    assert stored_files() == paths
+
+
+@pytest.mark.parametrize("policy", ["reject", "merge", "flag"])
+async def test_concurrent_duplicates_follow_the_policy(client, job, db, monkeypatch, policy):
+    """Both submissions pass the duplicate check; the unique index decides"""
+    monkeypatch.setattr(settings, "DUPLICATE_POLICY", policy)
+    find_duplicate = applications.find_duplicate
+    checks = 0
+
+    async def racing_find_duplicate(*args):
+        nonlocal checks
+        checks += 1
+        if checks <= 2:
+            await asyncio.sleep(0.05)  # let the other submission pass its check too
+            return None
+        return await find_duplicate(*args)
+
+    monkeypatch.setattr(applications, "find_duplicate", racing_find_duplicate)
+
+    responses = await asyncio.gather(
+        apply(client, resume=b"%PDF-1.4 first resume"),
+        apply(client, resume=b"%PDF-1.4 second resume")
+    )
+
+    statuses = sorted(response.status_code for response in responses)
+    originals = await db.applications.count_documents({"duplicate_of": None})
+    assert originals == 1
+    if policy == "reject":
+        assert statuses == [201, 409]
+        assert len(stored_files()) == 1
+    elif policy == "merge":
+        assert statuses == [200, 201]
+        assert await db.applications.count_documents({}) == 1
+        assert len(stored_files()) == 1
+    else:
+        assert statuses == [201, 201]
+        assert await db.applications.count_documents({}) == 2
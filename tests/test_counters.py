@@ -0,0 +1,58 @@
+import pytest
+
+from projectp.services import counters
+
+pytestmark = pytest.mark.anyio
+
+
+async def add_applications(db):
+    await db.jobs.insert_one({"id": "job-1", "title": "Engineer"})
+    await db.applications.insert_many([
+        {"id": "a", "job_id": "job-1", "job_title": "Engineer", "created_at": "2026-10-01T09:00:00+00:00"},
+        {"id": "b", "job_id": "job-1", "job_title": "Engineer", "created_at": "2026-10-02T09:00:00+00:00"},
+        {"id": "c", "job_id": None, "job_title": None, "created_at": "2026-10-02T10:00:00+00:00"}
+    ])
+    await db.email_logs.insert_many([{"status": "sent"}, {"status": "sent"}, {"status": "failed"}])
+
+
+async def counter_values(db):
+    return {
+        doc["_id"]: doc.get("applications", doc.get("active", doc.get("sent")))
+        for doc in await db.counters.find({}).to_list(None)
+    }
+
+
+async def test_startup_backfills_an_empty_collection(db):
+    await add_applications(db)
+
+    await counters.rebuild_counters()
+
+    assert await counter_values(db) == {
+        "jobs": 1, "emails": 2, "job:job-1": 2, "job:general": 1, "day:2026-10-01": 1, "day:2026-10-02": 2
+    }
+
+
+async def test_startup_leaves_existing_counters_alone(db):
+    await add_applications(db)
+    await counters.increment_counter("job:job-1", {"applications": 1})
+
+    await counters.rebuild_counters()
+
+    assert await counter_values(db) == {"job:job-1": 1}
+
+
+async def test_forced_rebuild_recomputes_despite_a_live_increment(db):
+    """A counter recreated by a running API must not skip the rebuild"""
+    await add_applications(db)
+    await counters.count_application("job-1", "Engineer", "2026-10-02T11:00:00+00:00")
+    await db.counters.insert_one({"_id": "day:2020-01-01", "kind": "day", "date": "2020-01-01", "applications": 5})
+
+    await counters.rebuild_counters(force=True)
+
+    values = await counter_values(db)
+    assert values["job:job-1"] == 2
+    assert values["day:2026-10-01"] == 1
+    assert values["emails"] == 2
+    assert "day:2020-01-01" not in values
+    emails = await db.counters.find_one({"_id": "emails"})
+    assert emails["failed"] == 1
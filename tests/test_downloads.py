@@ -0,0 +1,89 @@
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import pytest
+
+from projectp import settings
+from projectp.services.downloads import sign_download
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = b"%PDF-1.4 resume"
+
+
+async def add_application(db, application_id="app-1", filename="resume-1.pdf", scan_status="clean"):
+    directory = settings.UPLOAD_DIR if scan_status == "clean" else settings.QUARANTINE_DIR
+    (directory / filename).write_bytes(CONTENT)
+    await db.applications.insert_one({
+        "id": application_id, "name": "Ada Lovelace", "resume_path": filename, "scan_status": scan_status
+    })
+
+
+async def resume_link(client, admin_headers, application_id="app-1"):
+    response = await client.post(f"/api/admin/applications/{application_id}/resume-link", headers=admin_headers)
+    assert response.status_code == 200
+    url = urlsplit(response.json()["url"])
+    return url.path, {key: values[0] for key, values in parse_qs(url.query).items()}
+
+
+async def test_signed_link_downloads_the_resume(client, admin_headers, db):
+    await add_application(db)
+    path, params = await resume_link(client, admin_headers)
+
+    response = await client.get(f"{path}?{urlencode(params)}")
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert 'filename="Ada_Lovelace_resume.pdf"' in response.headers["content-disposition"]
+    assert "Authorization" not in response.request.headers
+
+
+@pytest.mark.parametrize("field, value", [
+    ("signature", "A" * 43),
+    ("name", "other_resume.pdf"),
+    ("expires", "9999999999")
+])
+async def test_tampered_link_is_refused(client, admin_headers, db, field, value):
+    await add_application(db)
+    path, params = await resume_link(client, admin_headers)
+
+    response = await client.get(f"{path}?{urlencode({**params, field: value})}")
+
+    assert response.status_code == 403
+
+
+async def test_link_is_bound_to_its_file(client, admin_headers, db):
+    await add_application(db)
+    await add_application(db, "app-2", "resume-2.pdf")
+    _, params = await resume_link(client, admin_headers)
+
+    response = await client.get(f"/api/files/resumes/resume-2.pdf?{urlencode(params)}")
+
+    assert response.status_code == 403
+
+
+async def test_expired_link_is_refused(client, db):
+    await add_application(db)
+    params = sign_download("resume-1.pdf", "Ada_Lovelace_resume.pdf", ttl_seconds=-60)
+
+    response = await client.get(f"/api/files/resumes/resume-1.pdf?{urlencode(params)}")
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Download link expired"
+
+
+@pytest.mark.parametrize("scan_status, status_code", [("pending", 409), ("infected", 403), ("rejected", 403)])
+async def test_no_link_for_a_resume_that_is_not_clean(client, admin_headers, db, scan_status, status_code):
+    await add_application(db, scan_status=scan_status)
+
+    response = await client.post("/api/admin/applications/app-1/resume-link", headers=admin_headers)
+
+    assert response.status_code == status_code
+
+
+async def test_old_token_query_route_is_gone(client, admin_headers, db):
+    await add_application(db)
+    token = admin_headers["Authorization"].split(" ")[1]
+
+    response = await client.get(f"/api/admin/applications/app-1/resume?token={token}")
+
+    assert response.status_code == 401
@@ -0,0 +1,80 @@
+import pytest
+
+from projectp import settings
+from projectp.services import email
+from tests.helpers import wait_for
+
+pytestmark = pytest.mark.anyio
+
+PAYLOAD = {"name": "Ada", "email": "ada@example.com", "job_title": None, "message": None, "filename": "cv.pdf"}
+
+
+@pytest.fixture
+def resend(monkeypatch):
+    """Stand-in for Resend failing the first ``failures`` calls"""
+    class FakeResend:
+        failures = 0
+        calls = 0
+
+        async def __call__(self, params):
+            self.calls += 1
+            if self.calls <= self.failures:
+                raise RuntimeError("provider down")
+            return {"id": f"re_{self.calls}"}
+
+    fake = FakeResend()
+    monkeypatch.setattr(email, "call_resend", fake)
+    return fake
+
+
+async def run_email_task(tasks, db):
+    tasks.start_task_workers()
+    await tasks.enqueue("application_email", PAYLOAD)
+    await wait_for(lambda: tasks.get_task_queue().qsize() == 0 and not tasks.retry_handles and not tasks.running_since)
+    await tasks.stop_task_workers()
+    logs = await db.email_logs.find({}, {"_id": 0}).to_list(None)
+    counter = await db.counters.find_one({"_id": "emails"}) or {}
+    return logs, counter
+
+
+async def test_retried_failure_is_logged_once(db, task_queue, resend):
+    resend.failures = 1
+
+    logs, counter = await run_email_task(task_queue, db)
+
+    assert resend.calls == 2
+    assert [log["status"] for log in logs] == ["sent"]
+    assert counter.get("failed", 0) == 0
+    assert counter["sent"] == 1
+
+
+async def test_last_failed_attempt_is_logged(db, task_queue, resend):
+    resend.failures = settings.TASK_MAX_ATTEMPTS
+
+    logs, counter = await run_email_task(task_queue, db)
+
+    assert resend.calls == settings.TASK_MAX_ATTEMPTS
+    assert [log["status"] for log in logs] == ["failed"]
+    assert counter["failed"] == 1
+    assert await db.dead_letters.count_documents({}) == 1
+
+
+async def test_logging_failure_after_send_is_not_retried(db, task_queue, resend, monkeypatch):
+    async def broken_counter(*args, **kwargs):
+        raise RuntimeError("counters unavailable")
+
+    monkeypatch.setattr(email, "increment_counter", broken_counter)
+
+    await run_email_task(task_queue, db)
+
+    assert resend.calls == 1
+    assert await db.dead_letters.count_documents({}) == 0
+
+
+async def test_direct_send_logs_failure(db, resend):
+    resend.failures = 1
+
+    result = await email.send_email("to@example.com", "Subject", "<p>Hi</p>")
+
+    assert result["success"] is False
+    assert (await db.email_logs.find_one({"id": result["email_log_id"]}))["status"] == "failed"
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from projectp.events import EventBroker, change_to_event
+
+pytestmark = pytest.mark.anyio
+
+
+async def first_events(broker, last_event_id, count):
+    events = []
+    stream = broker.subscribe(last_event_id)
+    async for event in stream:
+        events.append(event)
+        if len(events) == count:
+            break
+    await stream.aclose()
+    return events
+
+
+def test_local_ids_keep_increasing_across_brokers():
+    before = EventBroker().publish("job.created", {"id": "j1"})
+    time.sleep(0.002)  # a restart takes longer than this
+    after = EventBroker().publish("job.created", {"id": "j2"})
+
+    assert tuple(map(int, after["id"].split("-"))) > tuple(map(int, before["id"].split("-")))
+
+
+async def test_replays_missed_events():
+    broker = EventBroker()
+    seen = broker.publish("job.created", {"id": "j1"})
+    missed = broker.publish("job.updated", {"id": "j1"})
+
+    assert await first_events(broker, seen["id"], 1) == [missed]
+
+
+async def test_id_from_before_the_buffer_gets_a_reset():
+    """A restarted (or different) worker can't know what the client missed"""
+    old = EventBroker().publish("job.created", {"id": "j1"})
+    time.sleep(0.002)
+    restarted = EventBroker()
+    latest = restarted.publish("job.updated", {"id": "j1"})
+
+    [reset] = await first_events(restarted, old["id"], 1)
+
+    assert reset["type"] == "stream.reset"
+    assert reset["id"] == latest["id"]
+
+
+@pytest.mark.parametrize("last_event_id", ["42", "garbage", "99999999999999-1"])
+async def test_unknown_ids_get_a_reset(last_event_id):
+    broker = EventBroker()
+
+    [reset] = await first_events(broker, last_event_id, 1)
+
+    assert reset["type"] == "stream.reset"
+    assert reset["id"] is None
+
+
+async def test_change_stream_ids_match_across_workers():
+    """Every worker sees the same cluster time, so any of them can replay"""
+    from bson import Timestamp
+
+    change = {
+        "ns": {"coll": "jobs"},
+        "operationType": "insert",
+        "clusterTime": Timestamp(1_700_000_000, 3),
+        "fullDocument": {"id": "j1", "title": "Engineer"}
+    }
+    first, second = EventBroker(), EventBroker()
+    for broker in (first, second):
+        broker.publish(*change_to_event(change), position=(change["clusterTime"].time, change["clusterTime"].inc))
+    later = second.publish("job.updated", {"id": "j1"}, position=(1_700_000_001, 1))
+
+    assert first.buffer[0]["id"] == second.buffer[0]["id"] == "1700000000-3"
+    assert await first_events(second, first.buffer[0]["id"], 1) == [later]
+
+
+def test_change_stream_maps_a_duplicate_merge_to_an_update():
+    application = {"id": "a1", "name": "Ada", "email": "ada@example.com", "job_id": "job-1"}
+    merge = {
+        "ns": {"coll": "applications"},
+        "operationType": "update",
+        "updateDescription": {"updatedFields": {"name": "Ada", "submission_count": 2}},
+        "fullDocument": application
+    }
+    scan = {
+        "ns": {"coll": "applications"},
+        "operationType": "update",
+        "updateDescription": {"updatedFields": {"scan_status": "clean"}},
+        "fullDocument": application
+    }
+
+    event_type, data = change_to_event(merge)
+
+    assert event_type == "application.updated"
+    assert data["id"] == "a1"
+    assert change_to_event(scan) is None
+    assert change_to_event({**merge, "operationType": "insert"})[0] == "application.created"
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from projectp import settings
+from projectp.services import login_throttle
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=["memory", "mongo"])
+def backend(request, db, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", request.param)
+    monkeypatch.setattr(login_throttle, "login_attempt_store", {})
+    monkeypatch.setattr(settings, "LOGIN_ACCOUNT_FREE_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "LOGIN_IP_FREE_ATTEMPTS", 20)
+    monkeypatch.setattr(settings, "LOGIN_BACKOFF_BASE_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "LOGIN_BACKOFF_MAX_SECONDS", 60.0)
+    monkeypatch.setattr(settings, "LOGIN_MAX_SLEEP_SECONDS", 2.0)
+    monkeypatch.setattr(settings, "LOGIN_ACCOUNT_LOCKOUT_ATTEMPTS", 10)
+    monkeypatch.setattr(settings, "LOGIN_IP_LOCKOUT_ATTEMPTS", 50)
+    return request.param
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff sleeps, recorded instead of slept"""
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(login_throttle.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+async def attempt(email="admin@example.com", ip="10.0.0.1"):
+    await login_throttle.check_login_allowed(email, ip)
+
+
+async def test_backoff_grows_after_the_free_attempts(backend, sleeps):
+    for _ in range(5):
+        await attempt()
+
+    assert [round(s) for s in sleeps] == [1, 2]
+
+    with pytest.raises(HTTPException) as error:
+        await attempt()
+    assert error.value.status_code == 429
+    assert int(error.value.headers["Retry-After"]) >= 3
+
+
+async def test_account_locks_out_at_the_threshold(backend, sleeps, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_MAX_SLEEP_SECONDS", 10 ** 6)
+    for _ in range(9):
+        await attempt()
+
+    with pytest.raises(HTTPException) as error:
+        await attempt()
+    assert error.value.headers["Retry-After"] == str(settings.LOGIN_LOCKOUT_SECONDS)
+
+    with pytest.raises(HTTPException):
+        await attempt()
+    # Another account from the same IP is unaffected
+    await attempt(email="other@example.com")
+
+
+async def test_success_clears_the_account_count(backend, sleeps):
+    for _ in range(3):
+        await attempt()
+    await login_throttle.record_login_success("Admin@Example.com ", "10.0.0.1")
+
+    for _ in range(3):
+        await attempt()
+
+    assert sleeps == []
+
+
+async def test_ip_is_throttled_across_accounts(backend, sleeps, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_IP_FREE_ATTEMPTS", 2)
+
+    for n in range(3):
+        await attempt(email=f"user{n}@example.com")
+
+    assert [round(s) for s in sleeps] == [1]
+
+
+async def test_parallel_burst_is_throttled_like_a_sequential_one(backend, sleeps):
+    results = await asyncio.gather(*(attempt() for _ in range(8)), return_exceptions=True)
+
+    rejected = [r for r in results if isinstance(r, HTTPException)]
+    assert len(rejected) == 8 - 5
+    assert all(r.status_code == 429 for r in rejected)
@@ -0,0 +1,43 @@
+from projectp.matching import MatchIndex
+
+JOB = {"id": "job-1", "title": "Python Engineer", "description": "FastAPI and MongoDB", "tags": ["python"]}
+
+
+def make_index(*applications):
+    index = MatchIndex()
+    index.upsert_job(JOB)
+    for application in applications:
+        index.upsert_application(application)
+    return index
+
+
+def test_all_empty_applications_score_zero():
+    index = make_index({"id": "a", "resume_text": ""}, {"id": "b", "resume_text": "", "message": None})
+
+    assert index.score("job-1", ["a", "b"]) == {"a": 0.0, "b": 0.0}
+
+
+def test_mixed_empty_applications():
+    index = make_index(
+        {"id": "empty", "resume_text": ""},
+        {"id": "match", "resume_text": "Senior python engineer, FastAPI, MongoDB"},
+        {"id": "other", "resume_text": "Pastry chef"}
+    )
+
+    scores = index.score("job-1", ["empty", "match", "other"])
+
+    assert scores["empty"] == 0.0
+    assert scores["other"] == 0.0
+    assert 0.0 < scores["match"] <= 1.0
+
+
+def test_no_applications():
+    assert make_index().score("job-1", []) == {}
+
+
+def test_upsert_replaces_vector():
+    index = make_index({"id": "a", "resume_text": ""})
+    index.upsert_application({"id": "a", "resume_text": "python fastapi"})
+
+    assert index.score("job-1", ["a"])["a"] > 0.0
+    assert index.n_docs == 2
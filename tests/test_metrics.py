@@ -0,0 +1,18 @@
+import os
+
+from projectp.metrics import Counter, Histogram, Registry
+
+
+def test_samples_are_labelled_with_the_worker():
+    registry = Registry()
+    requests = registry.register(Counter("requests_total", "Requests", ("route",)))
+    latency = registry.register(Histogram("latency_seconds", "Latency", buckets=(0.1,)))
+    requests.inc("/api/jobs")
+    latency.observe(0.05)
+
+    text = registry.render()
+
+    worker = f'worker="{os.getpid()}"'
+    assert f'requests_total{{route="/api/jobs",{worker}}} 1.0' in text
+    assert f'latency_seconds_bucket{{{worker},le="0.1"}} 1' in text
+    assert f'latency_seconds_count{{{worker}}} 1' in text
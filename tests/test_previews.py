@@ -0,0 +1,96 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from projectp import settings
+from projectp.services import previews
+
+pytestmark = pytest.mark.anyio
+
+PDF = b"%PDF-1.4\nstream\nBT (Python engineer) Tj ET\nendstream\n"
+
+
+def preview(key):
+    return {"sha256": key, "snippet": "x" * 200, "has_image": False, "width": None, "height": None}
+
+
+def entry_size(cache, key):
+    meta_path, _ = cache.paths(key)
+    return meta_path.stat().st_size
+
+
+def test_least_recently_read_entry_is_evicted(tmp_path):
+    cache = previews.PreviewCache(tmp_path, max_bytes=10 ** 6)
+    for age, key in enumerate(["a", "b", "c"]):
+        cache.put(key, preview(key), None)
+        # Oldest first: a, then b, then c
+        os.utime(cache.paths(key)[0], (time.time() - 100 + age, time.time() - 100 + age))
+    cache.max_bytes = 3 * entry_size(cache, "a")
+
+    assert cache.get("a") is not None  # a is now the most recently read
+    cache.put("d", preview("d"), None)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+
+
+def test_cache_stays_within_its_size_cap(tmp_path):
+    cache = previews.PreviewCache(tmp_path, max_bytes=10 ** 6)
+    cache.put("probe", preview("probe"), None)
+    cache.max_bytes = 5 * entry_size(cache, "probe")
+
+    for n in range(20):
+        cache.put(f"key{n}", {**preview(f"key{n}"), "has_image": True}, b"\x89PNG" + b"\x00" * 50)
+
+    total = sum(path.stat().st_size for path in tmp_path.iterdir())
+    assert total <= cache.max_bytes
+    assert cache.get("key19", with_image=True)["png"].startswith(b"\x89PNG")
+
+
+async def test_concurrent_misses_share_one_render(resume_dirs, monkeypatch):
+    monkeypatch.setattr(previews, "preview_cache", None)
+    renders = 0
+
+    async def slow_render(filename, key):
+        nonlocal renders
+        renders += 1
+        await asyncio.sleep(0.05)
+        return {**preview(key), "png": None}
+
+    monkeypatch.setattr(previews, "render_and_store", slow_render)
+
+    results = await asyncio.gather(*(previews.get_preview("resume.pdf", "key-1") for _ in range(5)))
+
+    assert renders == 1
+    assert all(result["snippet"] == "x" * 200 for result in results)
+    assert previews.rendering == {}
+
+
+async def add_application(db, scan_status):
+    directory = settings.UPLOAD_DIR if scan_status == "clean" else settings.QUARANTINE_DIR
+    (directory / "resume.pdf").write_bytes(PDF)
+    await db.applications.insert_one({"id": "app-1", "resume_path": "resume.pdf", "scan_status": scan_status})
+
+
+@pytest.mark.parametrize("route", ["preview", "preview.png"])
+@pytest.mark.parametrize("scan_status, status_code", [("pending", 409), ("infected", 403), ("rejected", 403)])
+async def test_preview_routes_refuse_unscanned_and_quarantined_resumes(
+    client, admin_headers, db, route, scan_status, status_code
+):
+    await add_application(db, scan_status)
+
+    response = await client.get(f"/api/admin/applications/app-1/{route}", headers=admin_headers)
+
+    assert response.status_code == status_code
+
+
+async def test_preview_of_a_clean_resume(client, admin_headers, db, monkeypatch):
+    monkeypatch.setattr(previews, "preview_cache", None)
+    await add_application(db, "clean")
+
+    response = await client.get("/api/admin/applications/app-1/preview", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert "Python engineer" in response.json()["snippet"]
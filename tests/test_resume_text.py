@@ -0,0 +1,52 @@
+import io
+import zipfile
+import zlib
+
+from projectp.resume_text import MAX_TEXT_CHARS, extract_file_text, extract_text
+
+
+def docx(document_xml: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", document_xml)
+    return buffer.getvalue()
+
+
+def test_pdf_text():
+    stream = zlib.compress(b"BT (Python \\(FastAPI\\) engineer) Tj ET")
+    pdf = b"%PDF-1.4\nstream\n" + stream + b"\nendstream\n"
+
+    assert extract_text(pdf, ".pdf") == "Python (FastAPI) engineer"
+
+
+def test_docx_text():
+    content = docx("<w:p><w:r><w:t>Data</w:t></w:r></w:p><w:p>engineer</w:p>")
+
+    assert extract_text(content, ".docx") == "Data engineer"
+
+
+def test_unknown_or_corrupt_files_give_no_text():
+    assert extract_text(b"anything", ".txt") == ""
+    assert extract_text(b"PK\x03\x04 not a zip", ".docx") == ""
+
+
+def test_deflate_bomb_is_capped():
+    # 64 MB of text blocks inflating from a few hundred KB
+    bomb = zlib.compress(b"BT (word) Tj ET " * (4 * 1024 * 1024), 9)
+    pdf = b"%PDF-1.4\nstream\n" + bomb + b"\nendstream\n"
+
+    assert len(extract_text(pdf, ".pdf")) <= MAX_TEXT_CHARS
+
+
+def test_zip_bomb_is_capped():
+    content = docx("<w:p>" + "a" * (64 * 1024 * 1024) + "</w:p>")
+
+    assert len(content) < 1024 * 1024
+    assert len(extract_text(content, ".docx")) <= MAX_TEXT_CHARS
+
+
+def test_extract_file_text(tmp_path):
+    path = tmp_path / "cv.docx"
+    path.write_bytes(docx("<w:p>Rust developer</w:p>"))
+
+    assert extract_file_text(str(path), ".docx") == "Rust developer"
@@ -0,0 +1,157 @@
+import asyncio
+import random
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from projectp import settings
+from projectp.routers.admin import require_clean_resume
+from projectp.scanning import EICAR_SIGNATURE
+from projectp.seeding import generate_applications
+from projectp.services import resumes
+from projectp.services.previews import warm_preview
+
+pytestmark = pytest.mark.anyio
+
+PDF = b"%PDF-1.4\nstream\nBT (Python engineer) Tj ET\nendstream\n"
+
+
+async def upload(db, filename, content, scan_status="pending"):
+    resumes.write_resume(filename, content)
+    await db.applications.insert_one({
+        "id": f"app-{filename}", "job_id": "job-1", "resume_path": filename,
+        "resume_text": "", "message": None, "scan_status": scan_status
+    })
+
+
+def queued(task_queue):
+    queue = task_queue.get_task_queue()
+    return [queue.get_nowait()["name"] for _ in range(queue.qsize())]
+
+
+async def status(db, filename):
+    return (await db.applications.find_one({"resume_path": filename}))["scan_status"]
+
+
+async def test_clean_resume_is_released(db, task_queue, resume_dirs):
+    await upload(db, "a.pdf", PDF)
+
+    await resumes.scan_resume({"resume_path": "a.pdf"})
+
+    assert await status(db, "a.pdf") == "clean"
+    assert (settings.UPLOAD_DIR / "a.pdf").is_file()
+    assert not (settings.QUARANTINE_DIR / "a.pdf").exists()
+    assert queued(task_queue) == ["extract_resume_text", "render_preview"]
+
+
+async def test_infected_resume_stays_quarantined(db, task_queue, resume_dirs):
+    await upload(db, "b.pdf", b"%PDF-1.4 " + EICAR_SIGNATURE)
+
+    await resumes.scan_resume({"resume_path": "b.pdf"})
+
+    application = await db.applications.find_one({"resume_path": "b.pdf"})
+    assert application["scan_status"] == "infected"
+    assert application["scan_detail"] == "Eicar-Test-Signature"
+    assert (settings.QUARANTINE_DIR / "b.pdf").is_file()
+    assert not (settings.UPLOAD_DIR / "b.pdf").exists()
+    assert queued(task_queue) == []
+
+
+async def test_wrong_file_type_is_rejected(db, task_queue, resume_dirs):
+    await upload(db, "c.docx", b"MZ\x90\x00 not a document")
+
+    await resumes.scan_resume({"resume_path": "c.docx"})
+
+    assert await status(db, "c.docx") == "rejected"
+    assert (settings.QUARANTINE_DIR / "c.docx").is_file()
+
+
+async def test_missing_file(db, task_queue, resume_dirs):
+    await db.applications.insert_one({"id": "gone", "resume_path": "gone.pdf", "scan_status": "pending"})
+
+    await resumes.scan_resume({"resume_path": "gone.pdf"})
+
+    assert await status(db, "gone.pdf") == "missing"
+
+
+async def test_rescan_of_released_file_is_idempotent(db, task_queue, resume_dirs):
+    await upload(db, "d.pdf", PDF)
+    await resumes.scan_resume({"resume_path": "d.pdf"})
+    await resumes.scan_resume({"resume_path": "d.pdf"})
+
+    assert await status(db, "d.pdf") == "clean"
+    assert (settings.UPLOAD_DIR / "d.pdf").is_file()
+
+
+async def test_text_is_extracted_in_the_worker_pool(db, task_queue, resume_dirs):
+    (settings.UPLOAD_DIR / "e.pdf").write_bytes(PDF)
+    await db.applications.insert_one({"id": "e", "resume_path": "e.pdf", "resume_text": "", "scan_status": "clean"})
+
+    await resumes.extract_resume_text({"application_id": "e", "resume_path": "e.pdf"})
+
+    application = await db.applications.find_one({"id": "e"})
+    assert application["resume_text"] == "Python engineer"
+    assert application["text_updated_at"]
+    assert resumes.worker_pool is not None
+
+
+@pytest.mark.parametrize("scan_status, status_code", [(None, 409), ("pending", 409), ("infected", 403), ("missing", 403)])
+def test_only_clean_resumes_are_served(scan_status, status_code):
+    with pytest.raises(HTTPException) as error:
+        require_clean_resume({"scan_status": scan_status})
+    assert error.value.status_code == status_code
+
+
+def test_clean_resume_is_served():
+    require_clean_resume({"scan_status": "clean"})
+
+
+async def test_preview_is_rendered_for_clean_resume(db, task_queue, resume_dirs):
+    await upload(db, "f.pdf", PDF)
+    await resumes.scan_resume({"resume_path": "f.pdf"})
+
+    await warm_preview({"resume_path": "f.pdf"})
+
+    cached = [path.name for path in settings.PREVIEW_CACHE_DIR.glob("*.json")]
+    assert len(cached) == 1
+
+
+async def test_backfill_queues_only_stored_files(db, task_queue, resume_dirs):
+    resumes.write_resume("old.pdf", PDF)
+    await db.applications.insert_many([
+        {"id": "old", "resume_path": "old.pdf"},
+        {"id": "lost", "resume_path": "lost.pdf"},
+        {"id": "done", "resume_path": "done.pdf", "scan_status": "clean"}
+    ])
+
+    assert await resumes.backfill_resume_scans() == 1
+
+    assert await status(db, "old.pdf") == "pending"
+    assert await status(db, "lost.pdf") == "missing"
+    assert await status(db, "done.pdf") == "clean"
+    assert queued(task_queue) == ["scan_resume"]
+
+
+def test_synthetic_applications_are_not_scanned():
+    applications = generate_applications(3, [], random.Random(1))
+
+    assert {application["scan_status"] for application in applications} == {"missing"}
+
+
+async def test_hung_worker_is_killed_on_timeout(resume_dirs, monkeypatch):
+    assert await resumes.run_in_worker(abs, -1) == 1  # start the pool
+    pool = resumes.worker_pool
+    processes = list(pool._processes.values())
+    monkeypatch.setattr(settings, "SCAN_TIMEOUT_SECONDS", 0.5)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await resumes.run_in_worker(time.sleep, 60)
+
+    assert resumes.worker_pool is None
+    for process in processes:
+        process.join(timeout=5)
+        assert not process.is_alive()
+    # The next call gets a fresh pool
+    monkeypatch.setattr(settings, "SCAN_TIMEOUT_SECONDS", 30)
+    assert await resumes.run_in_worker(abs, -2) == 2
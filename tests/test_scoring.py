@@ -0,0 +1,73 @@
+import pytest
+from fastapi import HTTPException
+
+from projectp import settings
+from projectp.services import coordination, scoring
+
+pytestmark = pytest.mark.anyio
+
+JOB = {"id": "job-1", "title": "Python Engineer", "description": "FastAPI and MongoDB", "tags": ["python"]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(scoring, "match_index", None)
+    monkeypatch.setattr(coordination, "cache_versions", {})
+    monkeypatch.setattr(coordination, "cache_reloaders", {})
+    coordination.register_cache("application_vectors", scoring.reload_application_vectors)
+
+
+async def add_applications(db, *applications):
+    await db.jobs.insert_one(dict(JOB))
+    await db.applications.insert_many([
+        {"job_id": "job-1", "resume_text": "", "message": None, **application} for application in applications
+    ])
+
+
+async def test_scores_pending_resumes_as_zero(db):
+    await add_applications(db, {"id": "a"}, {"id": "b"})
+
+    assert await scoring.score_applications("job-1", ["a", "b"]) == {"a": 0.0, "b": 0.0}
+
+
+async def test_unknown_job(db):
+    with pytest.raises(HTTPException) as error:
+        await scoring.score_applications("missing", [])
+    assert error.value.status_code == 404
+
+
+async def test_text_extracted_by_another_worker_is_picked_up(db):
+    await add_applications(db, {"id": "a"})
+    await coordination.sync_caches(reload=False)
+    assert (await scoring.score_applications("job-1", ["a"]))["a"] == 0.0
+
+    # Another worker extracts the text and bumps the cache version
+    await db.applications.update_one({"id": "a"}, {"$set": {
+        "resume_text": "Senior python engineer with FastAPI",
+        "text_updated_at": "9999-01-01T00:00:00+00:00"
+    }})
+    await db.cache_versions.update_one({"_id": "application_vectors"}, {"$inc": {"version": 1}}, upsert=True)
+    await coordination.sync_caches()
+
+    assert (await scoring.score_applications("job-1", ["a"]))["a"] > 0.0
+
+
+async def test_local_text_change_refreshes_vector(db):
+    await add_applications(db, {"id": "a"})
+    await scoring.score_applications("job-1", ["a"])
+
+    await scoring.application_text_changed({"id": "a", "job_id": "job-1", "resume_text": "python fastapi"})
+
+    assert (await scoring.score_applications("job-1", ["a"]))["a"] > 0.0
+    assert (await db.cache_versions.find_one({"_id": "application_vectors"}))["version"] == 1
+
+
+async def test_application_cache_is_bounded(db, monkeypatch):
+    monkeypatch.setattr(settings, "MATCH_CACHE_MAX_APPLICATIONS", 2)
+    await add_applications(db, {"id": "a", "resume_text": "python"}, {"id": "b"}, {"id": "c"})
+
+    scores = await scoring.score_applications("job-1", ["a", "b", "c"])
+
+    assert set(scores) == {"a", "b", "c"}
+    assert list(scoring.match_index.applications) == ["b", "c"]
+    assert scoring.match_index.n_docs == 3
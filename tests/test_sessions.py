@@ -0,0 +1,89 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from projectp import settings
+from projectp.bloom import BloomFilter
+from projectp.services import auth, coordination, revocation, sessions
+
+pytestmark = pytest.mark.anyio
+
+ADMIN = {"id": "admin-1", "email": "admin@example.com"}
+
+
+@pytest.fixture(autouse=True)
+def session_state(db, monkeypatch):
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "HS256")
+    monkeypatch.setattr(revocation, "revoked_filter", BloomFilter(1024))
+    monkeypatch.setattr(coordination, "cache_versions", {})
+
+
+async def test_refresh_rotates_the_token_and_keeps_the_session(db):
+    first = await sessions.start_session(ADMIN)
+
+    second = await sessions.rotate_session(first["refresh_token"])
+
+    assert second["refresh_token"] != first["refresh_token"]
+    sid = auth.verify_jwt_token(first["token"])["sid"]
+    assert auth.verify_jwt_token(second["token"])["sid"] == sid
+    assert await db.refresh_tokens.find_one({"_id": sessions.hash_refresh_token(first["refresh_token"])}) is not None
+
+
+async def test_reused_refresh_token_revokes_the_session(db, monkeypatch):
+    monkeypatch.setattr(settings, "REFRESH_REUSE_GRACE_SECONDS", 0)
+    first = await sessions.start_session(ADMIN)
+    second = await sessions.rotate_session(first["refresh_token"])
+
+    with pytest.raises(HTTPException) as error:
+        await sessions.rotate_session(first["refresh_token"])
+    assert error.value.status_code == 401
+
+    # The legitimate holder's newer token is gone too
+    with pytest.raises(HTTPException):
+        await sessions.rotate_session(second["refresh_token"])
+    assert await revocation.is_revoked(auth.verify_jwt_token(second["token"])["sid"])
+
+
+async def test_concurrent_refresh_from_another_tab_keeps_the_session(db):
+    """Two tabs send the shared refresh token together: both get tokens"""
+    first = await sessions.start_session(ADMIN)
+
+    tab_a = await sessions.rotate_session(first["refresh_token"])
+    tab_b = await sessions.rotate_session(first["refresh_token"])
+
+    sid = auth.verify_jwt_token(first["token"])["sid"]
+    assert auth.verify_jwt_token(tab_b["token"])["sid"] == sid
+    assert not await revocation.is_revoked(sid)
+    # Both successors keep working
+    await sessions.rotate_session(tab_a["refresh_token"])
+    await sessions.rotate_session(tab_b["refresh_token"])
+
+
+async def test_reuse_after_the_grace_period_revokes_the_session(db):
+    first = await sessions.start_session(ADMIN)
+    await sessions.rotate_session(first["refresh_token"])
+    await db.refresh_tokens.update_one(
+        {"_id": sessions.hash_refresh_token(first["refresh_token"])},
+        {"$set": {"rotated_at": datetime.now(timezone.utc) - timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS + 1)}}
+    )
+
+    with pytest.raises(HTTPException):
+        await sessions.rotate_session(first["refresh_token"])
+    assert await revocation.is_revoked(auth.verify_jwt_token(first["token"])["sid"])
+
+
+async def test_unknown_refresh_token_is_rejected(db):
+    with pytest.raises(HTTPException) as error:
+        await sessions.rotate_session("not-a-token")
+    assert error.value.status_code == 401
+
+
+async def test_logout_revokes_the_session(db):
+    tokens = await sessions.start_session(ADMIN)
+
+    await sessions.end_session(tokens["refresh_token"])
+
+    assert await revocation.is_revoked(auth.verify_jwt_token(tokens["token"])["sid"])
+    with pytest.raises(HTTPException):
+        await sessions.rotate_session(tokens["refresh_token"])
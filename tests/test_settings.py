@@ -0,0 +1,20 @@
+import pytest
+
+from projectp.settings import load_settings
+
+
+def test_production_profile_defaults_to_shared_worker_state():
+    config = load_settings({"APP_ENV": "production", "JWT_SECRET": "s" * 32})
+
+    assert config.WEB_CONCURRENCY == 0
+    assert config.RATE_LIMIT_BACKEND == "mongo"
+    assert config.EVENTS_SOURCE == "change_streams"
+
+
+def test_local_events_rejected_with_several_workers():
+    with pytest.raises(RuntimeError, match="EVENTS_SOURCE must be change_streams"):
+        load_settings({"WEB_CONCURRENCY": "4", "RATE_LIMIT_BACKEND": "mongo", "EVENTS_SOURCE": "local"})
+
+
+def test_local_events_allowed_with_one_worker():
+    assert load_settings({"WEB_CONCURRENCY": "1"}).EVENTS_SOURCE == "local"
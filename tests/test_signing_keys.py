@@ -0,0 +1,102 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from projectp import settings
+from projectp.services import auth, signing_keys
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def key_ring(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setattr(settings, "JWT_SECRET", "first-secret-0123456789")
+    monkeypatch.setattr(signing_keys, "key_ring", [])
+    return signing_keys.key_ring
+
+
+async def store_key(db, active_from, **fields):
+    key = signing_keys.generate_key("EdDSA", active_from)
+    await db.signing_keys.insert_one({**signing_keys.key_document(key), **fields})
+    return key
+
+
+async def test_first_key_signs_at_once_and_is_published(db):
+    await signing_keys.prepare_signing_keys()
+
+    token = auth.create_access_token("admin@example.com", "session-1")
+
+    assert auth.verify_jwt_token(token)["sub"] == "admin@example.com"
+    assert [jwk["kid"] for jwk in signing_keys.jwks()["keys"]] == [signing_keys.current_signing_key().kid]
+
+
+async def test_due_key_is_published_ahead_and_old_keys_retired(db):
+    now = datetime.now(timezone.utc)
+    rotation = timedelta(days=settings.JWT_KEY_ROTATION_DAYS)
+    retired = await store_key(db, now - 2 * rotation)
+    current = await store_key(db, now - rotation)
+
+    assert await signing_keys.rotate_signing_keys()
+    await signing_keys.load_signing_keys()
+
+    kids = [key.kid for key in signing_keys.key_ring]
+    assert retired.kid not in kids
+    assert kids[0] == current.kid
+    assert signing_keys.current_signing_key().kid == current.kid
+    published_ahead = signing_keys.key_ring[-1].active_from - now
+    assert published_ahead >= timedelta(seconds=settings.JWT_KEY_PUBLISH_AHEAD_SECONDS - 5)
+
+
+async def test_changed_secret_mints_a_new_key_and_old_tokens_still_verify(db, monkeypatch):
+    await signing_keys.prepare_signing_keys()
+    old_kid = signing_keys.current_signing_key().kid
+    old_token = auth.create_access_token("admin@example.com", "session-1")
+
+    monkeypatch.setattr(settings, "JWT_SECRET", "second-secret-0123456789")
+    await signing_keys.load_signing_keys()
+    assert signing_keys.current_signing_key() is None
+
+    await signing_keys.prepare_signing_keys()
+
+    assert signing_keys.current_signing_key().kid != old_kid
+    assert auth.verify_jwt_token(old_token)["sid"] == "session-1"
+    new_token = auth.create_access_token("admin@example.com", "session-2")
+    assert auth.verify_jwt_token(new_token)["sid"] == "session-2"
+
+
+async def test_undecryptable_key_without_public_key_is_skipped(db, monkeypatch):
+    legacy = await store_key(db, datetime.now(timezone.utc) - timedelta(days=1))
+    await db.signing_keys.update_one({"_id": legacy.kid}, {"$unset": {"public_key": ""}})
+    monkeypatch.setattr(settings, "JWT_SECRET", "second-secret-0123456789")
+
+    await signing_keys.prepare_signing_keys()
+
+    assert legacy.kid not in [key.kid for key in signing_keys.key_ring]
+    assert signing_keys.current_signing_key() is not None
+
+
+async def test_old_secret_key_published_ahead_does_not_retire_its_replacement(db, monkeypatch):
+    now = datetime.now(timezone.utc)
+    token_lifetime = timedelta(minutes=settings.ACCESS_TOKEN_TTL_MINUTES)
+    # Published by the old secret, then starts signing after the new key
+    await store_key(db, now - token_lifetime - timedelta(minutes=5))
+    monkeypatch.setattr(settings, "JWT_SECRET", "second-secret-0123456789")
+    replacement = await store_key(db, now - 2 * token_lifetime)
+
+    await signing_keys.rotate_signing_keys()
+    await signing_keys.load_signing_keys()
+
+    assert replacement.kid in [key.kid for key in signing_keys.key_ring]
+    assert signing_keys.current_signing_key().kid == replacement.kid
+
+
+async def test_token_from_an_unknown_key_is_rejected(db):
+    await signing_keys.prepare_signing_keys()
+    token = auth.create_access_token("admin@example.com", "session-1")
+    signing_keys.key_ring.clear()
+
+    with pytest.raises(HTTPException) as error:
+        auth.verify_jwt_token(token)
+    assert error.value.status_code == 401
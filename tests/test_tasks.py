@@ -0,0 +1,102 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from projectp import settings
+from projectp.services import health, tasks
+from tests.helpers import wait_for
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def no_handlers(task_queue, monkeypatch):
+    monkeypatch.setattr(tasks, "handlers", {})
+
+
+def test_retry_delay_backs_off_to_the_cap(monkeypatch):
+    monkeypatch.setattr(settings, "TASK_RETRY_BASE_SECONDS", 5)
+    monkeypatch.setattr(settings, "TASK_RETRY_MAX_SECONDS", 600)
+
+    assert [tasks.retry_delay(n) for n in (1, 2, 3)] == [5, 10, 20]
+    assert tasks.retry_delay(20) == 600
+
+
+async def test_enqueue_rejects_unknown_task():
+    with pytest.raises(ValueError):
+        await tasks.enqueue("nope", {})
+
+
+@pytest.mark.parametrize("backend", ["memory", "mongo"])
+async def test_failing_task_is_retried_then_succeeds(db, monkeypatch, backend):
+    monkeypatch.setattr(settings, "TASK_BACKEND", backend)
+    calls = []
+
+    @tasks.task("flaky")
+    async def flaky(payload):
+        calls.append(payload)
+        if len(calls) < 2:
+            raise RuntimeError("try again")
+
+    tasks.start_task_workers()
+    await tasks.enqueue("flaky", {"n": 1})
+    await wait_for(lambda: len(calls) == 2)
+    await tasks.stop_task_workers()
+
+    assert calls == [{"n": 1}, {"n": 1}]
+    assert await db.dead_letters.count_documents({}) == 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "mongo"])
+async def test_task_out_of_attempts_is_dead_lettered(db, monkeypatch, backend):
+    monkeypatch.setattr(settings, "TASK_BACKEND", backend)
+
+    @tasks.task("broken")
+    async def broken(payload):
+        raise RuntimeError("always fails")
+
+    tasks.start_task_workers()
+    await tasks.enqueue("broken", {})
+    await wait_for(lambda: db.dead_letters.count_documents({}))
+    await tasks.stop_task_workers()
+
+    letter = await db.dead_letters.find_one({})
+    assert letter["attempts"] == 3
+    assert letter["error"] == "always fails"
+    assert await db.tasks.count_documents({}) == 0
+
+
+async def test_shared_backlog_does_not_fail_readiness(db, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_BACKEND", "mongo")
+    monkeypatch.setattr(settings, "READY_MAX_TASK_BACKLOG", 10)
+    # Far-future retries from the whole cluster, e.g. a startup backfill
+    now = datetime(2999, 1, 1, tzinfo=timezone.utc)
+    await db.tasks.insert_many([
+        {"_id": str(n), "name": "x", "payload": {}, "status": "queued", "run_at": now, "locked_until": None}
+        for n in range(50)
+    ])
+    tasks.start_task_workers()
+
+    check = await health.check_task_queue()
+    await tasks.stop_task_workers()
+
+    assert check["ok"] is True
+    assert check["depth"] == 50
+
+
+async def test_stuck_task_fails_readiness(db, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_BACKEND", "memory")
+    monkeypatch.setattr(settings, "TASK_LEASE_SECONDS", 1)
+    tasks.start_task_workers()
+    tasks.running_since["t1"] = time.monotonic() - 5
+
+    check = await health.check_task_queue()
+    await tasks.stop_task_workers()
+
+    assert check["stuck"] == 1
+    assert check["ok"] is False
+
+
+async def test_readiness_needs_running_workers(db):
+    assert (await health.check_task_queue())["ok"] is False